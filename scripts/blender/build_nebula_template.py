@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Nebula Template Builder
+One-shot script that saves nebula_template.blend with the datablocks shared by
+generate_nebula_final.py and generate_nebula_slices.py: black world, instanced
+star mesh + material, and the orthographic slice camera. Their cleanup() opens
+this file instead of rebuilding from factory settings.
+
+Run: blender -b --python build_nebula_template.py --python-exit-code 1
+
+Re-run after changing the star or slice-camera setup.
+"""
+import bpy
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from nebula_common import (  # noqa: E402
+    TEMPLATE_BLEND,
+    cleanup,
+    make_star_material,
+    make_star_template,
+)
+from generate_nebula_slices import make_ortho_camera  # noqa: E402
+
+
+def main():
+    try:
+        cleanup(use_template=False)
+
+        mesh = make_star_template()
+        mat = make_star_material()
+        mesh.materials.append(mat)
+        mesh.use_fake_user = True
+        mat.use_fake_user = True
+
+        # Saved unlinked; make_ortho_camera() links it into the scene on use
+        cam = make_ortho_camera()
+        bpy.context.scene.collection.objects.unlink(cam)
+        bpy.context.scene.camera = None
+        cam.use_fake_user = True
+
+        bpy.ops.wm.save_as_mainfile(filepath=TEMPLATE_BLEND, compress=True)
+        print(f"ASSET_INFO: {json.dumps({'status': 'success', 'file': TEMPLATE_BLEND})}")
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        print(json.dumps({"status": "error", "message": str(e)}))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,94 +2,296 @@
 """
 God Gundam - FINAL VERSION
 Massive wings, dramatic pose, production-ready
-Run: blender -b --python god_gundam_final.py --python-exit-code 1 -- output=/tmp
+Run: blender -b --factory-startup --python god_gundam_final.py --python-exit-code 1 -- output=/tmp [merge=0]
 """
 import bpy
 import sys
 import json
+import os
+import struct
 import math
-from mathutils import Vector
+import hashlib
+import tempfile
+import bmesh
+from enum import IntEnum
+from functools import lru_cache
+import numpy as np
+from mathutils import Euler, Vector
 
 OUTPUT_DIR = "/tmp"
 ASSET_NAME = "GodGundam_Final"
-
-COLORS = {
-    'white': (0.92, 0.92, 0.94),
-    'light_gray': (0.75, 0.75, 0.77),
-    'dark_gray': (0.2, 0.2, 0.22),
-    'blue': (0.08, 0.12, 0.55),
-    'dark_blue': (0.04, 0.06, 0.35),
-    'red': (0.85, 0.08, 0.08),
-    'gold': (0.9, 0.7, 0.15),
-    'orange': (0.95, 0.55, 0.1),
-    'green': (0.1, 0.85, 0.35),
-    'black': (0.015, 0.015, 0.015),
-}
+# Merged per-material buffers from the last run, reused while this file is unchanged
+GEOMETRY_CACHE = os.path.join(tempfile.gettempdir(), "god_gundam_final_geometry.npz")
+PREVIEW_SAMPLES = 16  # EEVEE default is 64; plenty for a flat-shaded preview
+
+class Color(IntEnum):
+    WHITE = 0
+    LIGHT_GRAY = 1
+    DARK_GRAY = 2
+    BLUE = 3
+    DARK_BLUE = 4
+    RED = 5
+    GOLD = 6
+    ORANGE = 7
+    GREEN = 8
+    BLACK = 9
+
+# RGB per Color, in enum order
+PALETTE = np.array([
+    (0.92, 0.92, 0.94),     # WHITE
+    (0.75, 0.75, 0.77),     # LIGHT_GRAY
+    (0.2, 0.2, 0.22),       # DARK_GRAY
+    (0.08, 0.12, 0.55),     # BLUE
+    (0.04, 0.06, 0.35),     # DARK_BLUE
+    (0.85, 0.08, 0.08),     # RED
+    (0.9, 0.7, 0.15),       # GOLD
+    (0.95, 0.55, 0.1),      # ORANGE
+    (0.1, 0.85, 0.35),      # GREEN
+    (0.015, 0.015, 0.015),  # BLACK
+], dtype=np.float32)
+
+# (material name, roughness, metallic[, emission strength]) per Color, in enum order
+MATERIALS = [
+    ("White", 0.25, 0.15),
+    ("LightGray", 0.35, 0.25),
+    ("DarkGray", 0.45, 0.35),
+    ("Blue", 0.25, 0.25),
+    ("DarkBlue", 0.35, 0.25),
+    ("Red", 0.25, 0.15),
+    ("Gold", 0.15, 0.85),
+    ("Orange", 0.25, 0.15, 0.8),
+    ("Green", 0.08, 0.05, 3.0),
+    ("Black", 0.55, 0.3),
+]
+MATERIAL_INDEX = {name: c for c, (name, *_) in zip(Color, MATERIALS)}  # For the glTF writer
+
+# Unit cube around the origin and its quads, wound outward
+CUBE_VERTS = np.array([
+    (-0.5, -0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, 0.5, -0.5), (-0.5, 0.5, 0.5),
+    (0.5, -0.5, -0.5), (0.5, -0.5, 0.5), (0.5, 0.5, -0.5), (0.5, 0.5, 0.5),
+], dtype=np.float32)
+CUBE_FACES = [
+    (0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1),
+    (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3),
+]
+CYL_VERTS = 32  # primitive_cylinder_add default
+
+WORLD_COLOR = (0.004, 0.004, 0.007)  # (0.02, 0.02, 0.035) at strength 0.2
+# Studio lights baked into the world: (direction from the model, color,
+# irradiance, lobe width in degrees), matching the old Key / Fill / Rim areas
+STUDIO_LIGHTS = (
+    ((7, -8, 9), (1.0, 0.95, 0.9), 3.3, 15),
+    ((-7, -6, 7), (0.85, 0.9, 1.0), 1.6, 22),
+    ((0, 8, 8), (1.0, 1.0, 1.0), 3.0, 10),
+)
+STUDIO_HDR_SIZE = (512, 256)  # Equirectangular width, height
+# Cached map's name hashes everything baked into it
+STUDIO_HDR = os.path.join(
+    tempfile.gettempdir(),
+    f"studio_{hashlib.sha1(repr((STUDIO_LIGHTS, WORLD_COLOR, STUDIO_HDR_SIZE)).encode()).hexdigest()[:8]}.exr",
+)
+
+# (kind, shape params, material) -> mesh shared by every identical part, e.g.
+# mirrored L/R pieces; glTF keeps the material on the mesh, so it is in the key
+MESH_CACHE = {}
 
 def cleanup():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    # Remove the startup scene's datablocks instead of reloading factory
+    # settings; everything render() and setup_scene() rely on is set explicitly
+    for coll in (bpy.data.objects, bpy.data.meshes, bpy.data.materials,
+                 bpy.data.lights, bpy.data.cameras, bpy.data.worlds):
+        for d in list(coll):
+            coll.remove(d, do_unlink=True)
+    MESH_CACHE.clear()
+
+# Principled BSDF socket name -> index, resolved on the first material so the
+# rest index the input collection directly instead of searching it by name
+BSDF_INPUTS = {}
 
 def mat(name, color, rough=0.4, metal=0.3, emit=0.0):
     m = bpy.data.materials.new(name)
     m.use_nodes = True
     b = m.node_tree.nodes.get("Principled BSDF")
-    b.inputs["Base Color"].default_value = (*color, 1.0)
-    b.inputs["Roughness"].default_value = rough
-    b.inputs["Metallic"].default_value = metal
+    if not BSDF_INPUTS:
+        for key in ("Base Color", "Roughness", "Metallic", "Emission Color", "Emission Strength"):
+            BSDF_INPUTS[key] = b.inputs.find(key)
+    inputs = b.inputs
+    inputs[BSDF_INPUTS["Base Color"]].default_value = (*color, 1.0)
+    inputs[BSDF_INPUTS["Roughness"]].default_value = rough
+    inputs[BSDF_INPUTS["Metallic"]].default_value = metal
     if emit > 0:
-        b.inputs["Emission Color"].default_value = (*color, 1.0)
-        b.inputs["Emission Strength"].default_value = emit
+        inputs[BSDF_INPUTS["Emission Color"]].default_value = (*color, 1.0)
+        inputs[BSDF_INPUTS["Emission Strength"]].default_value = emit
     return m
 
 def setup_mats():
-    return {
-        'white': mat("White", COLORS['white'], 0.25, 0.15),
-        'light_gray': mat("LightGray", COLORS['light_gray'], 0.35, 0.25),
-        'dark_gray': mat("DarkGray", COLORS['dark_gray'], 0.45, 0.35),
-        'blue': mat("Blue", COLORS['blue'], 0.25, 0.25),
-        'dark_blue': mat("DarkBlue", COLORS['dark_blue'], 0.35, 0.25),
-        'red': mat("Red", COLORS['red'], 0.25, 0.15),
-        'gold': mat("Gold", COLORS['gold'], 0.15, 0.85),
-        'orange': mat("Orange", COLORS['orange'], 0.25, 0.15, 0.8),
-        'green': mat("Green", COLORS['green'], 0.08, 0.05, 3.0),
-        'black': mat("Black", COLORS['black'], 0.55, 0.3),
-    }
+    # List indexed by Color
+    return [mat(name, PALETTE[c], *shading) for c, (name, *shading) in zip(Color, MATERIALS)]
+
+def fill_mesh(mesh, co, sizes, indices, m):
+    # Straight into the mesh buffers: primitive_*_add and transform_apply
+    # each re-evaluate the whole scene. sizes = corners per face, indices =
+    # every face's vertex indices back to back
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(co, dtype=np.float32).ravel())
+    mesh.loops.add(len(indices))
+    mesh.polygons.add(len(sizes))
+    mesh.polygons.foreach_set("loop_start", np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int32))
+    mesh.loops.foreach_set("vertex_index", np.asarray(indices, dtype=np.int32))
+    mesh.update()
+    mesh.materials.append(m)
+    return mesh
+
+def new_mesh(name, co, faces, m):
+    return fill_mesh(bpy.data.meshes.new(name), co, [len(f) for f in faces], [v for f in faces for v in f], m)
+
+def shape_key(kind, m, *params):
+    return (kind, *(round(p, 4) for p in params), m.name)
+
+def part(name, mesh, loc):
+    o = bpy.data.objects.new(name, mesh)
+    o.location = loc
+    bpy.context.scene.collection.objects.link(o)
+    return o
 
-def apply_mat(obj, m):
-    if obj.data.materials:
-        obj.data.materials[0] = m
-    else:
-        obj.data.materials.append(m)
+@lru_cache(maxsize=None)
+def frustum(verts, r1, r2, h):
+    # Capped cone/cylinder along Z, laid out as primitive_cone_add does.
+    # Cached: parts that share a shape but not a material or tilt reuse it
+    phi = np.arange(verts) * (2 * math.pi / verts)
+    ring = np.stack([-np.sin(phi), np.cos(phi)], axis=1)
+    co = np.concatenate([
+        np.column_stack([ring * r1, np.full(verts, -h / 2)]),
+        np.column_stack([ring * r2, np.full(verts, h / 2)]),
+    ])
+    faces = [(i, (i + 1) % verts, verts + (i + 1) % verts, verts + i) for i in range(verts)]
+    faces.append(tuple(range(verts - 1, -1, -1)))
+    faces.append(tuple(range(verts, 2 * verts)))
+    co.setflags(write=False)
+    return co, tuple(faces)
+
+def rotation_matrix(rotation):
+    return np.array(Euler(rotation).to_matrix(), dtype=np.float32)
+
+# cyl() axis -> rotation taking the Z-aligned cylinder onto that axis
+AXIS_ROTATIONS = {
+    'X': rotation_matrix((0, math.radians(90), 0)),
+    'Y': rotation_matrix((math.radians(90), 0, 0)),
+}
 
 def box(name, loc, dims, m):
-    bpy.ops.mesh.primitive_cube_add(size=1, location=loc)
-    o = bpy.context.active_object
-    o.name = name
-    o.dimensions = dims
-    bpy.ops.object.transform_apply(scale=True)
-    apply_mat(o, m)
-    return o
+    key = shape_key("box", m, *dims)
+    if key not in MESH_CACHE:
+        MESH_CACHE[key] = new_mesh(name, CUBE_VERTS * np.asarray(dims, dtype=np.float32), CUBE_FACES, m)
+    return part(name, MESH_CACHE[key], loc)
 
 def cyl(name, loc, r, h, m, axis='Z'):
-    bpy.ops.mesh.primitive_cylinder_add(radius=r, depth=h, location=loc)
-    o = bpy.context.active_object
-    o.name = name
-    if axis == 'X':
-        o.rotation_euler = (0, math.radians(90), 0)
-    elif axis == 'Y':
-        o.rotation_euler = (math.radians(90), 0, 0)
-    bpy.ops.object.transform_apply(rotation=True)
-    apply_mat(o, m)
-    return o
+    key = shape_key(f"cyl{axis}", m, r, h)
+    if key not in MESH_CACHE:
+        co, faces = frustum(CYL_VERTS, r, r, h)
+        if axis in AXIS_ROTATIONS:
+            co = co @ AXIS_ROTATIONS[axis].T
+        MESH_CACHE[key] = new_mesh(name, co, faces, m)
+    return part(name, MESH_CACHE[key], loc)
 
 def spike(name, loc, r1, r2, h, m, tilt_x=0, tilt_y=0, verts=8):
-    bpy.ops.mesh.primitive_cone_add(vertices=verts, radius1=r1, radius2=r2, depth=h, location=loc)
-    o = bpy.context.active_object
-    o.name = name
-    o.rotation_euler = (math.radians(tilt_x), math.radians(tilt_y), 0)
-    bpy.ops.object.transform_apply(rotation=True)
-    apply_mat(o, m)
-    return o
+    key = shape_key("spike", m, verts, r1, r2, h, tilt_x, tilt_y)
+    if key not in MESH_CACHE:
+        co, faces = frustum(verts, r1, r2, h)
+        co = co @ rotation_matrix((math.radians(tilt_x), math.radians(tilt_y), 0)).T
+        MESH_CACHE[key] = new_mesh(name, co, faces, m)
+    return part(name, MESH_CACHE[key], loc)
+
+def ball(name, loc, r, m):
+    key = shape_key("ball", m, r)
+    if key not in MESH_CACHE:
+        mesh = bpy.data.meshes.new(name)
+        bm = bmesh.new()
+        bmesh.ops.create_uvsphere(bm, u_segments=32, v_segments=16, radius=r)
+        bm.to_mesh(mesh)
+        bm.free()
+        mesh.materials.append(m)
+        MESH_CACHE[key] = mesh
+    return part(name, MESH_CACHE[key], loc)
+
+def mirrored(specs):
+    # (make, name, loc, *args) parts on both sides; loc is the right (+X) one
+    locs = np.array([spec[2] for spec in specs])
+    parts = []
+    for s, sx in [('L', -1), ('R', 1)]:
+        for (make, name, _, *args), loc in zip(specs, locs * (sx, 1, 1)):
+            parts.append(make(f"{name}{s}", tuple(loc.tolist()), *args))
+    return parts
+
+def mesh_arrays(mesh):
+    # fill_mesh() in reverse: (co, sizes, indices)
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    sizes = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", sizes)
+    indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", indices)
+    return co.reshape(-1, 3), sizes, indices
+
+def merged_geometry(parts):
+    # {material: (co, sizes, indices)}: every part with that material, its
+    # vertices moved by its location and face indices offset past the
+    # previous parts', so ~150 parts become ~10 meshes / glTF draw calls
+    groups = {}
+    for o in parts:
+        groups.setdefault(o.data.materials[0], []).append(o)
+
+    geometry = {}
+    for m, objs in groups.items():
+        cos, sizes, indices = [], [], []
+        offset = 0
+        for o in objs:
+            co, size, index = mesh_arrays(o.data)
+            cos.append(co + np.asarray(o.location, dtype=np.float32))
+            sizes.append(size)
+            indices.append(index + offset)
+            offset += len(co)
+        geometry[m] = (np.concatenate(cos), np.concatenate(sizes), np.concatenate(indices))
+    return geometry
+
+def remove_parts(parts):
+    meshes = {o.data for o in parts}
+    for o in parts:
+        bpy.data.objects.remove(o)
+    for mesh in meshes:
+        bpy.data.meshes.remove(mesh)
+    MESH_CACHE.clear()
+
+def material_objects(geometry):
+    return [part(m.name, fill_mesh(bpy.data.meshes.new(m.name), *arrays, m), (0, 0, 0))
+            for m, arrays in geometry.items()]
+
+def source_key():
+    with open(__file__, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def load_geometry(mats):
+    # (geometry, part count) saved by an earlier run of this exact script, or None
+    try:
+        data = np.load(GEOMETRY_CACHE)
+    except (OSError, ValueError):
+        return None
+    with data:
+        if str(data["key"]) != source_key():
+            return None
+        geometry = {
+            mats[c]: (data[f"co{c}"], data[f"sizes{c}"], data[f"indices{c}"])
+            for c in data["colors"]
+        }
+        return geometry, int(data["parts"])
+
+def save_geometry(mats, geometry, part_count):
+    arrays = {}
+    for m, (co, sizes, indices) in geometry.items():
+        c = mats.index(m)
+        arrays[f"co{c}"], arrays[f"sizes{c}"], arrays[f"indices{c}"] = co, sizes, indices
+    colors = np.array([mats.index(m) for m in geometry], dtype=np.int32)
+    np.savez(GEOMETRY_CACHE, key=source_key(), colors=colors, parts=part_count, **arrays)
 
 def build(mats):
     parts = []
@@ -103,98 +305,98 @@ def build(mats):
     back_z = torso_z
 
     # =================== TORSO ===================
-    parts.append(box("Chest", (0, 0, torso_z), (0.5, 0.34, 0.4), mats['blue']))
-    parts.append(box("Collar", (0, -0.02, torso_z + 0.22), (0.44, 0.18, 0.16), mats['white']))
-    parts.append(box("Cockpit", (0, -0.17, torso_z + 0.08), (0.18, 0.06, 0.22), mats['red']))
+    parts.append(box("Chest", (0, 0, torso_z), (0.5, 0.34, 0.4), mats[Color.BLUE]))
+    parts.append(box("Collar", (0, -0.02, torso_z + 0.22), (0.44, 0.18, 0.16), mats[Color.WHITE]))
+    parts.append(box("Cockpit", (0, -0.17, torso_z + 0.08), (0.18, 0.06, 0.22), mats[Color.RED]))
 
-    for s, x in [('L', -0.15), ('R', 0.15)]:
-        parts.append(box(f"Vent{s}", (x, -0.17, torso_z + 0.12), (0.11, 0.06, 0.18), mats['orange']))
-        parts.append(box(f"VentTrim{s}", (x, -0.19, torso_z + 0.12), (0.09, 0.018, 0.14), mats['gold']))
+    parts += mirrored([
+        (box, "Vent", (0.15, -0.17, torso_z + 0.12), (0.11, 0.06, 0.18), mats[Color.ORANGE]),
+        (box, "VentTrim", (0.15, -0.19, torso_z + 0.12), (0.09, 0.018, 0.14), mats[Color.GOLD]),
+    ])
 
-    parts.append(box("ChestGem", (0, -0.18, torso_z + 0.18), (0.1, 0.03, 0.1), mats['green']))
-    parts.append(box("Waist", (0, 0, torso_z - 0.28), (0.34, 0.26, 0.18), mats['dark_gray']))
-    parts.append(box("Abdomen", (0, -0.1, torso_z - 0.14), (0.22, 0.08, 0.18), mats['red']))
-    parts.append(cyl("Neck", (0, 0, torso_z + 0.32), 0.08, 0.14, mats['dark_gray']))
+    parts.append(box("ChestGem", (0, -0.18, torso_z + 0.18), (0.1, 0.03, 0.1), mats[Color.GREEN]))
+    parts.append(box("Waist", (0, 0, torso_z - 0.28), (0.34, 0.26, 0.18), mats[Color.DARK_GRAY]))
+    parts.append(box("Abdomen", (0, -0.1, torso_z - 0.14), (0.22, 0.08, 0.18), mats[Color.RED]))
+    parts.append(cyl("Neck", (0, 0, torso_z + 0.32), 0.08, 0.14, mats[Color.DARK_GRAY]))
 
     # =================== HEAD ===================
-    parts.append(box("Helmet", (0, 0, head_z), (0.34, 0.32, 0.26), mats['white']))
-    parts.append(box("Face", (0, -0.14, head_z - 0.02), (0.24, 0.08, 0.18), mats['blue']))
-    parts.append(box("Visor", (0, -0.17, head_z + 0.02), (0.22, 0.03, 0.07), mats['green']))
-    parts.append(box("Chin", (0, -0.15, head_z - 0.1), (0.16, 0.05, 0.07), mats['red']))
+    parts.append(box("Helmet", (0, 0, head_z), (0.34, 0.32, 0.26), mats[Color.WHITE]))
+    parts.append(box("Face", (0, -0.14, head_z - 0.02), (0.24, 0.08, 0.18), mats[Color.BLUE]))
+    parts.append(box("Visor", (0, -0.17, head_z + 0.02), (0.22, 0.03, 0.07), mats[Color.GREEN]))
+    parts.append(box("Chin", (0, -0.15, head_z - 0.1), (0.16, 0.05, 0.07), mats[Color.RED]))
 
     # V-Fin - BIG AND DRAMATIC
-    parts.append(spike("VFinC", (0, -0.07, head_z + 0.32), 0.04, 0.007, 0.4, mats['gold'], -22, 0))
-    parts.append(spike("VFinL", (-0.18, -0.05, head_z + 0.28), 0.032, 0.006, 0.45, mats['gold'], -40, -50))
-    parts.append(spike("VFinR", (0.18, -0.05, head_z + 0.28), 0.032, 0.006, 0.45, mats['gold'], -40, 50))
+    parts.append(spike("VFinC", (0, -0.07, head_z + 0.32), 0.04, 0.007, 0.4, mats[Color.GOLD], -22, 0))
+    parts.append(spike("VFinL", (-0.18, -0.05, head_z + 0.28), 0.032, 0.006, 0.45, mats[Color.GOLD], -40, -50))
+    parts.append(spike("VFinR", (0.18, -0.05, head_z + 0.28), 0.032, 0.006, 0.45, mats[Color.GOLD], -40, 50))
 
-    parts.append(box("Crest", (0, 0.04, head_z + 0.16), (0.03, 0.16, 0.12), mats['white']))
+    parts.append(box("Crest", (0, 0.04, head_z + 0.16), (0.03, 0.16, 0.12), mats[Color.WHITE]))
 
     # Side head vents
-    for s, x in [('L', -0.15), ('R', 0.15)]:
-        parts.append(box(f"HeadVent{s}", (x, 0, head_z), (0.05, 0.18, 0.12), mats['light_gray']))
+    parts += mirrored([
+        (box, "HeadVent", (0.15, 0, head_z), (0.05, 0.18, 0.12), mats[Color.LIGHT_GRAY]),
+    ])
 
     # =================== SHOULDERS - MASSIVE ===================
-    for s, sx in [('L', -1), ('R', 1)]:
-        x = sx * 0.36
-        parts.append(box(f"ShJoint{s}", (x, 0, shoulder_z), (0.18, 0.2, 0.2), mats['dark_gray']))
-        ax = x + sx * 0.18
-        parts.append(box(f"ShArmor{s}", (ax, 0, shoulder_z + 0.14), (0.36, 0.5, 0.4), mats['white']))
-        parts.append(box(f"ShRedTop{s}", (ax + sx * 0.02, 0, shoulder_z + 0.34), (0.3, 0.48, 0.06), mats['red']))
-        parts.append(box(f"ShRedFront{s}", (ax, -0.23, shoulder_z + 0.14), (0.3, 0.06, 0.32), mats['red']))
-        parts.append(box(f"ShVents{s}", (x, 0, shoulder_z - 0.14), (0.16, 0.28, 0.12), mats['black']))
-        parts.append(box(f"ShGold{s}", (ax - sx * 0.12, -0.16, shoulder_z + 0.08), (0.06, 0.16, 0.14), mats['gold']))
+    x = 0.36
+    ax = x + 0.18
+    parts += mirrored([
+        (box, "ShJoint", (x, 0, shoulder_z), (0.18, 0.2, 0.2), mats[Color.DARK_GRAY]),
+        (box, "ShArmor", (ax, 0, shoulder_z + 0.14), (0.36, 0.5, 0.4), mats[Color.WHITE]),
+        (box, "ShRedTop", (ax + 0.02, 0, shoulder_z + 0.34), (0.3, 0.48, 0.06), mats[Color.RED]),
+        (box, "ShRedFront", (ax, -0.23, shoulder_z + 0.14), (0.3, 0.06, 0.32), mats[Color.RED]),
+        (box, "ShVents", (x, 0, shoulder_z - 0.14), (0.16, 0.28, 0.12), mats[Color.BLACK]),
+        (box, "ShGold", (ax - 0.12, -0.16, shoulder_z + 0.08), (0.06, 0.16, 0.14), mats[Color.GOLD]),
+    ])
 
     # =================== ARMS ===================
-    for s, sx in [('L', -1), ('R', 1)]:
-        x = sx * 0.52
-        parts.append(box(f"UpArm{s}", (x, 0, arm_z), (0.18, 0.2, 0.32), mats['blue']))
-        parts.append(box(f"UpArmArmor{s}", (x + sx * 0.07, -0.06, arm_z), (0.08, 0.16, 0.26), mats['white']))
-        parts.append(cyl(f"Elbow{s}", (x, 0, arm_z - 0.22), 0.09, 0.14, mats['dark_gray'], 'X'))
-        parts.append(box(f"Forearm{s}", (x, 0, arm_z - 0.48), (0.17, 0.19, 0.34), mats['white']))
-        parts.append(box(f"ForeArmor{s}", (x + sx * 0.09, -0.03, arm_z - 0.46), (0.08, 0.16, 0.28), mats['white']))
-        parts.append(box(f"ForeGold{s}", (x, -0.11, arm_z - 0.42), (0.12, 0.03, 0.16), mats['gold']))
-        parts.append(box(f"Hand{s}", (x, -0.03, arm_z - 0.7), (0.14, 0.16, 0.16), mats['dark_gray']))
+    x = 0.52
+    parts += mirrored([
+        (box, "UpArm", (x, 0, arm_z), (0.18, 0.2, 0.32), mats[Color.BLUE]),
+        (box, "UpArmArmor", (x + 0.07, -0.06, arm_z), (0.08, 0.16, 0.26), mats[Color.WHITE]),
+        (cyl, "Elbow", (x, 0, arm_z - 0.22), 0.09, 0.14, mats[Color.DARK_GRAY], 'X'),
+        (box, "Forearm", (x, 0, arm_z - 0.48), (0.17, 0.19, 0.34), mats[Color.WHITE]),
+        (box, "ForeArmor", (x + 0.09, -0.03, arm_z - 0.46), (0.08, 0.16, 0.28), mats[Color.WHITE]),
+        (box, "ForeGold", (x, -0.11, arm_z - 0.42), (0.12, 0.03, 0.16), mats[Color.GOLD]),
+        (box, "Hand", (x, -0.03, arm_z - 0.7), (0.14, 0.16, 0.16), mats[Color.DARK_GRAY]),
+    ])
 
     # =================== SKIRT ===================
-    parts.append(box("SkFC", (0, -0.16, skirt_z), (0.18, 0.06, 0.26), mats['white']))
-    parts.append(box("SkFCBlue", (0, -0.18, skirt_z - 0.06), (0.14, 0.03, 0.16), mats['blue']))
+    parts.append(box("SkFC", (0, -0.16, skirt_z), (0.18, 0.06, 0.26), mats[Color.WHITE]))
+    parts.append(box("SkFCBlue", (0, -0.18, skirt_z - 0.06), (0.14, 0.03, 0.16), mats[Color.BLUE]))
 
-    for s, sx in [('L', -1), ('R', 1)]:
-        parts.append(box(f"SkFS{s}", (sx * 0.14, -0.14, skirt_z), (0.16, 0.06, 0.28), mats['white']))
-        parts.append(box(f"SkFSBlue{s}", (sx * 0.14, -0.16, skirt_z - 0.07), (0.12, 0.03, 0.16), mats['blue']))
-        parts.append(box(f"SkSide{s}", (sx * 0.26, 0, skirt_z - 0.03), (0.12, 0.26, 0.38), mats['white']))
-        parts.append(box(f"SkSideBlue{s}", (sx * 0.28, 0, skirt_z - 0.07), (0.06, 0.2, 0.24), mats['blue']))
+    parts += mirrored([
+        (box, "SkFS", (0.14, -0.14, skirt_z), (0.16, 0.06, 0.28), mats[Color.WHITE]),
+        (box, "SkFSBlue", (0.14, -0.16, skirt_z - 0.07), (0.12, 0.03, 0.16), mats[Color.BLUE]),
+        (box, "SkSide", (0.26, 0, skirt_z - 0.03), (0.12, 0.26, 0.38), mats[Color.WHITE]),
+        (box, "SkSideBlue", (0.28, 0, skirt_z - 0.07), (0.06, 0.2, 0.24), mats[Color.BLUE]),
+    ])
 
-    parts.append(box("SkRear", (0, 0.14, skirt_z - 0.03), (0.3, 0.07, 0.34), mats['white']))
+    parts.append(box("SkRear", (0, 0.14, skirt_z - 0.03), (0.3, 0.07, 0.34), mats[Color.WHITE]))
 
     # =================== LEGS ===================
-    for s, sx in [('L', -1), ('R', 1)]:
-        x = sx * 0.16
-
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.1, location=(x, 0, leg_z + 0.06))
-        hip = bpy.context.active_object
-        hip.name = f"Hip{s}"
-        apply_mat(hip, mats['dark_gray'])
-        parts.append(hip)
-
-        parts.append(box(f"Thigh{s}", (x, 0, leg_z - 0.22), (0.2, 0.24, 0.42), mats['white']))
-        parts.append(box(f"ThArmor{s}", (x + sx * 0.11, -0.06, leg_z - 0.2), (0.08, 0.18, 0.32), mats['light_gray']))
-        parts.append(box(f"Knee{s}", (x, -0.08, leg_z - 0.48), (0.18, 0.2, 0.2), mats['blue']))
-        parts.append(box(f"KneeCap{s}", (x, -0.16, leg_z - 0.48), (0.14, 0.06, 0.16), mats['dark_blue']))
-        parts.append(box(f"Shin{s}", (x, 0, leg_z - 0.8), (0.19, 0.22, 0.46), mats['white']))
-        parts.append(box(f"ShinArmor{s}", (x, -0.13, leg_z - 0.78), (0.15, 0.06, 0.38), mats['blue']))
-        parts.append(box(f"Calf{s}", (x, 0.13, leg_z - 0.76), (0.16, 0.1, 0.34), mats['light_gray']))
-        parts.append(cyl(f"Ankle{s}", (x, 0, leg_z - 1.06), 0.08, 0.12, mats['dark_gray']))
-        parts.append(box(f"AnkleGuard{s}", (x, 0, leg_z - 1.08), (0.2, 0.22, 0.07), mats['white']))
-        parts.append(box(f"Foot{s}", (x, -0.08, leg_z - 1.16), (0.18, 0.34, 0.14), mats['white']))
-        parts.append(box(f"Toe{s}", (x, -0.22, leg_z - 1.16), (0.16, 0.14, 0.12), mats['red']))
-        parts.append(box(f"Heel{s}", (x, 0.12, leg_z - 1.16), (0.16, 0.14, 0.12), mats['white']))
+    x = 0.16
+    parts += mirrored([
+        (ball, "Hip", (x, 0, leg_z + 0.06), 0.1, mats[Color.DARK_GRAY]),
+        (box, "Thigh", (x, 0, leg_z - 0.22), (0.2, 0.24, 0.42), mats[Color.WHITE]),
+        (box, "ThArmor", (x + 0.11, -0.06, leg_z - 0.2), (0.08, 0.18, 0.32), mats[Color.LIGHT_GRAY]),
+        (box, "Knee", (x, -0.08, leg_z - 0.48), (0.18, 0.2, 0.2), mats[Color.BLUE]),
+        (box, "KneeCap", (x, -0.16, leg_z - 0.48), (0.14, 0.06, 0.16), mats[Color.DARK_BLUE]),
+        (box, "Shin", (x, 0, leg_z - 0.8), (0.19, 0.22, 0.46), mats[Color.WHITE]),
+        (box, "ShinArmor", (x, -0.13, leg_z - 0.78), (0.15, 0.06, 0.38), mats[Color.BLUE]),
+        (box, "Calf", (x, 0.13, leg_z - 0.76), (0.16, 0.1, 0.34), mats[Color.LIGHT_GRAY]),
+        (cyl, "Ankle", (x, 0, leg_z - 1.06), 0.08, 0.12, mats[Color.DARK_GRAY]),
+        (box, "AnkleGuard", (x, 0, leg_z - 1.08), (0.2, 0.22, 0.07), mats[Color.WHITE]),
+        (box, "Foot", (x, -0.08, leg_z - 1.16), (0.18, 0.34, 0.14), mats[Color.WHITE]),
+        (box, "Toe", (x, -0.22, leg_z - 1.16), (0.16, 0.14, 0.12), mats[Color.RED]),
+        (box, "Heel", (x, 0.12, leg_z - 1.16), (0.16, 0.14, 0.12), mats[Color.WHITE]),
+    ])
 
     # =================== BACKPACK ===================
-    parts.append(box("Backpack", (0, 0.2, back_z), (0.4, 0.18, 0.38), mats['white']))
-    parts.append(cyl("ThrL", (-0.14, 0.28, back_z - 0.12), 0.08, 0.14, mats['dark_gray'], 'Y'))
-    parts.append(cyl("ThrR", (0.14, 0.28, back_z - 0.12), 0.08, 0.14, mats['dark_gray'], 'Y'))
-    parts.append(box("Spine", (0, 0.26, back_z + 0.12), (0.14, 0.12, 0.32), mats['dark_gray']))
+    parts.append(box("Backpack", (0, 0.2, back_z), (0.4, 0.18, 0.38), mats[Color.WHITE]))
+    parts.append(cyl("ThrL", (-0.14, 0.28, back_z - 0.12), 0.08, 0.14, mats[Color.DARK_GRAY], 'Y'))
+    parts.append(cyl("ThrR", (0.14, 0.28, back_z - 0.12), 0.08, 0.14, mats[Color.DARK_GRAY], 'Y'))
+    parts.append(box("Spine", (0, 0.26, back_z + 0.12), (0.14, 0.12, 0.32), mats[Color.DARK_GRAY]))
 
     # =================== WING BINDERS - HUGE! ===================
     # 4 wings spreading dramatically outward
@@ -213,65 +415,86 @@ def build(mats):
         mount_z = back_z + z_off
 
         # Wing mount
-        parts.append(box(f"{name}Mount", (mount_x + sx * 0.08, mount_y + 0.08, mount_z), (0.12, 0.16, 0.12), mats['dark_gray']))
+        parts.append(box(f"{name}Mount", (mount_x + sx * 0.08, mount_y + 0.08, mount_z), (0.12, 0.16, 0.12), mats[Color.DARK_GRAY]))
 
         # Connection arm
         arm_x = mount_x + sx * spread_x * 0.4
         arm_y = mount_y + spread_y * 0.4
         arm_z = mount_z + spread_z * 0.4
-        parts.append(box(f"{name}Arm", (arm_x, arm_y, arm_z), (0.05, 0.5, 0.08), mats['light_gray']))
+        parts.append(box(f"{name}Arm", (arm_x, arm_y, arm_z), (0.05, 0.5, 0.08), mats[Color.LIGHT_GRAY]))
 
         # Main blade - HUGE
         blade_x = mount_x + sx * spread_x
         blade_y = mount_y + spread_y
         blade_z = mount_z + spread_z
 
-        parts.append(box(f"{name}Blade", (blade_x, blade_y, blade_z), (0.1, blade_len, 0.26), mats['white']))
+        parts.append(box(f"{name}Blade", (blade_x, blade_y, blade_z), (0.1, blade_len, 0.26), mats[Color.WHITE]))
 
         # Red section - inner edge
-        parts.append(box(f"{name}Red", (blade_x + sx * 0.03, blade_y - 0.2, blade_z), (0.07, blade_len * 0.45, 0.16), mats['red']))
+        parts.append(box(f"{name}Red", (blade_x + sx * 0.03, blade_y - 0.2, blade_z), (0.07, blade_len * 0.45, 0.16), mats[Color.RED]))
 
         # Tip detail
-        parts.append(box(f"{name}Tip", (blade_x, blade_y + blade_len * 0.42, blade_z), (0.06, 0.2, 0.12), mats['light_gray']))
+        parts.append(box(f"{name}Tip", (blade_x, blade_y + blade_len * 0.42, blade_z), (0.06, 0.2, 0.12), mats[Color.LIGHT_GRAY]))
 
         # White edge detail
-        parts.append(box(f"{name}Edge", (blade_x - sx * 0.03, blade_y + 0.1, blade_z), (0.04, blade_len * 0.6, 0.08), mats['white']))
+        parts.append(box(f"{name}Edge", (blade_x - sx * 0.03, blade_y + 0.1, blade_z), (0.04, blade_len * 0.6, 0.08), mats[Color.WHITE]))
 
     return parts
 
+def studio_pixels(width, height):
+    # Equirectangular RGBA, rows bottom-up, laid out as the Environment
+    # Texture node samples it: a soft Gaussian lobe per light over the
+    # backdrop color
+    lon = (0.5 - (np.arange(width) + 0.5) / width) * 2 * math.pi
+    lat = ((np.arange(height) + 0.5) / height - 0.5) * math.pi
+    lon, lat = np.meshgrid(lon, lat)
+    dirs = np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1)
+
+    rgb = np.broadcast_to(np.array(WORLD_COLOR, dtype=np.float32), dirs.shape).copy()
+    for location, color, irradiance, width_deg in STUDIO_LIGHTS:
+        to_light = np.asarray(location, dtype=np.float32) / np.linalg.norm(location)
+        angle = np.arccos(np.clip(dirs @ to_light, -1, 1))
+        sigma = math.radians(width_deg)
+        # Peak radiance such that the lobe delivers `irradiance` head-on
+        peak = irradiance / (2 * math.pi * sigma * sigma)
+        rgb += np.exp(-0.5 * (angle / sigma) ** 2)[..., None] * (peak * np.asarray(color, dtype=np.float32))
+    return np.concatenate([rgb, np.ones((height, width, 1), dtype=np.float32)], axis=-1)
+
+def studio_hdr():
+    # Written once per STUDIO_LIGHTS / WORLD_COLOR / STUDIO_HDR_SIZE setting, then just loaded
+    if os.path.exists(STUDIO_HDR):
+        return bpy.data.images.load(STUDIO_HDR, check_existing=True)
+    pixels = studio_pixels(*STUDIO_HDR_SIZE)
+    img = bpy.data.images.new("Studio", pixels.shape[1], pixels.shape[0], float_buffer=True)
+    img.pixels.foreach_set(pixels.ravel())
+    img.filepath_raw = STUDIO_HDR
+    img.file_format = 'OPEN_EXR'
+    img.save()
+    return img
+
 def setup_scene():
     scene = bpy.context.scene
 
-    scene.world = bpy.data.worlds.new("World")
-    scene.world.use_nodes = True
-    bg = scene.world.node_tree.nodes["Background"]
-    bg.inputs["Color"].default_value = (0.02, 0.02, 0.035, 1.0)
-    bg.inputs["Strength"].default_value = 0.2
-
-    # Studio lighting setup
-    key = bpy.data.lights.new("Key", type='AREA')
-    key.energy = 2000
-    key.size = 8
-    key.color = (1.0, 0.95, 0.9)
-    key_obj = bpy.data.objects.new("Key", key)
-    key_obj.location = (7, -8, 9)
-    key_obj.rotation_euler = (math.radians(55), 0, math.radians(40))
-    scene.collection.objects.link(key_obj)
-
-    fill = bpy.data.lights.new("Fill", type='AREA')
-    fill.energy = 700
-    fill.size = 10
-    fill.color = (0.85, 0.9, 1.0)
-    fill_obj = bpy.data.objects.new("Fill", fill)
-    fill_obj.location = (-7, -6, 7)
-    scene.collection.objects.link(fill_obj)
-
-    rim = bpy.data.lights.new("Rim", type='AREA')
-    rim.energy = 1200
-    rim.size = 5
-    rim_obj = bpy.data.objects.new("Rim", rim)
-    rim_obj.location = (0, 8, 8)
-    scene.collection.objects.link(rim_obj)
+    # Studio lighting baked into one world texture instead of three area
+    # lights; camera rays still see the flat backdrop
+    world = bpy.data.worlds.new("World")
+    scene.world = world
+    world.use_nodes = True
+    nodes, links = world.node_tree.nodes, world.node_tree.links
+    nodes.clear()
+    env = nodes.new("ShaderNodeTexEnvironment")
+    env.image = studio_hdr()
+    lighting = nodes.new("ShaderNodeBackground")
+    backdrop = nodes.new("ShaderNodeBackground")
+    backdrop.inputs["Color"].default_value = (*WORLD_COLOR, 1.0)
+    light_path = nodes.new("ShaderNodeLightPath")
+    mix = nodes.new("ShaderNodeMixShader")
+    out = nodes.new("ShaderNodeOutputWorld")
+    links.new(env.outputs["Color"], lighting.inputs["Color"])
+    links.new(light_path.outputs["Is Camera Ray"], mix.inputs["Fac"])
+    links.new(lighting.outputs["Background"], mix.inputs[1])
+    links.new(backdrop.outputs["Background"], mix.inputs[2])
+    links.new(mix.outputs["Shader"], out.inputs["Surface"])
 
     # Hero shot camera - 3/4 view to show wings
     cam = bpy.data.cameras.new("Cam")
@@ -289,6 +512,7 @@ def setup_scene():
 def render(fp, res=(1200, 1600)):
     s = bpy.context.scene
     s.render.engine = 'BLENDER_EEVEE'
+    s.eevee.taa_render_samples = PREVIEW_SAMPLES
     s.render.resolution_x = res[0]
     s.render.resolution_y = res[1]
     s.render.resolution_percentage = 100
@@ -297,34 +521,157 @@ def render(fp, res=(1200, 1600)):
     bpy.ops.render.render(write_still=True)
     print(f"RENDERED: {fp}")
 
-def export_glb(fp):
-    bpy.ops.export_scene.gltf(filepath=fp, export_format='GLB', use_selection=False, export_apply=True, export_yup=True)
+def triangulate(sizes, indices):
+    # Fan every face from its first corner; all faces here are convex
+    tri_counts = sizes - 2
+    face = np.repeat(np.arange(len(sizes)), tri_counts)
+    k = np.arange(len(face)) - np.repeat(np.cumsum(tri_counts) - tri_counts, tri_counts)
+    start = (np.cumsum(sizes) - sizes)[face]
+    return indices[np.stack([start, start + k + 1, start + k + 2], axis=1)]
+
+def gltf_material(m):
+    c = MATERIAL_INDEX[m.name]
+    name, rough, metal, *emit = MATERIALS[c]
+    color = [round(float(v), 4) for v in PALETTE[c]]
+    material = {
+        "name": name,
+        "pbrMetallicRoughness": {
+            "baseColorFactor": color + [1.0],
+            "metallicFactor": metal,
+            "roughnessFactor": rough,
+        },
+    }
+    if emit:
+        material["emissiveFactor"] = color
+        if emit[0] != 1.0:
+            material["extensions"] = {"KHR_materials_emissive_strength": {"emissiveStrength": emit[0]}}
+    return material
+
+def export_glb(fp, parts):
+    # Written straight from the mesh buffers: the glTF add-on would re-walk
+    # the scene, re-extract every mesh and compute normals/tangents we don't
+    # need. No NORMAL attribute: viewers then shade flat, as every part is
+    gltf = {
+        "asset": {"version": "2.0", "generator": ASSET_NAME},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"name": ASSET_NAME, "children": []}],
+        "meshes": [], "materials": [], "accessors": [], "bufferViews": [],
+    }
+    blobs = []
+    offset = 0
+
+    def add_view(data, target, **view):
+        nonlocal offset
+        blob = data.tobytes()
+        gltf["bufferViews"].append({"buffer": 0, "byteOffset": offset, "byteLength": len(blob), "target": target, **view})
+        blobs.append(blob + b"\0" * (-len(blob) % 4))
+        offset += len(blobs[-1])
+        return len(gltf["bufferViews"]) - 1
+
+    def add_accessor(**accessor):
+        gltf["accessors"].append(accessor)
+        return len(gltf["accessors"]) - 1
+
+    meshes, materials = {}, {}
+    for o in parts:
+        m = o.data.materials[0]
+        if m.name not in materials:
+            materials[m.name] = len(gltf["materials"])
+            gltf["materials"].append(gltf_material(m))
+
+        if o.data.name not in meshes:
+            co, sizes, indices = mesh_arrays(o.data)
+            co = co[:, [0, 2, 1]] * np.array([1, 1, -1], dtype=np.float32)  # Z-up -> Y-up
+            tris = triangulate(sizes, indices)
+            tris = tris.astype(np.uint16 if len(co) < 65536 else np.uint32)
+
+            # KHR_mesh_quantization: normalized int16 over the mesh's bbox, the
+            # node's scale/translation mapping [-1, 1] back to it. Padded to 4
+            # components, as vertex attributes must be 4-byte aligned
+            lo, hi = co.min(axis=0), co.max(axis=0)
+            center, half = (lo + hi) / 2, np.maximum((hi - lo) / 2, 1e-6)
+            q = np.zeros((len(co), 4), dtype=np.int16)
+            q[:, :3] = np.round((co - center) / half * 32767)
+
+            position = add_accessor(
+                bufferView=add_view(q, 34962, byteStride=8), componentType=5122, normalized=True,
+                count=len(co), type="VEC3", min=q[:, :3].min(axis=0).tolist(), max=q[:, :3].max(axis=0).tolist(),
+            )
+            index = add_accessor(
+                bufferView=add_view(tris, 34963), componentType=5123 if tris.dtype == np.uint16 else 5125,
+                count=tris.size, type="SCALAR",
+            )
+            meshes[o.data.name] = len(gltf["meshes"]), center.tolist(), half.tolist()
+            gltf["meshes"].append({"name": o.data.name, "primitives": [
+                {"attributes": {"POSITION": position}, "indices": index, "material": materials[m.name]},
+            ]})
+
+        mesh, center, half = meshes[o.data.name]
+        x, y, z = o.location
+        gltf["nodes"][0]["children"].append(len(gltf["nodes"]))
+        gltf["nodes"].append({
+            "name": o.name, "mesh": mesh,
+            "translation": [x + center[0], z + center[1], -y + center[2]], "scale": half,
+        })
+
+    gltf["extensionsUsed"] = gltf["extensionsRequired"] = ["KHR_mesh_quantization"]
+    if any("extensions" in m for m in gltf["materials"]):
+        gltf["extensionsUsed"] = ["KHR_mesh_quantization", "KHR_materials_emissive_strength"]
+    binary = b"".join(blobs)
+    gltf["buffers"] = [{"byteLength": len(binary)}]
+    text = json.dumps(gltf, separators=(",", ":")).encode()
+    text += b" " * (-len(text) % 4)
+
+    with open(fp, "wb") as f:
+        f.write(struct.pack("<III", 0x46546C67, 2, 12 + 8 + len(text) + 8 + len(binary)))  # "glTF"
+        f.write(struct.pack("<II", len(text), 0x4E4F534A) + text)  # "JSON"
+        f.write(struct.pack("<II", len(binary), 0x004E4942) + binary)  # "BIN\0"
     print(f"EXPORTED: {fp}")
 
 def main():
     argv = sys.argv
     output_dir = OUTPUT_DIR
+    merge = True  # merge=0 keeps one object per part
     if "--" in argv:
         for arg in argv[argv.index("--") + 1:]:
             if arg.startswith("output="):
                 output_dir = arg.split("=")[1]
+            elif arg.startswith("merge="):
+                merge = arg.split("=")[1] not in ("0", "false", "no")
 
     try:
         cleanup()
         mats = setup_mats()
-        parts = build(mats)
-
-        bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-        parent = bpy.context.active_object
-        parent.name = ASSET_NAME
+        cached = load_geometry(mats) if merge else None
+        if cached:
+            print(f"Cached geometry: {GEOMETRY_CACHE}")
+            geometry, part_count = cached
+        else:
+            parts = build(mats)
+            part_count = len(parts)
+            if merge:
+                geometry = merged_geometry(parts)
+                remove_parts(parts)
+                save_geometry(mats, geometry, part_count)
+        if merge:
+            parts = material_objects(geometry)
+
+        # Empty (data None) root, created without the operator's active-object/UI update
+        parent = bpy.data.objects.new(ASSET_NAME, None)
+        bpy.context.scene.collection.objects.link(parent)
+        # Plain data-API parenting: matrix_parent_inverse stays identity (nothing
+        # is inverted per part), which is right with the root at the origin
         for p in parts:
             p.parent = parent
+        # Nothing above goes through the depsgraph; evaluate the parts once
+        bpy.context.view_layer.update()
 
         setup_scene()
         render(f"{output_dir}/{ASSET_NAME}_preview.png")
-        export_glb(f"{output_dir}/{ASSET_NAME}.glb")
+        export_glb(f"{output_dir}/{ASSET_NAME}.glb", parts)
 
-        print(json.dumps({"status": "success", "parts": len(parts)}))
+        print(json.dumps({"status": "success", "parts": part_count, "objects": len(parts)}))
 
     except Exception as e:
         import traceback
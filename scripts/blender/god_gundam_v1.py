@@ -8,6 +8,7 @@ import bmesh
 import sys
 import json
 import math
+import numpy as np
 from mathutils import Vector, Matrix
 
 # ============================================================
@@ -108,21 +109,61 @@ def join_objects(objects, name):
     result.name = name
     return result
 
+def _beveled_cube_template():
+    """Unit chamfered cube: 24 verts (3 per corner), 6 face + 12 edge quads, 8 corner tris.
+
+    Vertex (corner c, axis a) sits on the face normal to axis a, inset by the
+    bevel along the other two axes, so any box is SIGNS * (half - bevel * INSET).
+    """
+    corners = np.array([(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], dtype=np.float32)
+    signs = np.repeat(corners, 3, axis=0)
+    inset = np.tile(1 - np.eye(3, dtype=np.float32), (8, 1))
+    vert = lambda c, a: c * 3 + a
+
+    faces = []
+    for a in range(3):
+        for side in (-1, 1):
+            faces.append([vert(c, a) for c in range(8) if corners[c, a] == side])
+        b, d = [i for i in range(3) if i != a]
+        for c in range(8):
+            if corners[c, a] < 0:
+                other = c + (4, 2, 1)[a]  # Same corner with axis a flipped
+                faces.append([vert(c, b), vert(c, d), vert(other, b), vert(other, d)])
+    faces += [[vert(c, 0), vert(c, 1), vert(c, 2)] for c in range(8)]
+
+    # Wind every (convex, planar) face counter-clockwise about its outward normal
+    co = signs * (1 - 0.25 * inset)
+    for f in faces:
+        pts = co[f]
+        center = pts.mean(axis=0)
+        normal = center / np.linalg.norm(center)
+        u = pts[0] - center
+        v = np.cross(normal, u)
+        f[:] = [f[i] for i in np.argsort(np.arctan2((pts - center) @ v, (pts - center) @ u))]
+
+    return signs, inset, [len(f) for f in faces], [i for f in faces for i in f]
+
+BEVEL_SIGNS, BEVEL_INSET, BEVEL_SIZES, BEVEL_INDICES = _beveled_cube_template()
+
 def create_beveled_cube(size, location, bevel=0.02, name="BeveledCube"):
     """Create a cube with beveled edges for that mecha panel look."""
-    bpy.ops.mesh.primitive_cube_add(size=1, location=location)
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.scale = (size[0]/2, size[1]/2, size[2]/2)
-    bpy.ops.object.transform_apply(scale=True)
-
-    # Add bevel modifier
-    bevel_mod = obj.modifiers.new(name="Bevel", type='BEVEL')
-    bevel_mod.width = bevel
-    bevel_mod.segments = 2
-    bevel_mod.limit_method = 'ANGLE'
-    bpy.ops.object.modifier_apply(modifier="Bevel")
-
+    half = np.asarray(size, dtype=np.float32) / 4  # Box is size / 2, as primitive_cube_add(size=1) scaled by size / 2
+    co = BEVEL_SIGNS * (half - min(bevel, *half) * BEVEL_INSET)
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.loops.add(len(BEVEL_INDICES))
+    mesh.polygons.add(len(BEVEL_SIZES))
+    mesh.polygons.foreach_set("loop_start", np.concatenate([[0], np.cumsum(BEVEL_SIZES)[:-1]]).astype(np.int32))
+    mesh.loops.foreach_set("vertex_index", BEVEL_INDICES)
+    mesh.update()
+
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    bpy.context.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    obj.select_set(True)
     return obj
 
 # ============================================================
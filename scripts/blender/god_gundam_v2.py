@@ -2,17 +2,28 @@
 """
 God Gundam (Burning Gundam) 3D Model Generator - Version 2
 Improved proportions with massive shoulders and wing binders
-Run: blender -b --python god_gundam_v2.py --python-exit-code 1 -- output=/tmp
+Run: blender -b --python god_gundam_v2.py --python-exit-code 1 -- output=/tmp [export_worker=1]
+     [high_quality=0]
+     export_worker=1 exports the GLB from a second background Blender while
+     this one renders the preview; 0 exports in-process after the render.
+     high_quality=1 renders the preview at full size with EEVEE's default
+     samples, AO and bloom.
 """
 import bpy
 import bmesh
 import sys
 import json
 import math
+import os
+import subprocess
+import tempfile
+from functools import partial
+import numpy as np
 from mathutils import Vector, Matrix
 
 OUTPUT_DIR = "/tmp"
 ASSET_NAME = "GodGundam_v2"
+PREVIEW_SAMPLES = 16  # EEVEE default is 64; plenty for a quick look
 
 # Color palette
 COLORS = {
@@ -29,6 +40,18 @@ COLORS = {
     'black': (0.015, 0.015, 0.015),
 }
 
+# Cube corners at +-1 and its quads, wound outward
+CUBE_VERTS = np.array([
+    (-1, -1, -1), (-1, -1, 1), (-1, 1, -1), (-1, 1, 1),
+    (1, -1, -1), (1, -1, 1), (1, 1, -1), (1, 1, 1),
+], dtype=np.float32)
+CUBE_FACES = [
+    (0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1),
+    (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3),
+]
+CYL_VERTS = 12  # Cylinders are small joints and thrusters; 12 sides read as round
+SHARED_MESHES = {}  # Geometry key -> Mesh instanced by every part of that shape
+
 def parse_args():
     argv = sys.argv
     if "--" in argv:
@@ -43,205 +66,280 @@ def parse_args():
     return args
 
 def cleanup():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
-
-def create_material(name, color, roughness=0.4, metallic=0.3, emission=0.0):
-    mat = bpy.data.materials.new(name)
-    mat.use_nodes = True
-    bsdf = mat.node_tree.nodes.get("Principled BSDF")
-    bsdf.inputs["Base Color"].default_value = (*color, 1.0)
-    bsdf.inputs["Roughness"].default_value = roughness
-    bsdf.inputs["Metallic"].default_value = metallic
+    # Remove the startup scene's datablocks in one call; read_factory_settings
+    # would also reload preferences, add-ons and the UI
+    data = bpy.data
+    data.batch_remove([
+        id_ for collection in (data.objects, data.meshes, data.materials, data.lights, data.cameras, data.worlds)
+        for id_ in collection
+    ])
+    SHARED_MESHES.clear()  # Freed along with the rest
+    bpy.context.preferences.edit.use_global_undo = False  # No undo steps while building
+
+def create_material(proto, name, color, roughness=0.4, metallic=0.3, emission=0.0):
+    # A copy of proto's default node tree, rather than building one per material
+    mat = proto.copy()
+    mat.name = name
+    inputs = mat.node_tree.nodes["Principled BSDF"].inputs
+    values = {"Base Color": (*color, 1.0), "Roughness": roughness, "Metallic": metallic}
     if emission > 0:
-        bsdf.inputs["Emission Color"].default_value = (*color, 1.0)
-        bsdf.inputs["Emission Strength"].default_value = emission
+        values.update({"Emission Color": (*color, 1.0), "Emission Strength": emission})
+    for socket, value in values.items():
+        inputs[socket].default_value = value
     return mat
 
 def setup_materials():
+    proto = bpy.data.materials.new("GG_Proto")
+    proto.use_nodes = True
+    new = partial(create_material, proto)
+
     mats = {}
-    mats['white'] = create_material("GG_White", COLORS['white'], roughness=0.25, metallic=0.15)
-    mats['light_gray'] = create_material("GG_LightGray", COLORS['light_gray'], roughness=0.35, metallic=0.25)
-    mats['dark_gray'] = create_material("GG_DarkGray", COLORS['dark_gray'], roughness=0.45, metallic=0.35)
-    mats['blue'] = create_material("GG_Blue", COLORS['blue'], roughness=0.25, metallic=0.25)
-    mats['dark_blue'] = create_material("GG_DarkBlue", COLORS['dark_blue'], roughness=0.35, metallic=0.25)
-    mats['red'] = create_material("GG_Red", COLORS['red'], roughness=0.25, metallic=0.15)
-    mats['gold'] = create_material("GG_Gold", COLORS['gold'], roughness=0.15, metallic=0.85)
-    mats['orange'] = create_material("GG_Orange", COLORS['orange'], roughness=0.25, metallic=0.15, emission=0.8)
-    mats['green'] = create_material("GG_Green", COLORS['green'], roughness=0.08, metallic=0.05, emission=3.0)
-    mats['black'] = create_material("GG_Black", COLORS['black'], roughness=0.55, metallic=0.3)
+    mats['white'] = new("GG_White", COLORS['white'], roughness=0.25, metallic=0.15)
+    mats['light_gray'] = new("GG_LightGray", COLORS['light_gray'], roughness=0.35, metallic=0.25)
+    mats['dark_gray'] = new("GG_DarkGray", COLORS['dark_gray'], roughness=0.45, metallic=0.35)
+    mats['blue'] = new("GG_Blue", COLORS['blue'], roughness=0.25, metallic=0.25)
+    mats['dark_blue'] = new("GG_DarkBlue", COLORS['dark_blue'], roughness=0.35, metallic=0.25)
+    mats['red'] = new("GG_Red", COLORS['red'], roughness=0.25, metallic=0.15)
+    mats['gold'] = new("GG_Gold", COLORS['gold'], roughness=0.15, metallic=0.85)
+    mats['orange'] = new("GG_Orange", COLORS['orange'], roughness=0.25, metallic=0.15, emission=0.8)
+    mats['green'] = new("GG_Green", COLORS['green'], roughness=0.08, metallic=0.05, emission=3.0)
+    mats['black'] = new("GG_Black", COLORS['black'], roughness=0.55, metallic=0.3)
+    bpy.data.materials.remove(proto)
     return mats
 
 def apply_mat(obj, mat):
-    if obj.data.materials:
-        obj.data.materials[0] = mat
-    else:
-        obj.data.materials.append(mat)
+    """Fill the mesh's one slot on the object side, leaving shared meshes untouched."""
+    slot = obj.material_slots[0]
+    slot.link = 'OBJECT'
+    slot.material = mat
 
 def add_bevel(obj, width=0.01, segments=2):
-    """Add bevel modifier for mecha panel lines."""
+    """Add bevel modifier for mecha panel lines.
+
+    Left unapplied so the mesh can stay shared; the render and the GLB
+    export (export_apply) both evaluate it.
+    """
     bevel = obj.modifiers.new(name="Bevel", type='BEVEL')
     bevel.width = width
     bevel.segments = segments
     bevel.limit_method = 'ANGLE'
-    bpy.context.view_layer.objects.active = obj
-    bpy.ops.object.modifier_apply(modifier="Bevel")
-
-def cube(loc, scale, name, mat, bevel=0.008):
-    bpy.ops.mesh.primitive_cube_add(size=1, location=loc)
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.scale = (scale[0]/2, scale[1]/2, scale[2]/2)
-    bpy.ops.object.transform_apply(scale=True)
-    if bevel > 0:
-        add_bevel(obj, bevel)
-    apply_mat(obj, mat)
-    return obj
 
-def cylinder(loc, radius, depth, name, mat, rotation=(0, 0, 0)):
-    bpy.ops.mesh.primitive_cylinder_add(radius=radius, depth=depth, location=loc)
-    obj = bpy.context.active_object
-    obj.name = name
+def frustum(verts, r1, r2, depth):
+    """Cone around Z as primitive_cone_add lays it out (first vertex on +Y):
+    side quads plus n-gon caps; r1 == r2 is primitive_cylinder_add's cylinder.
+    """
+    phi = np.arange(verts) * (2 * math.pi / verts)
+    ring = np.column_stack([-np.sin(phi), np.cos(phi)])
+    co = np.concatenate([
+        np.column_stack([ring * r1, np.full(verts, -depth / 2)]),
+        np.column_stack([ring * r2, np.full(verts, depth / 2)]),
+    ])
+    faces = [(i, (i + 1) % verts, verts + (i + 1) % verts, verts + i) for i in range(verts)]
+    faces.append(tuple(range(verts - 1, -1, -1)))
+    faces.append(tuple(range(verts, 2 * verts)))
+    return co, faces
+
+def uv_sphere(radius, segments=32, rings=16):
+    """primitive_uv_sphere_add's sphere: pole triangle fans around quad bands."""
+    theta = np.arange(1, rings) * (math.pi / rings)
+    phi = np.arange(segments) * (2 * math.pi / segments)
+    co = np.concatenate([
+        [(0, 0, radius)],
+        radius * np.stack([
+            np.outer(np.sin(theta), np.cos(phi)),
+            np.outer(np.sin(theta), np.sin(phi)),
+            np.repeat(np.cos(theta)[:, None], segments, axis=1),
+        ], axis=-1).reshape(-1, 3),
+        [(0, 0, -radius)],
+    ])
+    bottom = len(co) - 1
+    ring = lambda i, j: 1 + i * segments + j % segments
+    faces = [(0, ring(0, j), ring(0, j + 1)) for j in range(segments)]
+    faces += [(ring(i, j), ring(i + 1, j), ring(i + 1, j + 1), ring(i, j + 1))
+              for i in range(rings - 2) for j in range(segments)]
+    faces += [(bottom, ring(rings - 2, j + 1), ring(rings - 2, j)) for j in range(segments)]
+    return co, faces
+
+def new_mesh(name, verts, faces):
+    """Build a mesh from raw geometry, without any operator."""
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts.tolist(), [], faces)
+    mesh.update()
+    mesh.materials.append(None)  # One slot, filled per object
+    return mesh
+
+def shared_mesh(key, name, verts, faces):
+    """Mesh for a geometry key, built from the first part that needs it."""
+    if key not in SHARED_MESHES:
+        SHARED_MESHES[key] = new_mesh(name, verts, faces)
+    return SHARED_MESHES[key]
+
+def mesh_object(name, mesh, loc, rotation, mat, scale=(1, 1, 1)):
+    """Unlinked object; generate() links every part in one pass."""
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = loc
     obj.rotation_euler = rotation
-    bpy.ops.object.transform_apply(rotation=True)
+    obj.scale = scale
     apply_mat(obj, mat)
     return obj
 
-def cone(loc, r1, r2, depth, name, mat, rotation=(0, 0, 0), verts=4):
-    bpy.ops.mesh.primitive_cone_add(vertices=verts, radius1=r1, radius2=r2, depth=depth, location=loc)
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.rotation_euler = rotation
-    bpy.ops.object.transform_apply(rotation=True)
-    apply_mat(obj, mat)
-    return obj
+def box(loc, dims, name, mat, rotation=(0, 0, 0), bevel=0):
+    """Box of full size dims, instanced from a shared mesh.
 
-# ============================================================
-# HEAD - More angular with prominent V-fin
-# ============================================================
-def create_head(mats, z):
-    parts = []
-
-    # Main helmet - wider and more angular
-    parts.append(cube((0, 0, z), (0.28, 0.26, 0.2), "Head_Helmet", mats['white']))
-
-    # Face plate (blue)
-    parts.append(cube((0, -0.11, z - 0.02), (0.18, 0.06, 0.12), "Head_Face", mats['blue']))
-
-    # Visor (green, glowing) - wider
-    parts.append(cube((0, -0.14, z + 0.01), (0.16, 0.02, 0.04), "Head_Visor", mats['green']))
-
-    # Chin guard (red)
-    parts.append(cube((0, -0.12, z - 0.08), (0.1, 0.04, 0.04), "Head_Chin", mats['red']))
-
-    # V-Fin center (gold) - MUCH bigger
-    parts.append(cone((0, -0.04, z + 0.2), 0.025, 0.005, 0.25,
-                      "Head_VFin_Center", mats['gold'], (math.radians(-20), 0, 0)))
-
-    # V-Fin left - bigger and more dramatic angle
-    parts.append(cone((-0.12, -0.02, z + 0.18), 0.02, 0.004, 0.3,
-                      "Head_VFin_L", mats['gold'], (math.radians(-35), math.radians(-40), 0)))
-
-    # V-Fin right
-    parts.append(cone((0.12, -0.02, z + 0.18), 0.02, 0.004, 0.3,
-                      "Head_VFin_R", mats['gold'], (math.radians(-35), math.radians(40), 0)))
+    Plain boxes scale the unit cube. The bevel modifier works in mesh space,
+    so beveled boxes share a mesh per size instead (mirrored pairs, slats).
+    """
+    if bevel > 0:
+        dims = tuple(round(d, 6) for d in dims)
+        key, verts, scale = ('box', dims), CUBE_VERTS * 0.5 * np.asarray(dims), (1, 1, 1)
+    else:
+        key, verts, scale = ('cube',), CUBE_VERTS * 0.5, dims
+    obj = mesh_object(name, shared_mesh(key, name, verts, CUBE_FACES), loc, rotation, mat, scale)
+    if bevel > 0:
+        add_bevel(obj, bevel)
+    return obj
 
-    # Forehead crest
-    parts.append(cube((0, 0.02, z + 0.12), (0.02, 0.1, 0.06), "Head_Crest", mats['white']))
+def cube(loc, scale, name, mat, bevel=0.008):
+    # Half of scale, as primitive_cube_add(size=1) scaled by scale / 2
+    return box(loc, [s / 2 for s in scale], name, mat, bevel=bevel)
 
-    # Side vents
-    for side, x in [('L', -0.12), ('R', 0.12)]:
-        parts.append(cube((x, 0, z), (0.05, 0.15, 0.1), f"Head_SideVent_{side}", mats['light_gray']))
+def cylinder(loc, radius, depth, name, mat, rotation=(0, 0, 0)):
+    return cone(loc, radius, radius, depth, name, mat, rotation, CYL_VERTS)
 
-    return parts
+def cone(loc, r1, r2, depth, name, mat, rotation=(0, 0, 0), verts=4):
+    """Unit frustum scaled to r1 / depth; cones of the same taper share it."""
+    taper = round(r2 / r1, 4)
+    mesh = shared_mesh(('frustum', verts, taper), name, *frustum(verts, 1, taper, 1))
+    return mesh_object(name, mesh, loc, rotation, mat, (r1, r1, depth))
 
 # ============================================================
-# TORSO - Bulkier with prominent vents
+# PARTS TABLES
 # ============================================================
-def create_torso(mats, z):
-    parts = []
-
-    # Main chest core (blue) - larger
-    parts.append(cube((0, 0, z), (0.4, 0.28, 0.32), "Torso_Chest", mats['blue']))
-
-    # Upper chest plate (white collar)
-    parts.append(cube((0, -0.02, z + 0.18), (0.35, 0.14, 0.1), "Torso_Collar", mats['white']))
-
-    # Center cockpit (red) - more prominent
-    parts.append(cube((0, -0.14, z + 0.04), (0.14, 0.04, 0.16), "Torso_Cockpit", mats['red']))
-
-    # Chest vents (orange/gold) - MUCH bigger and more prominent
-    for side, x in [('L', -0.12), ('R', 0.12)]:
-        parts.append(cube((x, -0.14, z + 0.08), (0.08, 0.04, 0.12), f"Torso_Vent_{side}", mats['orange']))
-        # Vent slats
-        for i, vz in enumerate([-0.02, 0.02, 0.06]):
-            parts.append(cube((x, -0.16, z + vz), (0.06, 0.01, 0.02), f"Torso_VentSlat_{side}_{i}", mats['gold']))
-
-    # Chest gem (green center)
-    parts.append(cube((0, -0.15, z + 0.12), (0.06, 0.02, 0.06), "Torso_ChestGem", mats['green']))
+# Section heights
+HEAD_Z = 1.85
+SHOULDER_Z = 1.6
+TORSO_Z = 1.45
+BACKPACK_Z = 1.45
+ARM_Z = 1.4
+SKIRT_Z = 1.1
+LEG_Z = 0.88
+
+NO_ROT = (0, 0, 0)
+
+# Limb angles in radians, converted once at load
+QUARTER_TURN = math.radians(90)
+SHOULDER_TILT = math.radians(-20)  # Upper plate angled outward (about Y, right side)
+WING_SPREAD = {  # position -> (X, Y) angles, Y for the right side
+    'upper': (math.radians(-25), math.radians(30)),
+    'lower': (math.radians(15), math.radians(20)),
+}
 
-    # Neck area
-    parts.append(cylinder((0, 0, z + 0.24), 0.06, 0.08, "Torso_Neck", mats['dark_gray']))
+# (kind, name, loc, size, rotation, material, bevel). rotation is XYZ Euler
+# degrees. size is cube()'s scale for a cube, full dimensions for a box,
+# (radius, depth) for a cylinder and (r1, r2, depth) for a cone; bevel is
+# the box bevel width (cubes keep cube()'s default).
 
-    # Waist core
-    parts.append(cube((0, 0, z - 0.22), (0.28, 0.2, 0.12), "Torso_Waist", mats['dark_gray']))
+# HEAD - More angular with prominent V-fin
+HEAD_PARTS = [
+    ('cube', "Head_Helmet", (0, 0, HEAD_Z), (0.28, 0.26, 0.2), NO_ROT, 'white', None),  # Wider, more angular
+    ('cube', "Head_Face", (0, -0.11, HEAD_Z - 0.02), (0.18, 0.06, 0.12), NO_ROT, 'blue', None),
+    ('cube', "Head_Visor", (0, -0.14, HEAD_Z + 0.01), (0.16, 0.02, 0.04), NO_ROT, 'green', None),  # Glowing, wider
+    ('cube', "Head_Chin", (0, -0.12, HEAD_Z - 0.08), (0.1, 0.04, 0.04), NO_ROT, 'red', None),
+    # V-Fin - MUCH bigger, sides at a more dramatic angle
+    ('cone', "Head_VFin_Center", (0, -0.04, HEAD_Z + 0.2), (0.025, 0.005, 0.25), (-20, 0, 0), 'gold', None),
+    ('cone', "Head_VFin_L", (-0.12, -0.02, HEAD_Z + 0.18), (0.02, 0.004, 0.3), (-35, -40, 0), 'gold', None),
+    ('cone', "Head_VFin_R", (0.12, -0.02, HEAD_Z + 0.18), (0.02, 0.004, 0.3), (-35, 40, 0), 'gold', None),
+    ('cube', "Head_Crest", (0, 0.02, HEAD_Z + 0.12), (0.02, 0.1, 0.06), NO_ROT, 'white', None),  # Forehead
+    ('cube', "Head_SideVent_L", (-0.12, 0, HEAD_Z), (0.05, 0.15, 0.1), NO_ROT, 'light_gray', None),
+    ('cube', "Head_SideVent_R", (0.12, 0, HEAD_Z), (0.05, 0.15, 0.1), NO_ROT, 'light_gray', None),
+]
 
-    # Abdominal armor (red)
-    parts.append(cube((0, -0.08, z - 0.08), (0.16, 0.06, 0.12), "Torso_Abdomen", mats['red']))
+# TORSO - Bulkier with prominent vents
+TORSO_PARTS = [
+    ('cube', "Torso_Chest", (0, 0, TORSO_Z), (0.4, 0.28, 0.32), NO_ROT, 'blue', None),  # Core, larger
+    ('cube', "Torso_Collar", (0, -0.02, TORSO_Z + 0.18), (0.35, 0.14, 0.1), NO_ROT, 'white', None),
+    ('cube', "Torso_Cockpit", (0, -0.14, TORSO_Z + 0.04), (0.14, 0.04, 0.16), NO_ROT, 'red', None),
+    # Chest vents - MUCH bigger and more prominent, with slats
+    *[row for side, x in [('L', -0.12), ('R', 0.12)] for row in [
+        ('cube', f"Torso_Vent_{side}", (x, -0.14, TORSO_Z + 0.08), (0.08, 0.04, 0.12), NO_ROT, 'orange', None),
+        *[('cube', f"Torso_VentSlat_{side}_{i}", (x, -0.16, TORSO_Z + vz), (0.06, 0.01, 0.02), NO_ROT, 'gold', None)
+          for i, vz in enumerate([-0.02, 0.02, 0.06])],
+    ]],
+    ('cube', "Torso_ChestGem", (0, -0.15, TORSO_Z + 0.12), (0.06, 0.02, 0.06), NO_ROT, 'green', None),
+    ('cylinder', "Torso_Neck", (0, 0, TORSO_Z + 0.24), (0.06, 0.08), NO_ROT, 'dark_gray', None),
+    ('cube', "Torso_Waist", (0, 0, TORSO_Z - 0.22), (0.28, 0.2, 0.12), NO_ROT, 'dark_gray', None),
+    ('cube', "Torso_Abdomen", (0, -0.08, TORSO_Z - 0.08), (0.16, 0.06, 0.12), NO_ROT, 'red', None),
+]
 
-    return parts
+# SKIRT ARMOR - Larger panels
+SKIRT_PARTS = [
+    # Front center panel (white with blue)
+    ('box', "Skirt_FrontCenter", (0, -0.16, SKIRT_Z), (0.12, 0.03, 0.2), (20, 0, 0), 'white', 0.01),
+    ('box', "Skirt_FrontCenterBlue", (0, -0.18, SKIRT_Z - 0.04), (0.08, 0.02, 0.1), (20, 0, 0), 'blue', 0),
+    # Front side panels with blue accents
+    *[row for side, x_mult in [('L', -1), ('R', 1)] for row in [
+        ('box', f"Skirt_FrontSide_{side}", (x_mult * 0.12, -0.14, SKIRT_Z), (0.1, 0.03, 0.22),
+         (25, x_mult * -15, 0), 'white', 0.01),
+        ('box', f"Skirt_FrontSideBlue_{side}", (x_mult * 0.12, -0.16, SKIRT_Z - 0.06), (0.07, 0.02, 0.1),
+         (25, x_mult * -15, 0), 'blue', 0),
+    ]],
+    # Side skirt armor (large panels)
+    *[row for side, x_mult in [('L', -1), ('R', 1)] for row in [
+        ('cube', f"Skirt_Side_{side}", (x_mult * 0.22, 0, SKIRT_Z - 0.04), (0.06, 0.2, 0.28), NO_ROT, 'white', None),
+        ('cube', f"Skirt_SideBlue_{side}", (x_mult * 0.24, 0, SKIRT_Z - 0.08), (0.03, 0.14, 0.18), NO_ROT, 'blue', None),
+    ]],
+    ('cube', "Skirt_Rear", (0, 0.14, SKIRT_Z - 0.04), (0.22, 0.04, 0.24), NO_ROT, 'white', None),
+]
+
+def table_part(kind, name, loc, size, rotation, mat, bevel):
+    if kind == 'cube':
+        return cube(loc, size, name, mat)
+    if kind == 'box':
+        return box(loc, size, name, mat, rotation, bevel)
+    if kind == 'cylinder':
+        return cylinder(loc, *size, name, mat, rotation)
+    return cone(loc, *size, name, mat, rotation)
+
+def build_parts(table, mats):
+    """Objects for a parts table, in one pass; locations and radians come from single numpy conversions."""
+    locs = np.array([row[2] for row in table], dtype=np.float64)
+    rotations = np.radians([row[4] for row in table])
+    return [table_part(kind, name, loc, size, rotation, mats[mat], bevel)
+            for (kind, name, _, size, _, mat, bevel), loc, rotation in zip(table, locs, rotations)]
 
 # ============================================================
 # SHOULDERS - MASSIVE layered armor (key God Gundam feature)
 # ============================================================
 def create_shoulder(mats, side, z):
     parts = []
+    dark_gray, white, red, black, gold = mats['dark_gray'], mats['white'], mats['red'], mats['black'], mats['gold']
     x_mult = 1 if side == 'right' else -1
     x = x_mult * 0.32
 
     # Inner shoulder joint
-    parts.append(cube((x, 0, z), (0.12, 0.14, 0.14), f"Shoulder_{side}_Joint", mats['dark_gray']))
+    parts.append(cube((x, 0, z), (0.12, 0.14, 0.14), f"Shoulder_{side}_Joint", dark_gray))
 
     # Main shoulder armor block (white) - HUGE
     armor_x = x + x_mult * 0.12
-    parts.append(cube((armor_x, 0, z + 0.08), (0.22, 0.36, 0.28), f"Shoulder_{side}_MainArmor", mats['white']))
+    parts.append(cube((armor_x, 0, z + 0.08), (0.22, 0.36, 0.28), f"Shoulder_{side}_MainArmor", white))
 
     # Upper shoulder plate - even bigger, angled outward
     upper_x = x + x_mult * 0.18
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(upper_x, 0, z + 0.2))
-    upper = bpy.context.active_object
-    upper.name = f"Shoulder_{side}_Upper"
-    upper.scale = (0.14, 0.4, 0.22)
-    upper.rotation_euler = (0, x_mult * math.radians(-20), 0)
-    bpy.ops.object.transform_apply(rotation=True, scale=True)
-    add_bevel(upper)
-    apply_mat(upper, mats['white'])
-    parts.append(upper)
+    tilt = (0, x_mult * SHOULDER_TILT, 0)
+    parts.append(box((upper_x, 0, z + 0.2), (0.14, 0.4, 0.22), f"Shoulder_{side}_Upper", white, tilt, bevel=0.01))
 
     # Red trim on top - prominent
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(upper_x + x_mult * 0.04, 0, z + 0.32))
-    red_top = bpy.context.active_object
-    red_top.name = f"Shoulder_{side}_RedTop"
-    red_top.scale = (0.1, 0.38, 0.04)
-    red_top.rotation_euler = (0, x_mult * math.radians(-20), 0)
-    bpy.ops.object.transform_apply(rotation=True, scale=True)
-    apply_mat(red_top, mats['red'])
-    parts.append(red_top)
+    parts.append(box((upper_x + x_mult * 0.04, 0, z + 0.32), (0.1, 0.38, 0.04), f"Shoulder_{side}_RedTop", red, tilt))
 
     # Red front edge
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(armor_x, -0.16, z + 0.08))
-    red_front = bpy.context.active_object
-    red_front.name = f"Shoulder_{side}_RedFront"
-    red_front.scale = (0.18, 0.04, 0.2)
-    bpy.ops.object.transform_apply(scale=True)
-    apply_mat(red_front, mats['red'])
-    parts.append(red_front)
+    parts.append(box((armor_x, -0.16, z + 0.08), (0.18, 0.04, 0.2), f"Shoulder_{side}_RedFront", red))
 
     # Black vents underneath
     for i, vy in enumerate([-0.08, 0, 0.08]):
-        parts.append(cube((x, vy, z - 0.08), (0.1, 0.06, 0.06), f"Shoulder_{side}_Vent_{i}", mats['black']))
+        parts.append(cube((x, vy, z - 0.08), (0.1, 0.06, 0.06), f"Shoulder_{side}_Vent_{i}", black))
 
     # Gold accent
-    parts.append(cube((armor_x - x_mult * 0.06, -0.1, z + 0.04), (0.04, 0.1, 0.08), f"Shoulder_{side}_Gold", mats['gold']))
+    parts.append(cube((armor_x - x_mult * 0.06, -0.1, z + 0.04), (0.04, 0.1, 0.08), f"Shoulder_{side}_Gold", gold))
 
     return parts
 
@@ -250,95 +348,37 @@ def create_shoulder(mats, side, z):
 # ============================================================
 def create_arm(mats, side, z):
     parts = []
+    blue, white, dark_gray, gold = mats['blue'], mats['white'], mats['dark_gray'], mats['gold']
     x_mult = 1 if side == 'right' else -1
     x = x_mult * 0.4
 
     # Upper arm (blue)
-    parts.append(cube((x, 0, z), (0.12, 0.14, 0.24), f"Arm_{side}_Upper", mats['blue']))
+    parts.append(cube((x, 0, z), (0.12, 0.14, 0.24), f"Arm_{side}_Upper", blue))
 
     # Upper arm armor (white panel)
-    parts.append(cube((x + x_mult * 0.04, -0.04, z), (0.06, 0.1, 0.18), f"Arm_{side}_UpperArmor", mats['white']))
+    parts.append(cube((x + x_mult * 0.04, -0.04, z), (0.06, 0.1, 0.18), f"Arm_{side}_UpperArmor", white))
 
     # Elbow joint
-    parts.append(cylinder((x, 0, z - 0.16), 0.06, 0.08, f"Arm_{side}_Elbow", mats['dark_gray'], (0, math.radians(90), 0)))
+    parts.append(cylinder((x, 0, z - 0.16), 0.06, 0.08, f"Arm_{side}_Elbow", dark_gray, (0, QUARTER_TURN, 0)))
 
     # Forearm (white)
-    parts.append(cube((x, 0, z - 0.36), (0.11, 0.13, 0.22), f"Arm_{side}_Forearm", mats['white']))
+    parts.append(cube((x, 0, z - 0.36), (0.11, 0.13, 0.22), f"Arm_{side}_Forearm", white))
 
     # Forearm armor plate (larger)
-    parts.append(cube((x + x_mult * 0.06, -0.02, z - 0.34), (0.05, 0.1, 0.18), f"Arm_{side}_ForearmArmor", mats['white']))
+    parts.append(cube((x + x_mult * 0.06, -0.02, z - 0.34), (0.05, 0.1, 0.18), f"Arm_{side}_ForearmArmor", white))
 
     # Gold accent on arm
-    parts.append(cube((x, -0.08, z - 0.3), (0.06, 0.02, 0.1), f"Arm_{side}_Gold", mats['gold']))
+    parts.append(cube((x, -0.08, z - 0.3), (0.06, 0.02, 0.1), f"Arm_{side}_Gold", gold))
 
     # Hand (dark gray, fist)
-    parts.append(cube((x, -0.02, z - 0.52), (0.08, 0.1, 0.1), f"Arm_{side}_Hand", mats['dark_gray']))
+    parts.append(cube((x, -0.02, z - 0.52), (0.08, 0.1, 0.1), f"Arm_{side}_Hand", dark_gray))
 
     # Fingers
     for i, fx in enumerate([-0.025, 0, 0.025]):
-        parts.append(cube((x + fx, -0.07, z - 0.55), (0.018, 0.04, 0.06), f"Arm_{side}_Finger_{i}", mats['dark_gray']))
+        parts.append(cube((x + fx, -0.07, z - 0.55), (0.018, 0.04, 0.06), f"Arm_{side}_Finger_{i}", dark_gray))
 
     # Thumb
-    parts.append(cube((x + x_mult * 0.04, -0.04, z - 0.54), (0.02, 0.035, 0.05), f"Arm_{side}_Thumb", mats['dark_gray']))
-
-    return parts
-
-# ============================================================
-# SKIRT ARMOR - Larger panels
-# ============================================================
-def create_skirt(mats, z):
-    parts = []
-
-    # Front center panel (white with blue)
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, -0.16, z))
-    front_c = bpy.context.active_object
-    front_c.name = "Skirt_FrontCenter"
-    front_c.scale = (0.12, 0.03, 0.2)
-    front_c.rotation_euler = (math.radians(20), 0, 0)
-    bpy.ops.object.transform_apply(rotation=True, scale=True)
-    add_bevel(front_c)
-    apply_mat(front_c, mats['white'])
-    parts.append(front_c)
-
-    # Blue accent on front center
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, -0.18, z - 0.04))
-    front_c_blue = bpy.context.active_object
-    front_c_blue.name = "Skirt_FrontCenterBlue"
-    front_c_blue.scale = (0.08, 0.02, 0.1)
-    front_c_blue.rotation_euler = (math.radians(20), 0, 0)
-    bpy.ops.object.transform_apply(rotation=True, scale=True)
-    apply_mat(front_c_blue, mats['blue'])
-    parts.append(front_c_blue)
-
-    # Front side panels
-    for side, x_mult in [('L', -1), ('R', 1)]:
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x_mult * 0.12, -0.14, z))
-        panel = bpy.context.active_object
-        panel.name = f"Skirt_FrontSide_{side}"
-        panel.scale = (0.1, 0.03, 0.22)
-        panel.rotation_euler = (math.radians(25), x_mult * math.radians(-15), 0)
-        bpy.ops.object.transform_apply(rotation=True, scale=True)
-        add_bevel(panel)
-        apply_mat(panel, mats['white'])
-        parts.append(panel)
-
-        # Blue accent
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x_mult * 0.12, -0.16, z - 0.06))
-        accent = bpy.context.active_object
-        accent.name = f"Skirt_FrontSideBlue_{side}"
-        accent.scale = (0.07, 0.02, 0.1)
-        accent.rotation_euler = (math.radians(25), x_mult * math.radians(-15), 0)
-        bpy.ops.object.transform_apply(rotation=True, scale=True)
-        apply_mat(accent, mats['blue'])
-        parts.append(accent)
-
-    # Side skirt armor (large panels)
-    for side, x_mult in [('L', -1), ('R', 1)]:
-        parts.append(cube((x_mult * 0.22, 0, z - 0.04), (0.06, 0.2, 0.28), f"Skirt_Side_{side}", mats['white']))
-        parts.append(cube((x_mult * 0.24, 0, z - 0.08), (0.03, 0.14, 0.18), f"Skirt_SideBlue_{side}", mats['blue']))
-
-    # Rear skirt
-    parts.append(cube((0, 0.14, z - 0.04), (0.22, 0.04, 0.24), "Skirt_Rear", mats['white']))
+    parts.append(cube((x + x_mult * 0.04, -0.04, z - 0.54), (0.02, 0.035, 0.05), f"Arm_{side}_Thumb", dark_gray))
 
     return parts
 
@@ -347,54 +387,53 @@ def create_skirt(mats, z):
 # ============================================================
 def create_leg(mats, side, z):
     parts = []
+    dark_gray, white, light_gray = mats['dark_gray'], mats['white'], mats['light_gray']
+    blue, dark_blue, red = mats['blue'], mats['dark_blue'], mats['red']
     x_mult = 1 if side == 'right' else -1
     x = x_mult * 0.14
 
     # Hip ball joint
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.07, location=(x, 0, z + 0.1))
-    hip = bpy.context.active_object
-    hip.name = f"Leg_{side}_Hip"
-    apply_mat(hip, mats['dark_gray'])
-    parts.append(hip)
+    hip = f"Leg_{side}_Hip"
+    parts.append(mesh_object(hip, new_mesh(hip, *uv_sphere(0.07)), (x, 0, z + 0.1), (0, 0, 0), dark_gray))
 
     # Upper leg / thigh (white)
-    parts.append(cube((x, 0, z - 0.12), (0.14, 0.18, 0.3), f"Leg_{side}_Thigh", mats['white']))
+    parts.append(cube((x, 0, z - 0.12), (0.14, 0.18, 0.3), f"Leg_{side}_Thigh", white))
 
     # Thigh armor panel (outer)
-    parts.append(cube((x + x_mult * 0.08, -0.04, z - 0.1), (0.05, 0.12, 0.2), f"Leg_{side}_ThighArmor", mats['light_gray']))
+    parts.append(cube((x + x_mult * 0.08, -0.04, z - 0.1), (0.05, 0.12, 0.2), f"Leg_{side}_ThighArmor", light_gray))
 
     # Knee armor (blue) - prominent
-    parts.append(cube((x, -0.06, z - 0.32), (0.12, 0.14, 0.14), f"Leg_{side}_Knee", mats['blue']))
+    parts.append(cube((x, -0.06, z - 0.32), (0.12, 0.14, 0.14), f"Leg_{side}_Knee", blue))
 
     # Knee cap detail
-    parts.append(cube((x, -0.12, z - 0.32), (0.08, 0.04, 0.1), f"Leg_{side}_KneeCap", mats['dark_blue']))
+    parts.append(cube((x, -0.12, z - 0.32), (0.08, 0.04, 0.1), f"Leg_{side}_KneeCap", dark_blue))
 
     # Lower leg / shin (white)
-    parts.append(cube((x, 0, z - 0.56), (0.13, 0.16, 0.32), f"Leg_{side}_Shin", mats['white']))
+    parts.append(cube((x, 0, z - 0.56), (0.13, 0.16, 0.32), f"Leg_{side}_Shin", white))
 
     # Shin armor (front blue panel)
-    parts.append(cube((x, -0.1, z - 0.54), (0.09, 0.04, 0.26), f"Leg_{side}_ShinArmor", mats['blue']))
+    parts.append(cube((x, -0.1, z - 0.54), (0.09, 0.04, 0.26), f"Leg_{side}_ShinArmor", blue))
 
     # Calf armor (back)
-    parts.append(cube((x, 0.1, z - 0.52), (0.1, 0.06, 0.22), f"Leg_{side}_Calf", mats['light_gray']))
+    parts.append(cube((x, 0.1, z - 0.52), (0.1, 0.06, 0.22), f"Leg_{side}_Calf", light_gray))
 
     # Ankle
-    parts.append(cylinder((x, 0, z - 0.74), 0.05, 0.06, f"Leg_{side}_Ankle", mats['dark_gray']))
+    parts.append(cylinder((x, 0, z - 0.74), 0.05, 0.06, f"Leg_{side}_Ankle", dark_gray))
 
     # Ankle guard band
-    parts.append(cube((x, 0, z - 0.76), (0.14, 0.16, 0.04), f"Leg_{side}_AnkleGuard", mats['white']))
+    parts.append(cube((x, 0, z - 0.76), (0.14, 0.16, 0.04), f"Leg_{side}_AnkleGuard", white))
 
     # Foot base (white)
-    parts.append(cube((x, -0.06, z - 0.84), (0.12, 0.22, 0.08), f"Leg_{side}_Foot", mats['white']))
+    parts.append(cube((x, -0.06, z - 0.84), (0.12, 0.22, 0.08), f"Leg_{side}_Foot", white))
 
     # Toe (red)
-    parts.append(cube((x, -0.16, z - 0.84), (0.1, 0.08, 0.07), f"Leg_{side}_Toe", mats['red']))
+    parts.append(cube((x, -0.16, z - 0.84), (0.1, 0.08, 0.07), f"Leg_{side}_Toe", red))
 
     # Heel
-    parts.append(cube((x, 0.06, z - 0.84), (0.1, 0.08, 0.07), f"Leg_{side}_Heel", mats['white']))
+    parts.append(cube((x, 0.06, z - 0.84), (0.1, 0.08, 0.07), f"Leg_{side}_Heel", white))
 
     # Foot top armor
-    parts.append(cube((x, -0.04, z - 0.78), (0.1, 0.12, 0.04), f"Leg_{side}_FootTop", mats['white']))
+    parts.append(cube((x, -0.04, z - 0.78), (0.1, 0.12, 0.04), f"Leg_{side}_FootTop", white))
 
     return parts
 
@@ -403,20 +442,21 @@ def create_leg(mats, side, z):
 # ============================================================
 def create_backpack(mats, z):
     parts = []
+    white, dark_gray, light_gray = mats['white'], mats['dark_gray'], mats['light_gray']
 
     # Main backpack body
-    parts.append(cube((0, 0.16, z), (0.28, 0.12, 0.26), "Backpack_Main", mats['white']))
+    parts.append(cube((0, 0.16, z), (0.28, 0.12, 0.26), "Backpack_Main", white))
 
     # Thruster housings
     for side, x_mult in [('L', -1), ('R', 1)]:
         parts.append(cylinder((x_mult * 0.1, 0.22, z - 0.06), 0.05, 0.08, f"Backpack_Thruster_{side}",
-                              mats['dark_gray'], (math.radians(90), 0, 0)))
+                              dark_gray, (QUARTER_TURN, 0, 0)))
 
         # Wing mount points
-        parts.append(cube((x_mult * 0.12, 0.14, z + 0.1), (0.06, 0.08, 0.14), f"Backpack_WingMount_{side}", mats['light_gray']))
+        parts.append(cube((x_mult * 0.12, 0.14, z + 0.1), (0.06, 0.08, 0.14), f"Backpack_WingMount_{side}", light_gray))
 
     # Central spine
-    parts.append(cube((0, 0.2, z + 0.06), (0.08, 0.06, 0.2), "Backpack_Spine", mats['dark_gray']))
+    parts.append(cube((0, 0.2, z + 0.06), (0.08, 0.06, 0.2), "Backpack_Spine", dark_gray))
 
     return parts
 
@@ -425,6 +465,7 @@ def create_backpack(mats, z):
 # ============================================================
 def create_wing(mats, side, position, z):
     parts = []
+    dark_gray, white, red, light_gray = mats['dark_gray'], mats['white'], mats['red'], mats['light_gray']
     x_mult = 1 if side == 'right' else -1
     is_upper = position == 'upper'
 
@@ -433,19 +474,13 @@ def create_wing(mats, side, position, z):
     z_offset = 0.12 if is_upper else -0.08
 
     # Wing angles - spread out dramatically
-    y_angle = x_mult * math.radians(30 if is_upper else 20)
-    x_angle = math.radians(-25 if is_upper else 15)
+    x_angle, y_angle = WING_SPREAD[position]
+    y_angle *= x_mult
 
     # Wing mount/arm
     mount_len = 0.2
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(x_base + x_mult * 0.08, y_base + 0.12, z + z_offset))
-    mount = bpy.context.active_object
-    mount.name = f"Wing_{side}_{position}_Mount"
-    mount.scale = (0.04, mount_len/2, 0.05)
-    mount.rotation_euler = (x_angle * 0.5, y_angle * 0.5, 0)
-    bpy.ops.object.transform_apply(rotation=True, scale=True)
-    apply_mat(mount, mats['dark_gray'])
-    parts.append(mount)
+    parts.append(box((x_base + x_mult * 0.08, y_base + 0.12, z + z_offset), (0.04, mount_len/2, 0.05),
+                     f"Wing_{side}_{position}_Mount", dark_gray, (x_angle * 0.5, y_angle * 0.5, 0)))
 
     # Main wing blade (WHITE) - MASSIVE
     blade_len = 0.7  # Very long
@@ -454,41 +489,42 @@ def create_wing(mats, side, position, z):
     blade_y = y_base + 0.35
     blade_z = z + z_offset + (0.15 if is_upper else -0.05)
 
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(blade_x, blade_y, blade_z))
-    blade = bpy.context.active_object
-    blade.name = f"Wing_{side}_{position}_Blade"
-    blade.scale = (0.03, blade_len/2, blade_width/2)
-    blade.rotation_euler = (x_angle, y_angle, 0)
-    bpy.ops.object.transform_apply(rotation=True, scale=True)
-    add_bevel(blade, 0.005)
-    apply_mat(blade, mats['white'])
-    parts.append(blade)
+    parts.append(box((blade_x, blade_y, blade_z), (0.03, blade_len/2, blade_width/2),
+                     f"Wing_{side}_{position}_Blade", white, (x_angle, y_angle, 0), bevel=0.005))
 
     # Red section on wing (inner edge)
     red_x = blade_x + x_mult * 0.02
     red_y = blade_y - 0.08
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(red_x, red_y, blade_z))
-    red_part = bpy.context.active_object
-    red_part.name = f"Wing_{side}_{position}_Red"
-    red_part.scale = (0.025, blade_len * 0.35, blade_width * 0.4)
-    red_part.rotation_euler = (x_angle, y_angle, 0)
-    bpy.ops.object.transform_apply(rotation=True, scale=True)
-    apply_mat(red_part, mats['red'])
-    parts.append(red_part)
+    parts.append(box((red_x, red_y, blade_z), (0.025, blade_len * 0.35, blade_width * 0.4),
+                     f"Wing_{side}_{position}_Red", red, (x_angle, y_angle, 0)))
 
     # Wing tip detail
     tip_y = blade_y + blade_len * 0.4
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(blade_x - x_mult * 0.01, tip_y, blade_z))
-    tip = bpy.context.active_object
-    tip.name = f"Wing_{side}_{position}_Tip"
-    tip.scale = (0.02, 0.1, blade_width * 0.35)
-    tip.rotation_euler = (x_angle, y_angle, 0)
-    bpy.ops.object.transform_apply(rotation=True, scale=True)
-    apply_mat(tip, mats['light_gray'])
-    parts.append(tip)
+    parts.append(box((blade_x - x_mult * 0.01, tip_y, blade_z), (0.02, 0.1, blade_width * 0.35),
+                     f"Wing_{side}_{position}_Tip", light_gray, (x_angle, y_angle, 0)))
 
     return parts
 
+# ============================================================
+# MIRRORING
+# ============================================================
+def with_mirror(parts):
+    """Left-side twins (linked copies reflected across X) followed by the right-side parts.
+
+    Every primitive is symmetric about its own X axis, so negating the
+    location's X and the Y/Z rotation rebuilds the left side exactly,
+    without negative scale.
+    """
+    twins = []
+    for part in parts:
+        twin = part.copy()
+        twin.name = part.name.replace('_right_', '_left_')
+        twin.location.x = -part.location.x
+        twin.rotation_euler.y = -part.rotation_euler.y
+        twin.rotation_euler.z = -part.rotation_euler.z
+        twins.append(twin)
+    return twins + parts
+
 # ============================================================
 # MAIN ASSEMBLY
 # ============================================================
@@ -496,55 +532,47 @@ def generate():
     cleanup()
     mats = setup_materials()
 
-    # Vertical positions
-    foot_z = 0
-    leg_z = 0.88
-    skirt_z = 1.1
-    torso_z = 1.45
-    shoulder_z = 1.6
-    arm_z = 1.4
-    head_z = 1.85
-    backpack_z = 1.45
-
     all_parts = []
 
     print("Creating head...")
-    all_parts.extend(create_head(mats, head_z))
+    all_parts.extend(build_parts(HEAD_PARTS, mats))
 
     print("Creating torso...")
-    all_parts.extend(create_torso(mats, torso_z))
+    all_parts.extend(build_parts(TORSO_PARTS, mats))
 
     print("Creating shoulders...")
-    all_parts.extend(create_shoulder(mats, 'left', shoulder_z))
-    all_parts.extend(create_shoulder(mats, 'right', shoulder_z))
+    all_parts.extend(with_mirror(create_shoulder(mats, 'right', SHOULDER_Z)))
 
     print("Creating arms...")
-    all_parts.extend(create_arm(mats, 'left', arm_z))
-    all_parts.extend(create_arm(mats, 'right', arm_z))
+    all_parts.extend(with_mirror(create_arm(mats, 'right', ARM_Z)))
 
     print("Creating skirt...")
-    all_parts.extend(create_skirt(mats, skirt_z))
+    all_parts.extend(build_parts(SKIRT_PARTS, mats))
 
     print("Creating legs...")
-    all_parts.extend(create_leg(mats, 'left', leg_z))
-    all_parts.extend(create_leg(mats, 'right', leg_z))
+    all_parts.extend(with_mirror(create_leg(mats, 'right', LEG_Z)))
 
     print("Creating backpack...")
-    all_parts.extend(create_backpack(mats, backpack_z))
+    all_parts.extend(create_backpack(mats, BACKPACK_Z))
 
     print("Creating wing binders...")
-    all_parts.extend(create_wing(mats, 'left', 'upper', backpack_z))
-    all_parts.extend(create_wing(mats, 'right', 'upper', backpack_z))
-    all_parts.extend(create_wing(mats, 'left', 'lower', backpack_z))
-    all_parts.extend(create_wing(mats, 'right', 'lower', backpack_z))
-
-    # Parent all
-    bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-    parent = bpy.context.active_object
-    parent.name = ASSET_NAME
+    all_parts.extend(with_mirror(create_wing(mats, 'right', 'upper', BACKPACK_Z)))
+    all_parts.extend(with_mirror(create_wing(mats, 'right', 'lower', BACKPACK_Z)))
+
+    # Parent while nothing is in the scene yet, so no assignment touches the
+    # depsgraph; matrix_parent_inverse stays identity (no parent_set-style
+    # inversion per part), which is right with the root at the origin
+    parent = bpy.data.objects.new(ASSET_NAME, None)
     for p in all_parts:
         p.parent = parent
 
+    # Link everything, then evaluate the scene once
+    collection = bpy.context.scene.collection
+    collection.objects.link(parent)
+    for p in all_parts:
+        collection.objects.link(p)
+    bpy.context.view_layer.update()
+
     return parent, all_parts
 
 def setup_scene(target, size):
@@ -598,20 +626,23 @@ def setup_scene(target, size):
 
     return cam
 
-def render_preview(filepath, resolution=(1200, 1600)):
+def render_preview(filepath, resolution=(1200, 1600), high_quality=False):
+    """Half size, PREVIEW_SAMPLES and no AO / bloom unless high_quality."""
     scene = bpy.context.scene
     scene.render.engine = 'BLENDER_EEVEE'
+    if not high_quality:
+        scene.eevee.taa_render_samples = PREVIEW_SAMPLES
     scene.render.resolution_x = resolution[0]
     scene.render.resolution_y = resolution[1]
-    scene.render.resolution_percentage = 100
+    scene.render.resolution_percentage = 100 if high_quality else 50
     scene.render.filepath = filepath
     scene.render.image_settings.file_format = 'PNG'
 
     try:
         if hasattr(scene.eevee, 'use_gtao'):
-            scene.eevee.use_gtao = True
+            scene.eevee.use_gtao = high_quality
         if hasattr(scene.eevee, 'use_bloom'):
-            scene.eevee.use_bloom = True
+            scene.eevee.use_bloom = high_quality
     except:
         pass
 
@@ -623,25 +654,65 @@ def export_glb(filepath):
         filepath=filepath,
         export_format='GLB',
         use_selection=False,
-        export_apply=True,
+        export_apply=True,  # Bakes the live bevel modifiers; part transforms export as node TRS
+        export_draco_mesh_compression_enable=True,
+        export_draco_mesh_compression_level=6,
+        export_image_format='NONE',  # Flat colours only; nothing to encode
         export_yup=True,
     )
     print(f"EXPORTED_GLB: {filepath}")
 
+def start_export_worker(filepath):
+    """Save the built model and export it from a second background Blender.
+
+    Returns (process, saved .blend). The copy is taken before setup_scene,
+    which adds nothing the GLB export includes.
+    """
+    blend = os.path.join(tempfile.gettempdir(), f"{ASSET_NAME}_{os.getpid()}_export.blend")
+    bpy.ops.wm.save_as_mainfile(filepath=blend, copy=True)
+    cmd = [
+        bpy.app.binary_path, "-b", blend, "-t", "1",  # One thread; the render gets the rest
+        "--python", os.path.abspath(__file__), "--python-exit-code", "1",
+        "--", f"export_glb={filepath}",
+    ]
+    return subprocess.Popen(cmd), blend
+
 def main():
     args = parse_args()
     output_dir = args.get("output", OUTPUT_DIR)
 
+    if "export_glb" in args:
+        # Export worker: the saved model is already loaded
+        export_glb(args["export_glb"])
+        return
+
     try:
         parent, parts = generate()
-        target = (0, 0, 1.2)
-        setup_scene(target, 2.0)
-
-        preview_path = f"{output_dir}/{ASSET_NAME}_preview.png"
-        render_preview(preview_path)
-
         glb_path = f"{output_dir}/{ASSET_NAME}.glb"
-        export_glb(glb_path)
+        worker = None
+        if args.get("export_worker", "1") != "0":
+            worker, blend = start_export_worker(glb_path)
+
+        try:
+            target = (0, 0, 1.2)
+            setup_scene(target, 2.0)
+
+            preview_path = f"{output_dir}/{ASSET_NAME}_preview.png"
+            render_preview(preview_path, high_quality=args.get("high_quality", "0") != "0")
+        except BaseException:
+            if worker is not None:
+                worker.terminate()  # No point finishing a GLB for a failed run
+            raise
+        finally:
+            # Never leave the worker running or its .blend behind
+            if worker is not None:
+                code = worker.wait()
+                os.remove(blend)
+
+        if worker is None:
+            export_glb(glb_path)
+        elif code != 0:
+            raise RuntimeError(f"GLB export worker exited {code}")
 
         info = {
             "status": "success",
@@ -2,16 +2,20 @@
 """
 God Gundam (Burning Gundam) 3D Model Generator - Version 3
 Fixed geometry without problematic modifiers
-Run: blender -b --python god_gundam_v3.py --python-exit-code 1 -- output=/tmp
+Run: blender -b --python god_gundam_v3.py --python-exit-code 1 -- output=/tmp [merge=0]
+     [preview=0] [preview_samples=16] [effects=1]
 """
 import bpy
 import sys
 import json
 import math
-from mathutils import Vector
+from functools import lru_cache, partial
+import numpy as np
+from mathutils import Euler, Matrix, Vector
 
 OUTPUT_DIR = "/tmp"
 ASSET_NAME = "GodGundam_v3"
+PREVIEW_SAMPLES = 16  # EEVEE default is 64; plenty for a flat-shaded preview
 
 # Color palette
 COLORS = {
@@ -27,6 +31,22 @@ COLORS = {
     'black': (0.015, 0.015, 0.015),
 }
 
+# Cube corners at +-1 and its quads, wound outward
+CUBE_VERTS = np.array([
+    (-1, -1, -1), (-1, -1, 1), (-1, 1, -1), (-1, 1, 1),
+    (1, -1, -1), (1, -1, 1), (1, 1, -1), (1, 1, 1),
+], dtype=np.float32)
+CUBE_FACES = [
+    (0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1),
+    (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3),
+]
+CYL_VERTS = 32  # primitive_cylinder_add default
+CONE_VERTS = 4  # V-fins are diamond pyramids
+
+# Unit meshes shared by every part of that shape, which differ only in
+# their object transform and material
+UNIT_MESHES = {}
+
 def parse_args():
     argv = sys.argv
     if "--" in argv:
@@ -42,11 +62,15 @@ def parse_args():
 
 def cleanup():
     bpy.ops.wm.read_factory_settings(use_empty=True)
-
-def create_material(name, color, roughness=0.4, metallic=0.3, emission=0.0):
-    mat = bpy.data.materials.new(name)
-    mat.use_nodes = True
-    bsdf = mat.node_tree.nodes.get("Principled BSDF")
+    UNIT_MESHES.clear()  # Freed along with the rest of the old file
+    # Factory settings turn global undo back on; no undo steps while building
+    bpy.context.preferences.edit.use_global_undo = False
+
+def create_material(proto, name, color, roughness=0.4, metallic=0.3, emission=0.0):
+    # A copy of proto's default node tree, rather than building one per material
+    mat = proto.copy()
+    mat.name = name
+    bsdf = mat.node_tree.nodes["Principled BSDF"]
     bsdf.inputs["Base Color"].default_value = (*color, 1.0)
     bsdf.inputs["Roughness"].default_value = roughness
     bsdf.inputs["Metallic"].default_value = metallic
@@ -56,416 +80,417 @@ def create_material(name, color, roughness=0.4, metallic=0.3, emission=0.0):
     return mat
 
 def setup_materials():
+    proto = bpy.data.materials.new("GG_Proto")
+    proto.use_nodes = True
+    new = partial(create_material, proto)
+
     mats = {}
-    mats['white'] = create_material("GG_White", COLORS['white'], roughness=0.25, metallic=0.15)
-    mats['light_gray'] = create_material("GG_LightGray", COLORS['light_gray'], roughness=0.35, metallic=0.25)
-    mats['dark_gray'] = create_material("GG_DarkGray", COLORS['dark_gray'], roughness=0.45, metallic=0.35)
-    mats['blue'] = create_material("GG_Blue", COLORS['blue'], roughness=0.25, metallic=0.25)
-    mats['dark_blue'] = create_material("GG_DarkBlue", COLORS['dark_blue'], roughness=0.35, metallic=0.25)
-    mats['red'] = create_material("GG_Red", COLORS['red'], roughness=0.25, metallic=0.15)
-    mats['gold'] = create_material("GG_Gold", COLORS['gold'], roughness=0.15, metallic=0.85)
-    mats['orange'] = create_material("GG_Orange", COLORS['orange'], roughness=0.25, metallic=0.15, emission=0.8)
-    mats['green'] = create_material("GG_Green", COLORS['green'], roughness=0.08, metallic=0.05, emission=3.0)
-    mats['black'] = create_material("GG_Black", COLORS['black'], roughness=0.55, metallic=0.3)
+    mats['white'] = new("GG_White", COLORS['white'], roughness=0.25, metallic=0.15)
+    mats['light_gray'] = new("GG_LightGray", COLORS['light_gray'], roughness=0.35, metallic=0.25)
+    mats['dark_gray'] = new("GG_DarkGray", COLORS['dark_gray'], roughness=0.45, metallic=0.35)
+    mats['blue'] = new("GG_Blue", COLORS['blue'], roughness=0.25, metallic=0.25)
+    mats['dark_blue'] = new("GG_DarkBlue", COLORS['dark_blue'], roughness=0.35, metallic=0.25)
+    mats['red'] = new("GG_Red", COLORS['red'], roughness=0.25, metallic=0.15)
+    mats['gold'] = new("GG_Gold", COLORS['gold'], roughness=0.15, metallic=0.85)
+    mats['orange'] = new("GG_Orange", COLORS['orange'], roughness=0.25, metallic=0.15, emission=0.8)
+    mats['green'] = new("GG_Green", COLORS['green'], roughness=0.08, metallic=0.05, emission=3.0)
+    mats['black'] = new("GG_Black", COLORS['black'], roughness=0.55, metallic=0.3)
+    bpy.data.materials.remove(proto)
     return mats
 
-def apply_mat(obj, mat):
-    if obj.data.materials:
-        obj.data.materials[0] = mat
+def frustum(verts, r2):
+    """Depth 1 cone around Z, radius 1 at the bottom and r2 at the top.
+
+    Laid out as primitive_cone_add does (first vertex on +Y), so a 4-vertex
+    one is the same diamond pyramid: side quads plus two n-gon caps.
+    """
+    phi = np.arange(verts) * (2 * math.pi / verts)
+    ring = np.column_stack([-np.sin(phi), np.cos(phi)])
+    co = np.concatenate([
+        np.column_stack([ring, np.full(verts, -0.5)]),
+        np.column_stack([ring * r2, np.full(verts, 0.5)]),
+    ])
+    faces = [(i, (i + 1) % verts, verts + (i + 1) % verts, verts + i) for i in range(verts)]
+    faces.append(tuple(range(verts - 1, -1, -1)))
+    faces.append(tuple(range(verts, 2 * verts)))
+    return co, faces
+
+def ico_sphere(subdivisions=1):
+    """Radius 1 icosphere as primitive_ico_sphere_add: 42 verts / 80 tris at 1."""
+    t = (1 + math.sqrt(5)) / 2
+    co = [(-1, t, 0), (1, t, 0), (-1, -t, 0), (1, -t, 0),
+          (0, -1, t), (0, 1, t), (0, -1, -t), (0, 1, -t),
+          (t, 0, -1), (t, 0, 1), (-t, 0, -1), (-t, 0, 1)]
+    co = [tuple(np.array(v) / np.linalg.norm(v)) for v in co]
+    faces = [(0, 11, 5), (0, 5, 1), (0, 1, 7), (0, 7, 10), (0, 10, 11),
+             (1, 5, 9), (5, 11, 4), (11, 10, 2), (10, 7, 6), (7, 1, 8),
+             (3, 9, 4), (3, 4, 2), (3, 2, 6), (3, 6, 8), (3, 8, 9),
+             (4, 9, 5), (2, 4, 11), (6, 2, 10), (8, 6, 7), (9, 8, 1)]
+
+    for _ in range(subdivisions):
+        midpoints = {}
+
+        def midpoint(a, b):
+            key = (min(a, b), max(a, b))
+            if key not in midpoints:
+                m = (np.array(co[a]) + co[b]) / 2
+                co.append(tuple(m / np.linalg.norm(m)))
+                midpoints[key] = len(co) - 1
+            return midpoints[key]
+
+        split = []
+        for a, b, c in faces:
+            ab, bc, ca = midpoint(a, b), midpoint(b, c), midpoint(c, a)
+            split += [(a, ab, ca), (b, bc, ab), (c, ca, bc), (ab, bc, ca)]
+        faces = split
+    return np.array(co), faces
+
+@lru_cache(maxsize=None)
+def unit_geometry(key):
+    """(co, sizes, indices) for ('cube',), ('frustum', verts, r2) or ('sphere',).
+
+    sizes = corners per face, indices = every face's vertices back to back.
+    Read-only: shared by every part of that shape.
+    """
+    if key[0] == 'cube':
+        co, faces = CUBE_VERTS * 0.5, CUBE_FACES
+    elif key[0] == 'frustum':
+        co, faces = frustum(*key[1:])
     else:
-        obj.data.materials.append(mat)
-
-def cube(loc, scale, name, mat):
-    """Create a simple cube with no modifiers."""
-    bpy.ops.mesh.primitive_cube_add(size=1, location=loc)
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.scale = (scale[0]/2, scale[1]/2, scale[2]/2)
-    bpy.ops.object.transform_apply(scale=True)
-    apply_mat(obj, mat)
-    return obj
-
-def cube_rot(loc, scale, rotation, name, mat):
-    """Create cube with rotation applied."""
-    bpy.ops.mesh.primitive_cube_add(size=1, location=loc)
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.scale = (scale[0]/2, scale[1]/2, scale[2]/2)
-    obj.rotation_euler = rotation
-    bpy.ops.object.transform_apply(rotation=True, scale=True)
-    apply_mat(obj, mat)
-    return obj
-
-def cylinder(loc, radius, depth, name, mat, rotation=(0, 0, 0)):
-    bpy.ops.mesh.primitive_cylinder_add(radius=radius, depth=depth, location=loc)
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.rotation_euler = rotation
-    bpy.ops.object.transform_apply(rotation=True)
-    apply_mat(obj, mat)
-    return obj
-
-def cone(loc, r1, r2, depth, name, mat, rotation=(0, 0, 0), verts=4):
-    bpy.ops.mesh.primitive_cone_add(vertices=verts, radius1=r1, radius2=r2, depth=depth, location=loc)
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.rotation_euler = rotation
-    bpy.ops.object.transform_apply(rotation=True)
-    apply_mat(obj, mat)
+        co, faces = ico_sphere()
+    arrays = (
+        np.asarray(co, dtype=np.float32),
+        np.array([len(f) for f in faces], dtype=np.int32),
+        np.array([v for f in faces for v in f], dtype=np.int32),
+    )
+    for a in arrays:
+        a.flags.writeable = False
+    return arrays
+
+def part_shape(kind, size):
+    """Unit geometry key and scale for a PARTS_TABLE row."""
+    if kind == 'cube':
+        # Cube sizes are twice the box, as primitive_cube_add(size=1) scaled by size / 2 was
+        return ('cube',), tuple(s / 2 for s in size)
+    if kind == 'cylinder':
+        radius, depth = size
+        return ('frustum', CYL_VERTS, 1.0), (radius, radius, depth)
+    if kind == 'cone':
+        # Cones of the same taper (all three V-fins) share one shape
+        r1, r2, depth = size
+        return ('frustum', CONE_VERTS, round(r2 / r1, 4)), (r1, r1, depth)
+    (radius,) = size
+    return ('sphere',), (radius, radius, radius)
+
+def euler_matrix(rotation):
+    """(..., 3, 3) matrices of (..., 3) XYZ Euler angles, as mathutils.Euler(rotation).to_matrix()."""
+    (cx, cy, cz), (sx, sy, sz) = np.moveaxis(np.cos(rotation), -1, 0), np.moveaxis(np.sin(rotation), -1, 0)
+    rows = (
+        (cy * cz, sx * sy * cz - cx * sz, cx * sy * cz + sx * sz),
+        (cy * sz, sx * sy * sz + cx * cz, cx * sy * sz - sx * cz),
+        (-sy, sx * cy, cx * cy),
+    )
+    return np.stack([np.stack(row, axis=-1) for row in rows], axis=-2).astype(np.float32)
+
+def fill_mesh(mesh, co, sizes, indices):
+    """Write geometry straight into an empty mesh's buffers (no list walk as in from_pydata)."""
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(co, dtype=np.float32).ravel())
+    mesh.loops.add(len(indices))
+    mesh.polygons.add(len(sizes))
+    mesh.polygons.foreach_set("loop_start", (np.cumsum(sizes) - sizes).astype(np.int32))
+    mesh.loops.foreach_set("vertex_index", np.asarray(indices, dtype=np.int32))
+    mesh.update(calc_edges=True)
+
+def unit_mesh(key):
+    """Shared mesh for a unit_geometry() key, built on first use."""
+    if key not in UNIT_MESHES:
+        mesh = bpy.data.meshes.new("Unit_" + "_".join(str(k) for k in key))
+        fill_mesh(mesh, *unit_geometry(key))
+        mesh.materials.append(None)  # One slot, filled per object
+        UNIT_MESHES[key] = mesh
+    return UNIT_MESHES[key]
+
+# Parts are created unlinked; generate() links them all in one pass
+def instance(name, mesh, loc, scale, rotation, mat):
+    """Object using a shared mesh; its material lives on the object.
+
+    Rotation and scale stay on the object and export as glTF node transforms.
+    """
+    obj = bpy.data.objects.new(name, mesh)
+    obj.matrix_basis = Matrix.LocRotScale(loc, Euler(rotation), scale)  # One write for all three
+    slot = obj.material_slots[0]
+    slot.link = 'OBJECT'
+    slot.material = mat
     return obj
 
-# ============================================================
-# HEAD
-# ============================================================
-def create_head(mats, z):
-    parts = []
-
-    # Main helmet
-    parts.append(cube((0, 0, z), (0.28, 0.26, 0.2), "Head_Helmet", mats['white']))
-
-    # Face plate (blue)
-    parts.append(cube((0, -0.11, z - 0.02), (0.18, 0.06, 0.12), "Head_Face", mats['blue']))
-
-    # Visor (green, glowing)
-    parts.append(cube((0, -0.14, z + 0.01), (0.16, 0.02, 0.04), "Head_Visor", mats['green']))
-
-    # Chin guard (red)
-    parts.append(cube((0, -0.12, z - 0.08), (0.1, 0.04, 0.04), "Head_Chin", mats['red']))
-
-    # V-Fin center (gold) - BIG
-    parts.append(cone((0, -0.04, z + 0.2), 0.025, 0.005, 0.25,
-                      "Head_VFin_Center", mats['gold'], (math.radians(-20), 0, 0)))
-
-    # V-Fin left
-    parts.append(cone((-0.12, -0.02, z + 0.18), 0.02, 0.004, 0.3,
-                      "Head_VFin_L", mats['gold'], (math.radians(-35), math.radians(-40), 0)))
-
-    # V-Fin right
-    parts.append(cone((0.12, -0.02, z + 0.18), 0.02, 0.004, 0.3,
-                      "Head_VFin_R", mats['gold'], (math.radians(-35), math.radians(40), 0)))
-
-    # Forehead crest
-    parts.append(cube((0, 0.02, z + 0.12), (0.02, 0.1, 0.06), "Head_Crest", mats['white']))
-
-    # Side vents
-    for side, x in [('L', -0.12), ('R', 0.12)]:
-        parts.append(cube((x, 0, z), (0.05, 0.15, 0.1), f"Head_SideVent_{side}", mats['light_gray']))
-
-    return parts
-
-# ============================================================
-# TORSO
-# ============================================================
-def create_torso(mats, z):
-    parts = []
-
-    # Main chest core (blue)
-    parts.append(cube((0, 0, z), (0.4, 0.28, 0.32), "Torso_Chest", mats['blue']))
-
-    # Upper chest plate (white collar)
-    parts.append(cube((0, -0.02, z + 0.18), (0.35, 0.14, 0.1), "Torso_Collar", mats['white']))
-
-    # Center cockpit (red)
-    parts.append(cube((0, -0.14, z + 0.04), (0.14, 0.04, 0.16), "Torso_Cockpit", mats['red']))
-
-    # Chest vents (orange/gold)
-    for side, x in [('L', -0.12), ('R', 0.12)]:
-        parts.append(cube((x, -0.14, z + 0.08), (0.08, 0.04, 0.12), f"Torso_Vent_{side}", mats['orange']))
-        for i, vz in enumerate([-0.02, 0.02, 0.06]):
-            parts.append(cube((x, -0.16, z + vz), (0.06, 0.01, 0.02), f"Torso_VentSlat_{side}_{i}", mats['gold']))
-
-    # Chest gem (green center)
-    parts.append(cube((0, -0.15, z + 0.12), (0.06, 0.02, 0.06), "Torso_ChestGem", mats['green']))
-
-    # Neck area
-    parts.append(cylinder((0, 0, z + 0.24), 0.06, 0.08, "Torso_Neck", mats['dark_gray']))
-
-    # Waist core
-    parts.append(cube((0, 0, z - 0.22), (0.28, 0.2, 0.12), "Torso_Waist", mats['dark_gray']))
-
-    # Abdominal armor (red)
-    parts.append(cube((0, -0.08, z - 0.08), (0.16, 0.06, 0.12), "Torso_Abdomen", mats['red']))
-
-    return parts
-
-# ============================================================
-# SHOULDERS - MASSIVE
-# ============================================================
-def create_shoulder(mats, side, z):
-    parts = []
-    x_mult = 1 if side == 'right' else -1
-    x = x_mult * 0.32
-
-    # Inner shoulder joint
-    parts.append(cube((x, 0, z), (0.12, 0.14, 0.14), f"Shoulder_{side}_Joint", mats['dark_gray']))
-
-    # Main shoulder armor block (white) - HUGE
-    armor_x = x + x_mult * 0.12
-    parts.append(cube((armor_x, 0, z + 0.08), (0.22, 0.36, 0.28), f"Shoulder_{side}_MainArmor", mats['white']))
-
-    # Upper shoulder plate - angled outward
-    upper_x = x + x_mult * 0.18
-    parts.append(cube_rot((upper_x, 0, z + 0.2), (0.28, 0.4, 0.22),
-                          (0, x_mult * math.radians(-20), 0), f"Shoulder_{side}_Upper", mats['white']))
-
-    # Red trim on top
-    parts.append(cube_rot((upper_x + x_mult * 0.04, 0, z + 0.32), (0.2, 0.38, 0.04),
-                          (0, x_mult * math.radians(-20), 0), f"Shoulder_{side}_RedTop", mats['red']))
-
-    # Red front edge
-    parts.append(cube((armor_x, -0.16, z + 0.08), (0.18, 0.04, 0.2), f"Shoulder_{side}_RedFront", mats['red']))
-
-    # Black vents underneath
-    for i, vy in enumerate([-0.08, 0, 0.08]):
-        parts.append(cube((x, vy, z - 0.08), (0.1, 0.06, 0.06), f"Shoulder_{side}_Vent_{i}", mats['black']))
-
-    # Gold accent
-    parts.append(cube((armor_x - x_mult * 0.06, -0.1, z + 0.04), (0.04, 0.1, 0.08), f"Shoulder_{side}_Gold", mats['gold']))
-
-    return parts
+def part_objects(parts, mats):
+    """One object per part (merge=0), instancing the shared unit meshes."""
+    objects = []
+    for kind, name, loc, size, rotation, mat in parts:
+        key, scale = part_shape(kind, size)
+        objects.append(instance(name, unit_mesh(key), loc, scale, rotation, mats[mat]))
+    return objects
+
+def apply_transforms(co, scales, rotations, locs):
+    """(N, V, 3) copies of one unit shape, each scaled, rotated and moved by its part.
+
+    One einsum over every part sharing the shape instead of a matmul per part.
+    """
+    return np.einsum('nij,nvj->nvi', euler_matrix(rotations), co * scales[:, None]) + locs[:, None]
+
+def material_batches(parts):
+    """{material: (co, sizes, indices)}, every part of it transformed into one buffer.
+
+    Plain numpy with no bpy access, so it could run anywhere; at ~1400
+    vertices it takes well under the cost of starting a worker process.
+    """
+    shapes = {}
+    for kind, name, loc, size, rotation, mat in parts:
+        key, scale = part_shape(kind, size)
+        shapes.setdefault(key, []).append((scale, rotation, loc, mat))
+
+    groups = {}
+    for key, rows in shapes.items():
+        co, sizes, indices = unit_geometry(key)
+        scales, rotations, locs = (np.array(column, dtype=np.float32) for column in list(zip(*rows))[:3])
+        for (*_, mat), part_co in zip(rows, apply_transforms(co, scales, rotations, locs)):
+            groups.setdefault(mat, []).append((part_co, sizes, indices))
+
+    batches = {}
+    for mat, group in groups.items():
+        offsets = np.cumsum([0] + [len(co) for co, _, _ in group[:-1]])
+        co = np.concatenate([co for co, _, _ in group])
+        indices = np.concatenate([indices + offset for (_, _, indices), offset in zip(group, offsets)])
+        co, indices = optimize_vertex_fetch(co, indices)
+        batches[mat] = (co, np.concatenate([sizes for _, sizes, _ in group]), indices)
+    return batches
+
+def optimize_vertex_fetch(co, indices):
+    """Renumber vertices in order of first use, dropping unused ones.
+
+    meshoptimizer's vertex fetch pass: walking the faces then reads the
+    vertex buffer front to back. Faces already come part by part, which is
+    the locality its vertex cache pass would otherwise provide.
+    """
+    used, first = np.unique(indices, return_index=True)
+    used = used[np.argsort(first)]
+    remap = np.empty(len(co), dtype=np.int32)
+    remap[used] = np.arange(len(used), dtype=np.int32)
+    return co[used], remap[indices]
+
+def model_object(parts, mats):
+    """The whole model as one mesh, with a material slot per color used.
+
+    ~125 parts become one glTF node whose mesh has a primitive per
+    material, with no per-part datablocks on the way.
+    """
+    batches = material_batches(parts)
+    offsets = np.cumsum([0] + [len(co) for co, _, _ in batches.values()][:-1])
+    co = np.concatenate([co for co, _, _ in batches.values()])
+    sizes = np.concatenate([sizes for _, sizes, _ in batches.values()])
+    indices = np.concatenate([indices + offset for (_, _, indices), offset in zip(batches.values(), offsets)])
+    slots = np.repeat(np.arange(len(batches), dtype=np.int32), [len(sizes) for _, sizes, _ in batches.values()])
+
+    mesh = bpy.data.meshes.new(ASSET_NAME)
+    fill_mesh(mesh, co, sizes, indices)
+    mesh.polygons.foreach_set("material_index", slots)
+    for mat in batches:
+        mesh.materials.append(mats[mat])
+    return [bpy.data.objects.new(f"{ASSET_NAME}_Mesh", mesh)]
 
 # ============================================================
-# ARMS
+# PARTS TABLE
 # ============================================================
-def create_arm(mats, side, z):
-    parts = []
-    x_mult = 1 if side == 'right' else -1
-    x = x_mult * 0.4
-
-    # Upper arm (blue)
-    parts.append(cube((x, 0, z), (0.12, 0.14, 0.24), f"Arm_{side}_Upper", mats['blue']))
-
-    # Upper arm armor (white panel)
-    parts.append(cube((x + x_mult * 0.04, -0.04, z), (0.06, 0.1, 0.18), f"Arm_{side}_UpperArmor", mats['white']))
-
-    # Elbow joint
-    parts.append(cylinder((x, 0, z - 0.16), 0.06, 0.08, f"Arm_{side}_Elbow", mats['dark_gray'], (0, math.radians(90), 0)))
-
-    # Forearm (white)
-    parts.append(cube((x, 0, z - 0.36), (0.11, 0.13, 0.22), f"Arm_{side}_Forearm", mats['white']))
-
-    # Forearm armor plate
-    parts.append(cube((x + x_mult * 0.06, -0.02, z - 0.34), (0.05, 0.1, 0.18), f"Arm_{side}_ForearmArmor", mats['white']))
-
-    # Gold accent on arm
-    parts.append(cube((x, -0.08, z - 0.3), (0.06, 0.02, 0.1), f"Arm_{side}_Gold", mats['gold']))
-
-    # Hand (dark gray, fist)
-    parts.append(cube((x, -0.02, z - 0.52), (0.08, 0.1, 0.1), f"Arm_{side}_Hand", mats['dark_gray']))
-
-    # Fingers
-    for i, fx in enumerate([-0.025, 0, 0.025]):
-        parts.append(cube((x + fx, -0.07, z - 0.55), (0.018, 0.04, 0.06), f"Arm_{side}_Finger_{i}", mats['dark_gray']))
-
-    # Thumb
-    parts.append(cube((x + x_mult * 0.04, -0.04, z - 0.54), (0.02, 0.035, 0.05), f"Arm_{side}_Thumb", mats['dark_gray']))
-
-    return parts
-
-# ============================================================
-# SKIRT ARMOR
-# ============================================================
-def create_skirt(mats, z):
-    parts = []
-
+# Section heights
+HEAD_Z = 1.85
+SHOULDER_Z = 1.6
+TORSO_Z = 1.45
+BACKPACK_Z = 1.45
+ARM_Z = 1.4
+SKIRT_Z = 1.1
+LEG_Z = 0.88
+
+NO_ROT = (0, 0, 0)
+LR = ('L', 'R')
+LEFT_RIGHT = ('left', 'right')
+
+# (kind, name, loc, size, rotation, material, sides). rotation is XYZ Euler
+# degrees; size is (x, y, z) for a cube, (radius, depth) for a cylinder,
+# (r1, r2, depth) for a cone and (radius,) for a sphere. Rows with sides
+# describe the right-hand part (+X); expand_parts() mirrors them onto the
+# left, filling {side} in the name.
+HEAD_PARTS = [
+    ('cube', "Head_Helmet", (0, 0, HEAD_Z), (0.28, 0.26, 0.2), NO_ROT, 'white', None),
+    ('cube', "Head_Face", (0, -0.11, HEAD_Z - 0.02), (0.18, 0.06, 0.12), NO_ROT, 'blue', None),
+    ('cube', "Head_Visor", (0, -0.14, HEAD_Z + 0.01), (0.16, 0.02, 0.04), NO_ROT, 'green', None),  # Glowing
+    ('cube', "Head_Chin", (0, -0.12, HEAD_Z - 0.08), (0.1, 0.04, 0.04), NO_ROT, 'red', None),
+    # V-Fin - BIG
+    ('cone', "Head_VFin_Center", (0, -0.04, HEAD_Z + 0.2), (0.025, 0.005, 0.25),
+     (-20, 0, 0), 'gold', None),
+    ('cone', "Head_VFin_{side}", (0.12, -0.02, HEAD_Z + 0.18), (0.02, 0.004, 0.3),
+     (-35, 40, 0), 'gold', LR),
+    ('cube', "Head_Crest", (0, 0.02, HEAD_Z + 0.12), (0.02, 0.1, 0.06), NO_ROT, 'white', None),
+    ('cube', "Head_SideVent_{side}", (0.12, 0, HEAD_Z), (0.05, 0.15, 0.1), NO_ROT, 'light_gray', LR),
+]
+
+TORSO_PARTS = [
+    ('cube', "Torso_Chest", (0, 0, TORSO_Z), (0.4, 0.28, 0.32), NO_ROT, 'blue', None),
+    ('cube', "Torso_Collar", (0, -0.02, TORSO_Z + 0.18), (0.35, 0.14, 0.1), NO_ROT, 'white', None),
+    ('cube', "Torso_Cockpit", (0, -0.14, TORSO_Z + 0.04), (0.14, 0.04, 0.16), NO_ROT, 'red', None),
+    # Chest vents
+    ('cube', "Torso_Vent_{side}", (0.12, -0.14, TORSO_Z + 0.08), (0.08, 0.04, 0.12), NO_ROT, 'orange', LR),
+    *[('cube', f"Torso_VentSlat_{{side}}_{i}", (0.12, -0.16, TORSO_Z + vz), (0.06, 0.01, 0.02), NO_ROT, 'gold', LR)
+      for i, vz in enumerate([-0.02, 0.02, 0.06])],
+    ('cube', "Torso_ChestGem", (0, -0.15, TORSO_Z + 0.12), (0.06, 0.02, 0.06), NO_ROT, 'green', None),
+    ('cylinder', "Torso_Neck", (0, 0, TORSO_Z + 0.24), (0.06, 0.08), NO_ROT, 'dark_gray', None),
+    ('cube', "Torso_Waist", (0, 0, TORSO_Z - 0.22), (0.28, 0.2, 0.12), NO_ROT, 'dark_gray', None),
+    ('cube', "Torso_Abdomen", (0, -0.08, TORSO_Z - 0.08), (0.16, 0.06, 0.12), NO_ROT, 'red', None),
+]
+
+# Shoulders - MASSIVE: joint at x 0.32, armor block at 0.44, angled plates at 0.5
+SHOULDER_PARTS = [
+    ('cube', "Shoulder_{side}_Joint", (0.32, 0, SHOULDER_Z), (0.12, 0.14, 0.14), NO_ROT, 'dark_gray', LEFT_RIGHT),
+    ('cube', "Shoulder_{side}_MainArmor", (0.44, 0, SHOULDER_Z + 0.08), (0.22, 0.36, 0.28), NO_ROT, 'white', LEFT_RIGHT),
+    ('cube', "Shoulder_{side}_Upper", (0.5, 0, SHOULDER_Z + 0.2), (0.28, 0.4, 0.22),
+     (0, -20, 0), 'white', LEFT_RIGHT),
+    ('cube', "Shoulder_{side}_RedTop", (0.54, 0, SHOULDER_Z + 0.32), (0.2, 0.38, 0.04),
+     (0, -20, 0), 'red', LEFT_RIGHT),
+    ('cube', "Shoulder_{side}_RedFront", (0.44, -0.16, SHOULDER_Z + 0.08), (0.18, 0.04, 0.2), NO_ROT, 'red', LEFT_RIGHT),
+    *[('cube', f"Shoulder_{{side}}_Vent_{i}", (0.32, vy, SHOULDER_Z - 0.08), (0.1, 0.06, 0.06), NO_ROT, 'black', LEFT_RIGHT)
+      for i, vy in enumerate([-0.08, 0, 0.08])],
+    ('cube', "Shoulder_{side}_Gold", (0.38, -0.1, SHOULDER_Z + 0.04), (0.04, 0.1, 0.08), NO_ROT, 'gold', LEFT_RIGHT),
+]
+
+ARM_PARTS = [
+    ('cube', "Arm_{side}_Upper", (0.4, 0, ARM_Z), (0.12, 0.14, 0.24), NO_ROT, 'blue', LEFT_RIGHT),
+    ('cube', "Arm_{side}_UpperArmor", (0.44, -0.04, ARM_Z), (0.06, 0.1, 0.18), NO_ROT, 'white', LEFT_RIGHT),
+    ('cylinder', "Arm_{side}_Elbow", (0.4, 0, ARM_Z - 0.16), (0.06, 0.08), (0, 90, 0), 'dark_gray', LEFT_RIGHT),
+    ('cube', "Arm_{side}_Forearm", (0.4, 0, ARM_Z - 0.36), (0.11, 0.13, 0.22), NO_ROT, 'white', LEFT_RIGHT),
+    ('cube', "Arm_{side}_ForearmArmor", (0.46, -0.02, ARM_Z - 0.34), (0.05, 0.1, 0.18), NO_ROT, 'white', LEFT_RIGHT),
+    ('cube', "Arm_{side}_Gold", (0.4, -0.08, ARM_Z - 0.3), (0.06, 0.02, 0.1), NO_ROT, 'gold', LEFT_RIGHT),
+    ('cube', "Arm_{side}_Hand", (0.4, -0.02, ARM_Z - 0.52), (0.08, 0.1, 0.1), NO_ROT, 'dark_gray', LEFT_RIGHT),  # Fist
+    *[('cube', f"Arm_{{side}}_Finger_{i}", (0.4 + fx, -0.07, ARM_Z - 0.55), (0.018, 0.04, 0.06), NO_ROT, 'dark_gray', LEFT_RIGHT)
+      for i, fx in enumerate([-0.025, 0, 0.025])],
+    ('cube', "Arm_{side}_Thumb", (0.44, -0.04, ARM_Z - 0.54), (0.02, 0.035, 0.05), NO_ROT, 'dark_gray', LEFT_RIGHT),
+]
+
+SKIRT_PARTS = [
     # Front center panel (white with blue)
-    parts.append(cube_rot((0, -0.16, z), (0.12, 0.03, 0.2),
-                          (math.radians(20), 0, 0), "Skirt_FrontCenter", mats['white']))
-    parts.append(cube_rot((0, -0.18, z - 0.04), (0.08, 0.02, 0.1),
-                          (math.radians(20), 0, 0), "Skirt_FrontCenterBlue", mats['blue']))
-
+    ('cube', "Skirt_FrontCenter", (0, -0.16, SKIRT_Z), (0.12, 0.03, 0.2), (20, 0, 0), 'white', None),
+    ('cube', "Skirt_FrontCenterBlue", (0, -0.18, SKIRT_Z - 0.04), (0.08, 0.02, 0.1), (20, 0, 0), 'blue', None),
     # Front side panels
-    for side, x_mult in [('L', -1), ('R', 1)]:
-        parts.append(cube_rot((x_mult * 0.12, -0.14, z), (0.1, 0.03, 0.22),
-                              (math.radians(25), x_mult * math.radians(-15), 0), f"Skirt_FrontSide_{side}", mats['white']))
-        parts.append(cube_rot((x_mult * 0.12, -0.16, z - 0.06), (0.07, 0.02, 0.1),
-                              (math.radians(25), x_mult * math.radians(-15), 0), f"Skirt_FrontSideBlue_{side}", mats['blue']))
-
+    ('cube', "Skirt_FrontSide_{side}", (0.12, -0.14, SKIRT_Z), (0.1, 0.03, 0.22),
+     (25, -15, 0), 'white', LR),
+    ('cube', "Skirt_FrontSideBlue_{side}", (0.12, -0.16, SKIRT_Z - 0.06), (0.07, 0.02, 0.1),
+     (25, -15, 0), 'blue', LR),
     # Side skirt armor (large panels)
-    for side, x_mult in [('L', -1), ('R', 1)]:
-        parts.append(cube((x_mult * 0.22, 0, z - 0.04), (0.06, 0.2, 0.28), f"Skirt_Side_{side}", mats['white']))
-        parts.append(cube((x_mult * 0.24, 0, z - 0.08), (0.03, 0.14, 0.18), f"Skirt_SideBlue_{side}", mats['blue']))
-
-    # Rear skirt
-    parts.append(cube((0, 0.14, z - 0.04), (0.22, 0.04, 0.24), "Skirt_Rear", mats['white']))
-
-    return parts
-
-# ============================================================
-# LEGS
-# ============================================================
-def create_leg(mats, side, z):
-    parts = []
-    x_mult = 1 if side == 'right' else -1
-    x = x_mult * 0.14
-
-    # Hip ball joint
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.07, location=(x, 0, z + 0.1))
-    hip = bpy.context.active_object
-    hip.name = f"Leg_{side}_Hip"
-    apply_mat(hip, mats['dark_gray'])
-    parts.append(hip)
-
-    # Upper leg / thigh (white)
-    parts.append(cube((x, 0, z - 0.12), (0.14, 0.18, 0.3), f"Leg_{side}_Thigh", mats['white']))
-
-    # Thigh armor panel (outer)
-    parts.append(cube((x + x_mult * 0.08, -0.04, z - 0.1), (0.05, 0.12, 0.2), f"Leg_{side}_ThighArmor", mats['light_gray']))
-
-    # Knee armor (blue)
-    parts.append(cube((x, -0.06, z - 0.32), (0.12, 0.14, 0.14), f"Leg_{side}_Knee", mats['blue']))
-
-    # Knee cap detail
-    parts.append(cube((x, -0.12, z - 0.32), (0.08, 0.04, 0.1), f"Leg_{side}_KneeCap", mats['dark_blue']))
-
-    # Lower leg / shin (white)
-    parts.append(cube((x, 0, z - 0.56), (0.13, 0.16, 0.32), f"Leg_{side}_Shin", mats['white']))
-
-    # Shin armor (front blue panel)
-    parts.append(cube((x, -0.1, z - 0.54), (0.09, 0.04, 0.26), f"Leg_{side}_ShinArmor", mats['blue']))
-
-    # Calf armor (back)
-    parts.append(cube((x, 0.1, z - 0.52), (0.1, 0.06, 0.22), f"Leg_{side}_Calf", mats['light_gray']))
-
-    # Ankle
-    parts.append(cylinder((x, 0, z - 0.74), 0.05, 0.06, f"Leg_{side}_Ankle", mats['dark_gray']))
-
-    # Ankle guard band
-    parts.append(cube((x, 0, z - 0.76), (0.14, 0.16, 0.04), f"Leg_{side}_AnkleGuard", mats['white']))
-
-    # Foot base (white)
-    parts.append(cube((x, -0.06, z - 0.84), (0.12, 0.22, 0.08), f"Leg_{side}_Foot", mats['white']))
-
-    # Toe (red)
-    parts.append(cube((x, -0.16, z - 0.84), (0.1, 0.08, 0.07), f"Leg_{side}_Toe", mats['red']))
-
-    # Heel
-    parts.append(cube((x, 0.06, z - 0.84), (0.1, 0.08, 0.07), f"Leg_{side}_Heel", mats['white']))
-
-    # Foot top armor
-    parts.append(cube((x, -0.04, z - 0.78), (0.1, 0.12, 0.04), f"Leg_{side}_FootTop", mats['white']))
-
-    return parts
-
-# ============================================================
-# BACKPACK
-# ============================================================
-def create_backpack(mats, z):
-    parts = []
-
-    # Main backpack body
-    parts.append(cube((0, 0.16, z), (0.28, 0.12, 0.26), "Backpack_Main", mats['white']))
-
-    # Thruster housings
-    for side, x_mult in [('L', -1), ('R', 1)]:
-        parts.append(cylinder((x_mult * 0.1, 0.22, z - 0.06), 0.05, 0.08, f"Backpack_Thruster_{side}",
-                              mats['dark_gray'], (math.radians(90), 0, 0)))
-        parts.append(cube((x_mult * 0.12, 0.14, z + 0.1), (0.06, 0.08, 0.14), f"Backpack_WingMount_{side}", mats['light_gray']))
-
-    # Central spine
-    parts.append(cube((0, 0.2, z + 0.06), (0.08, 0.06, 0.2), "Backpack_Spine", mats['dark_gray']))
-
-    return parts
-
-# ============================================================
-# WING BINDERS - HUGE
-# ============================================================
-def create_wing(mats, side, position, z):
-    parts = []
-    x_mult = 1 if side == 'right' else -1
-    is_upper = position == 'upper'
-
-    x_base = x_mult * 0.16
-    y_base = 0.18
-    z_offset = 0.12 if is_upper else -0.08
-
-    # Wing angles
-    y_angle = x_mult * math.radians(30 if is_upper else 20)
-    x_angle = math.radians(-25 if is_upper else 15)
-
-    # Wing mount/arm
-    parts.append(cube_rot((x_base + x_mult * 0.08, y_base + 0.12, z + z_offset), (0.08, 0.2, 0.1),
-                          (x_angle * 0.5, y_angle * 0.5, 0), f"Wing_{side}_{position}_Mount", mats['dark_gray']))
-
-    # Main wing blade (WHITE) - MASSIVE
-    blade_len = 0.8
-    blade_width = 0.2
-    blade_x = x_base + x_mult * 0.35
-    blade_y = y_base + 0.4
-    blade_z = z + z_offset + (0.15 if is_upper else -0.05)
-
-    parts.append(cube_rot((blade_x, blade_y, blade_z), (0.06, blade_len, blade_width),
-                          (x_angle, y_angle, 0), f"Wing_{side}_{position}_Blade", mats['white']))
-
-    # Red section on wing (inner edge)
-    red_x = blade_x + x_mult * 0.025
-    red_y = blade_y - 0.1
-    parts.append(cube_rot((red_x, red_y, blade_z), (0.05, blade_len * 0.4, blade_width * 0.45),
-                          (x_angle, y_angle, 0), f"Wing_{side}_{position}_Red", mats['red']))
-
-    # Wing tip detail
-    tip_y = blade_y + blade_len * 0.35
-    parts.append(cube_rot((blade_x - x_mult * 0.01, tip_y, blade_z), (0.04, 0.12, blade_width * 0.4),
-                          (x_angle, y_angle, 0), f"Wing_{side}_{position}_Tip", mats['light_gray']))
-
-    return parts
+    ('cube', "Skirt_Side_{side}", (0.22, 0, SKIRT_Z - 0.04), (0.06, 0.2, 0.28), NO_ROT, 'white', LR),
+    ('cube', "Skirt_SideBlue_{side}", (0.24, 0, SKIRT_Z - 0.08), (0.03, 0.14, 0.18), NO_ROT, 'blue', LR),
+    ('cube', "Skirt_Rear", (0, 0.14, SKIRT_Z - 0.04), (0.22, 0.04, 0.24), NO_ROT, 'white', None),
+]
+
+LEG_PARTS = [
+    ('sphere', "Leg_{side}_Hip", (0.14, 0, LEG_Z + 0.1), (0.07,), NO_ROT, 'dark_gray', LEFT_RIGHT),  # Mostly inside the thigh
+    ('cube', "Leg_{side}_Thigh", (0.14, 0, LEG_Z - 0.12), (0.14, 0.18, 0.3), NO_ROT, 'white', LEFT_RIGHT),
+    ('cube', "Leg_{side}_ThighArmor", (0.22, -0.04, LEG_Z - 0.1), (0.05, 0.12, 0.2), NO_ROT, 'light_gray', LEFT_RIGHT),
+    ('cube', "Leg_{side}_Knee", (0.14, -0.06, LEG_Z - 0.32), (0.12, 0.14, 0.14), NO_ROT, 'blue', LEFT_RIGHT),
+    ('cube', "Leg_{side}_KneeCap", (0.14, -0.12, LEG_Z - 0.32), (0.08, 0.04, 0.1), NO_ROT, 'dark_blue', LEFT_RIGHT),
+    ('cube', "Leg_{side}_Shin", (0.14, 0, LEG_Z - 0.56), (0.13, 0.16, 0.32), NO_ROT, 'white', LEFT_RIGHT),
+    ('cube', "Leg_{side}_ShinArmor", (0.14, -0.1, LEG_Z - 0.54), (0.09, 0.04, 0.26), NO_ROT, 'blue', LEFT_RIGHT),
+    ('cube', "Leg_{side}_Calf", (0.14, 0.1, LEG_Z - 0.52), (0.1, 0.06, 0.22), NO_ROT, 'light_gray', LEFT_RIGHT),
+    ('cylinder', "Leg_{side}_Ankle", (0.14, 0, LEG_Z - 0.74), (0.05, 0.06), NO_ROT, 'dark_gray', LEFT_RIGHT),
+    ('cube', "Leg_{side}_AnkleGuard", (0.14, 0, LEG_Z - 0.76), (0.14, 0.16, 0.04), NO_ROT, 'white', LEFT_RIGHT),
+    ('cube', "Leg_{side}_Foot", (0.14, -0.06, LEG_Z - 0.84), (0.12, 0.22, 0.08), NO_ROT, 'white', LEFT_RIGHT),
+    ('cube', "Leg_{side}_Toe", (0.14, -0.16, LEG_Z - 0.84), (0.1, 0.08, 0.07), NO_ROT, 'red', LEFT_RIGHT),
+    ('cube', "Leg_{side}_Heel", (0.14, 0.06, LEG_Z - 0.84), (0.1, 0.08, 0.07), NO_ROT, 'white', LEFT_RIGHT),
+    ('cube', "Leg_{side}_FootTop", (0.14, -0.04, LEG_Z - 0.78), (0.1, 0.12, 0.04), NO_ROT, 'white', LEFT_RIGHT),
+]
+
+BACKPACK_PARTS = [
+    ('cube', "Backpack_Main", (0, 0.16, BACKPACK_Z), (0.28, 0.12, 0.26), NO_ROT, 'white', None),
+    ('cylinder', "Backpack_Thruster_{side}", (0.1, 0.22, BACKPACK_Z - 0.06), (0.05, 0.08),
+     (90, 0, 0), 'dark_gray', LR),
+    ('cube', "Backpack_WingMount_{side}", (0.12, 0.14, BACKPACK_Z + 0.1), (0.06, 0.08, 0.14), NO_ROT, 'light_gray', LR),
+    ('cube', "Backpack_Spine", (0, 0.2, BACKPACK_Z + 0.06), (0.08, 0.06, 0.2), NO_ROT, 'dark_gray', None),
+]
+
+# Wing binders - HUGE: position, mount height, blade height above the
+# mount, and the blade's x / y tilt in degrees
+WING_CONFIGS = [
+    ('upper', 0.12, 0.15, -25, 30),
+    ('lower', -0.08, -0.05, 15, 20),
+]
+BLADE_LEN = 0.8
+BLADE_WIDTH = 0.2
+
+WING_PARTS = [
+    part
+    for position, z_offset, blade_dz, x_deg, y_deg in WING_CONFIGS
+    for blade_z, tilt in [(BACKPACK_Z + z_offset + blade_dz, (x_deg, y_deg, 0))]
+    for part in [
+        ('cube', f"Wing_{{side}}_{position}_Mount", (0.24, 0.3, BACKPACK_Z + z_offset), (0.08, 0.2, 0.1),
+         (tilt[0] * 0.5, tilt[1] * 0.5, 0), 'dark_gray', LEFT_RIGHT),
+        # Main blade (WHITE) - MASSIVE
+        ('cube', f"Wing_{{side}}_{position}_Blade", (0.51, 0.58, blade_z), (0.06, BLADE_LEN, BLADE_WIDTH),
+         tilt, 'white', LEFT_RIGHT),
+        # Red section (inner edge)
+        ('cube', f"Wing_{{side}}_{position}_Red", (0.535, 0.48, blade_z), (0.05, BLADE_LEN * 0.4, BLADE_WIDTH * 0.45),
+         tilt, 'red', LEFT_RIGHT),
+        ('cube', f"Wing_{{side}}_{position}_Tip", (0.5, 0.58 + BLADE_LEN * 0.35, blade_z), (0.04, 0.12, BLADE_WIDTH * 0.4),
+         tilt, 'light_gray', LEFT_RIGHT),
+    ]
+]
+
+PARTS_TABLE = (
+    HEAD_PARTS + TORSO_PARTS + SHOULDER_PARTS + ARM_PARTS
+    + SKIRT_PARTS + LEG_PARTS + BACKPACK_PARTS + WING_PARTS
+)
+
+def expand_parts(table):
+    """(kind, name, loc, size, rotation, material) per part, left before right.
+
+    Mirroring across X negates loc x and the Euler Y / Z angles; every
+    mirrored shape here is itself symmetric in X.
+    """
+    locs = np.array([row[2] for row in table], dtype=np.float64)
+    rots = np.radians([row[4] for row in table])
+    mirrored_locs = locs * (-1, 1, 1)
+    mirrored_rots = rots * (1, -1, -1)
+
+    for i, (kind, name, _, size, _, mat, sides) in enumerate(table):
+        if sides:
+            yield kind, name.format(side=sides[0]), tuple(mirrored_locs[i]), size, tuple(mirrored_rots[i]), mat
+            yield kind, name.format(side=sides[1]), tuple(locs[i]), size, tuple(rots[i]), mat
+        else:
+            yield kind, name, tuple(locs[i]), size, tuple(rots[i]), mat
 
 # ============================================================
 # MAIN ASSEMBLY
 # ============================================================
-def generate():
+def generate(merge=True):
     cleanup()
     mats = setup_materials()
 
-    # Vertical positions
-    leg_z = 0.88
-    skirt_z = 1.1
-    torso_z = 1.45
-    shoulder_z = 1.6
-    arm_z = 1.4
-    head_z = 1.85
-    backpack_z = 1.45
-
-    all_parts = []
-
-    print("Creating head...")
-    all_parts.extend(create_head(mats, head_z))
-
-    print("Creating torso...")
-    all_parts.extend(create_torso(mats, torso_z))
-
-    print("Creating shoulders...")
-    all_parts.extend(create_shoulder(mats, 'left', shoulder_z))
-    all_parts.extend(create_shoulder(mats, 'right', shoulder_z))
-
-    print("Creating arms...")
-    all_parts.extend(create_arm(mats, 'left', arm_z))
-    all_parts.extend(create_arm(mats, 'right', arm_z))
+    print("Creating parts...")
+    parts = list(expand_parts(PARTS_TABLE))
+    all_parts = model_object(parts, mats) if merge else part_objects(parts, mats)
 
-    print("Creating skirt...")
-    all_parts.extend(create_skirt(mats, skirt_z))
-
-    print("Creating legs...")
-    all_parts.extend(create_leg(mats, 'left', leg_z))
-    all_parts.extend(create_leg(mats, 'right', leg_z))
-
-    print("Creating backpack...")
-    all_parts.extend(create_backpack(mats, backpack_z))
-
-    print("Creating wing binders...")
-    all_parts.extend(create_wing(mats, 'left', 'upper', backpack_z))
-    all_parts.extend(create_wing(mats, 'right', 'upper', backpack_z))
-    all_parts.extend(create_wing(mats, 'left', 'lower', backpack_z))
-    all_parts.extend(create_wing(mats, 'right', 'lower', backpack_z))
-
-    # Parent all
-    bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-    parent = bpy.context.active_object
-    parent.name = ASSET_NAME
+    # Parent while nothing is in the scene yet, so no assignment touches the
+    # depsgraph; matrix_parent_inverse stays identity (no parent_set-style
+    # inversion per part), which is right with the root at the origin
+    parent = bpy.data.objects.new(ASSET_NAME, None)
     for p in all_parts:
         p.parent = parent
 
-    return parent, all_parts
+    # Link everything, then evaluate the scene once
+    collection = bpy.context.scene.collection
+    collection.objects.link(parent)
+    for p in all_parts:
+        collection.objects.link(p)
+    bpy.context.view_layer.update()
+
+    return parent, all_parts, len(parts)
 
 def setup_scene(target, size):
     scene = bpy.context.scene
@@ -517,9 +542,10 @@ def setup_scene(target, size):
 
     return cam
 
-def render_preview(filepath, resolution=(1200, 1600)):
+def render_preview(filepath, resolution=(1200, 1600), samples=PREVIEW_SAMPLES, effects=False):
     scene = bpy.context.scene
     scene.render.engine = 'BLENDER_EEVEE'
+    scene.eevee.taa_render_samples = samples
     scene.render.resolution_x = resolution[0]
     scene.render.resolution_y = resolution[1]
     scene.render.resolution_percentage = 100
@@ -528,9 +554,9 @@ def render_preview(filepath, resolution=(1200, 1600)):
 
     try:
         if hasattr(scene.eevee, 'use_gtao'):
-            scene.eevee.use_gtao = True
+            scene.eevee.use_gtao = effects
         if hasattr(scene.eevee, 'use_bloom'):
-            scene.eevee.use_bloom = True
+            scene.eevee.use_bloom = effects
     except:
         pass
 
@@ -550,14 +576,20 @@ def export_glb(filepath):
 def main():
     args = parse_args()
     output_dir = args.get("output", OUTPUT_DIR)
+    merge = args.get("merge", "1") not in ("0", "false", "no")  # merge=0 keeps one object per part
+    preview = args.get("preview", "1") not in ("0", "false", "no")  # preview=0 only exports the GLB
+    samples = int(args.get("preview_samples", PREVIEW_SAMPLES))
+    effects = args.get("effects", "0") not in ("0", "false", "no")  # AO + bloom, where EEVEE has them
 
     try:
-        parent, parts = generate()
-        target = (0, 0, 1.2)
-        setup_scene(target, 2.0)
+        parent, objects, parts_count = generate(merge)
 
-        preview_path = f"{output_dir}/{ASSET_NAME}_preview.png"
-        render_preview(preview_path)
+        preview_path = None
+        if preview:
+            target = (0, 0, 1.2)
+            setup_scene(target, 2.0)
+            preview_path = f"{output_dir}/{ASSET_NAME}_preview.png"
+            render_preview(preview_path, samples=samples, effects=effects)
 
         glb_path = f"{output_dir}/{ASSET_NAME}.glb"
         export_glb(glb_path)
@@ -565,7 +597,8 @@ def main():
         info = {
             "status": "success",
             "name": ASSET_NAME,
-            "parts_count": len(parts),
+            "parts_count": parts_count,
+            "objects_count": len(objects),
             "preview": preview_path,
             "glb": glb_path,
         }
@@ -2,16 +2,22 @@
 """
 God Gundam - Version 6
 Fixed wing positioning - wings extend outward from mount points
-Run: blender -b --python god_gundam_v6.py --python-exit-code 1 -- output=/tmp
+Run: blender -b --python god_gundam_v6.py --python-exit-code 1 -- output=/tmp [fast=1] [preview=0]
+     fast=1 renders the preview at half size without bloom or SSR, for quick iterations.
+     preview=0 only exports the GLB, skipping the lights, camera, world and render.
 """
 import bpy
+import bmesh
 import sys
 import json
 import math
-from mathutils import Vector
+from contextlib import contextmanager
+import numpy as np
+from mathutils import Matrix
 
 OUTPUT_DIR = "/tmp"
 ASSET_NAME = "GodGundam_v6"
+PREVIEW_SAMPLES = 16  # EEVEE default is 64; flat materials under large area lights don't need more
 
 COLORS = {
     'white': (0.92, 0.92, 0.94),
@@ -26,12 +32,41 @@ COLORS = {
     'black': (0.015, 0.015, 0.015),
 }
 
+CYL_VERTS = 8  # Neck, elbows, ankles and thrusters are a few pixels wide at preview size
+SHARED_MESHES = {}  # Shape key -> mesh reused by every part of that shape
+BMESH = bmesh.new()  # Scratch bmesh for every mesh built; cleared by new_mesh, never freed
+
 def cleanup():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    # Remove the startup scene's datablocks in one call; read_factory_settings
+    # would also reload preferences, add-ons and the UI. Materials are kept for mat() to reuse.
+    data = bpy.data
+    data.batch_remove([
+        id_ for collection in (data.objects, data.meshes, data.lights,
+                               data.cameras, data.worlds, data.collections)
+        for id_ in collection
+    ])
+    SHARED_MESHES.clear()  # Freed along with the rest
+
+@contextmanager
+def fast_build():
+    """No undo steps or interface redraws while the scene is built; one view layer update at the end."""
+    prefs = bpy.context.preferences.edit
+    rd = bpy.context.scene.render
+    saved = prefs.use_global_undo, rd.use_lock_interface
+    prefs.use_global_undo = False
+    rd.use_lock_interface = True
+    try:
+        yield
+        bpy.context.view_layer.update()
+    finally:
+        prefs.use_global_undo, rd.use_lock_interface = saved
 
 def mat(name, color, rough=0.4, metal=0.3, emit=0.0):
-    m = bpy.data.materials.new(name)
-    m.use_nodes = True
+    # Reuse a material left by an earlier run in this session; its values are rewritten below
+    m = bpy.data.materials.get(name)
+    if m is None:
+        m = bpy.data.materials.new(name)
+        m.use_nodes = True
     b = m.node_tree.nodes.get("Principled BSDF")
     b.inputs["Base Color"].default_value = (*color, 1.0)
     b.inputs["Roughness"].default_value = rough
@@ -56,44 +91,97 @@ def setup_mats():
     }
 
 def apply_mat(obj, m):
-    if obj.data.materials:
-        obj.data.materials[0] = m
-    else:
-        obj.data.materials.append(m)
-
-def box(name, loc, dims, m):
-    bpy.ops.mesh.primitive_cube_add(size=1, location=loc)
-    o = bpy.context.active_object
-    o.name = name
-    o.dimensions = dims
-    bpy.ops.object.transform_apply(scale=True)
-    apply_mat(o, m)
-    return o
-
-def cyl(name, loc, r, h, m, axis='Z'):
-    bpy.ops.mesh.primitive_cylinder_add(radius=r, depth=h, location=loc)
-    o = bpy.context.active_object
-    o.name = name
-    if axis == 'X':
-        o.rotation_euler = (0, math.radians(90), 0)
-    elif axis == 'Y':
-        o.rotation_euler = (math.radians(90), 0, 0)
-    bpy.ops.object.transform_apply(rotation=True)
+    # Object-level slot, so parts sharing a mesh can still differ in color
+    slot = obj.material_slots[0]
+    slot.link = 'OBJECT'
+    slot.material = m
+
+def new_mesh(name, bm, materials=(None,)):
+    # Default is one empty slot, filled per object by apply_mat
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.clear()
+    for m in materials:
+        mesh.materials.append(m)
+    return mesh
+
+def shared_mesh(key, name, make_bmesh):
+    """Return the mesh cached under key, building it from make_bmesh() on first use."""
+    mesh = SHARED_MESHES.get(key)
+    if mesh is None:
+        mesh = SHARED_MESHES[key] = new_mesh(name, make_bmesh())
+    return mesh
+
+def mesh_object(name, mesh, loc, m, scale=(1, 1, 1), rotation=(0, 0, 0)):
+    """Create an unlinked object for mesh, without any operator; main() links it.
+
+    Scale and rotation stay on the object (glTF node TRS), so nothing is ever applied.
+    """
+    o = bpy.data.objects.new(name, mesh)
+    o.location = loc
+    o.scale = scale
+    o.rotation_euler = rotation
     apply_mat(o, m)
     return o
 
-def spike(name, loc, r1, r2, h, m, tilt_x=0, tilt_y=0, verts=8):
-    bpy.ops.mesh.primitive_cone_add(vertices=verts, radius1=r1, radius2=r2, depth=h, location=loc)
-    o = bpy.context.active_object
-    o.name = name
-    o.rotation_euler = (math.radians(tilt_x), math.radians(tilt_y), 0)
-    bpy.ops.object.transform_apply(rotation=True)
-    apply_mat(o, m)
-    return o
-
-def build(mats):
-    parts = []
-
+def cube_bmesh():
+    bmesh.ops.create_cube(BMESH, size=1)
+    return BMESH
+
+def cone_bmesh(r1, r2, h, verts):
+    bmesh.ops.create_cone(BMESH, cap_ends=True, segments=verts, radius1=r1, radius2=r2, depth=h)
+    return BMESH
+
+def icosphere_bmesh(r):
+    bmesh.ops.create_icosphere(BMESH, subdivisions=2, radius=r)  # 42 verts; 1 would be the bare icosahedron
+    return BMESH
+
+def box(name, loc, size, rotation, m):
+    mesh = shared_mesh(('cube',), "UnitCube", cube_bmesh)
+    return mesh_object(name, mesh, loc, m, scale=size, rotation=rotation)
+
+def cyl(name, loc, size, rotation, m):
+    r, _, h = size
+    mesh = shared_mesh(('cyl', r, h), "Cyl", lambda: cone_bmesh(r, r, h, CYL_VERTS))
+    return mesh_object(name, mesh, loc, m, rotation=rotation)
+
+def spike(name, loc, size, rotation, m, verts=8):
+    r1, r2, h = size
+    mesh = shared_mesh(('spike', r1, r2, h, verts), "Spike", lambda: cone_bmesh(r1, r2, h, verts))
+    return mesh_object(name, mesh, loc, m, rotation=rotation)
+
+def sphere(name, loc, size, rotation, m):
+    r = size[0]
+    mesh = shared_mesh(('sphere', r), "Sphere", lambda: icosphere_bmesh(r))
+    return mesh_object(name, mesh, loc, m, rotation=rotation)
+
+PRIMITIVES = {'box': box, 'cyl': cyl, 'spike': spike, 'sphere': sphere}
+
+# ============================================================================
+# PART LAYOUT
+# size is box dims, (r, r, depth) for cyl, (r1, r2, depth) for spike, (r, r, r) for sphere
+# rot is an XYZ euler in degrees
+# ============================================================================
+
+PART_DTYPE = np.dtype([
+    ('kind', 'U6'), ('name', 'U16'), ('loc', '3f4'), ('size', '3f4'), ('rot', '3f4'), ('mat', 'U12'),
+])
+
+NO_ROT = (0, 0, 0)
+X_AXIS = (0, 90, 0)  # Cylinder lying along X
+Y_AXIS = (90, 0, 0)  # Cylinder lying along Y
+
+def mirrored(right):
+    """Right-side rows plus their reflection across X, left first; names ending in R end in L."""
+    right = np.array(right, dtype=PART_DTYPE)
+    left = right.copy()
+    left['name'] = [name[:-1] + 'L' for name in right['name']]
+    left['loc'][:, 0] *= -1
+    left['rot'][:, 1:] *= -1  # Mirroring across X flips Y and Z rotations
+    return np.concatenate([left, right])
+
+def layout():
+    """Return the suit's parts and its wing boxes as two PART_DTYPE tables."""
     torso_z = 1.4
     head_z = torso_z + 0.48
     shoulder_z = torso_z + 0.12
@@ -102,134 +190,158 @@ def build(mats):
     leg_z = skirt_z - 0.18
     back_z = torso_z
 
-    # =================== TORSO ===================
-    parts.append(box("Chest", (0, 0, torso_z), (0.48, 0.32, 0.38), mats['blue']))
-    parts.append(box("Collar", (0, -0.02, torso_z + 0.2), (0.42, 0.16, 0.14), mats['white']))
-    parts.append(box("Cockpit", (0, -0.16, torso_z + 0.06), (0.16, 0.05, 0.2), mats['red']))
-
-    for s, x in [('L', -0.14), ('R', 0.14)]:
-        parts.append(box(f"Vent{s}", (x, -0.16, torso_z + 0.1), (0.1, 0.05, 0.16), mats['orange']))
-        parts.append(box(f"VentTrim{s}", (x, -0.18, torso_z + 0.1), (0.08, 0.015, 0.12), mats['gold']))
+    # Centre parts go in rows; right-side parts go in right and are mirrored to the left at the end
 
-    parts.append(box("ChestGem", (0, -0.17, torso_z + 0.16), (0.08, 0.025, 0.08), mats['green']))
-    parts.append(box("Waist", (0, 0, torso_z - 0.26), (0.32, 0.24, 0.16), mats['dark_gray']))
-    parts.append(box("Abdomen", (0, -0.09, torso_z - 0.12), (0.2, 0.07, 0.16), mats['red']))
-    parts.append(cyl("Neck", (0, 0, torso_z + 0.3), 0.07, 0.12, mats['dark_gray']))
+    # =================== TORSO ===================
+    rows = [
+        ('box', "Chest", (0, 0, torso_z), (0.48, 0.32, 0.38), NO_ROT, 'blue'),
+        ('box', "Collar", (0, -0.02, torso_z + 0.2), (0.42, 0.16, 0.14), NO_ROT, 'white'),
+        ('box', "Cockpit", (0, -0.16, torso_z + 0.06), (0.16, 0.05, 0.2), NO_ROT, 'red'),
+        ('box', "ChestGem", (0, -0.17, torso_z + 0.16), (0.08, 0.025, 0.08), NO_ROT, 'green'),
+        ('box', "Waist", (0, 0, torso_z - 0.26), (0.32, 0.24, 0.16), NO_ROT, 'dark_gray'),
+        ('box', "Abdomen", (0, -0.09, torso_z - 0.12), (0.2, 0.07, 0.16), NO_ROT, 'red'),
+        ('cyl', "Neck", (0, 0, torso_z + 0.3), (0.07, 0.07, 0.12), NO_ROT, 'dark_gray'),
+    ]
+    right = [
+        ('box', "VentR", (0.14, -0.16, torso_z + 0.1), (0.1, 0.05, 0.16), NO_ROT, 'orange'),
+        ('box', "VentTrimR", (0.14, -0.18, torso_z + 0.1), (0.08, 0.015, 0.12), NO_ROT, 'gold'),
+    ]
 
     # =================== HEAD ===================
-    parts.append(box("Helmet", (0, 0, head_z), (0.32, 0.3, 0.24), mats['white']))
-    parts.append(box("Face", (0, -0.13, head_z - 0.02), (0.22, 0.07, 0.16), mats['blue']))
-    parts.append(box("Visor", (0, -0.16, head_z + 0.02), (0.2, 0.025, 0.06), mats['green']))
-    parts.append(box("Chin", (0, -0.14, head_z - 0.09), (0.14, 0.045, 0.06), mats['red']))
-    parts.append(spike("VFinC", (0, -0.06, head_z + 0.28), 0.035, 0.006, 0.35, mats['gold'], -22, 0))
-    parts.append(spike("VFinL", (-0.16, -0.04, head_z + 0.24), 0.028, 0.005, 0.4, mats['gold'], -38, -48))
-    parts.append(spike("VFinR", (0.16, -0.04, head_z + 0.24), 0.028, 0.005, 0.4, mats['gold'], -38, 48))
-    parts.append(box("Crest", (0, 0.03, head_z + 0.14), (0.025, 0.14, 0.1), mats['white']))
+    rows += [
+        ('box', "Helmet", (0, 0, head_z), (0.32, 0.3, 0.24), NO_ROT, 'white'),
+        ('box', "Face", (0, -0.13, head_z - 0.02), (0.22, 0.07, 0.16), NO_ROT, 'blue'),
+        ('box', "Visor", (0, -0.16, head_z + 0.02), (0.2, 0.025, 0.06), NO_ROT, 'green'),
+        ('box', "Chin", (0, -0.14, head_z - 0.09), (0.14, 0.045, 0.06), NO_ROT, 'red'),
+        ('spike', "VFinC", (0, -0.06, head_z + 0.28), (0.035, 0.006, 0.35), (-22, 0, 0), 'gold'),
+        ('box', "Crest", (0, 0.03, head_z + 0.14), (0.025, 0.14, 0.1), NO_ROT, 'white'),
+    ]
+    right.append(('spike', "VFinR", (0.16, -0.04, head_z + 0.24), (0.028, 0.005, 0.4), (-38, 48, 0), 'gold'))
 
     # =================== SHOULDERS ===================
-    for s, sx in [('L', -1), ('R', 1)]:
-        x = sx * 0.34
-        parts.append(box(f"ShJoint{s}", (x, 0, shoulder_z), (0.16, 0.18, 0.18), mats['dark_gray']))
-        ax = x + sx * 0.16
-        parts.append(box(f"ShArmor{s}", (ax, 0, shoulder_z + 0.12), (0.32, 0.46, 0.36), mats['white']))
-        parts.append(box(f"ShRedTop{s}", (ax + sx * 0.02, 0, shoulder_z + 0.3), (0.26, 0.44, 0.05), mats['red']))
-        parts.append(box(f"ShRedFront{s}", (ax, -0.21, shoulder_z + 0.12), (0.26, 0.05, 0.28), mats['red']))
-        parts.append(box(f"ShVents{s}", (x, 0, shoulder_z - 0.12), (0.14, 0.24, 0.1), mats['black']))
-        parts.append(box(f"ShGold{s}", (ax - sx * 0.1, -0.14, shoulder_z + 0.06), (0.05, 0.14, 0.12), mats['gold']))
+    x = 0.34
+    ax = x + 0.16
+    right += [
+        ('box', "ShJointR", (x, 0, shoulder_z), (0.16, 0.18, 0.18), NO_ROT, 'dark_gray'),
+        ('box', "ShArmorR", (ax, 0, shoulder_z + 0.12), (0.32, 0.46, 0.36), NO_ROT, 'white'),
+        ('box', "ShRedTopR", (ax + 0.02, 0, shoulder_z + 0.3), (0.26, 0.44, 0.05), NO_ROT, 'red'),
+        ('box', "ShRedFrontR", (ax, -0.21, shoulder_z + 0.12), (0.26, 0.05, 0.28), NO_ROT, 'red'),
+        ('box', "ShVentsR", (x, 0, shoulder_z - 0.12), (0.14, 0.24, 0.1), NO_ROT, 'black'),
+        ('box', "ShGoldR", (ax - 0.1, -0.14, shoulder_z + 0.06), (0.05, 0.14, 0.12), NO_ROT, 'gold'),
+    ]
 
     # =================== ARMS ===================
-    for s, sx in [('L', -1), ('R', 1)]:
-        x = sx * 0.48
-        parts.append(box(f"UpArm{s}", (x, 0, arm_z), (0.16, 0.18, 0.3), mats['blue']))
-        parts.append(box(f"UpArmArmor{s}", (x + sx * 0.06, -0.05, arm_z), (0.07, 0.14, 0.24), mats['white']))
-        parts.append(cyl(f"Elbow{s}", (x, 0, arm_z - 0.2), 0.08, 0.12, mats['dark_gray'], 'X'))
-        parts.append(box(f"Forearm{s}", (x, 0, arm_z - 0.44), (0.15, 0.17, 0.3), mats['white']))
-        parts.append(box(f"ForeArmor{s}", (x + sx * 0.08, -0.02, arm_z - 0.42), (0.07, 0.14, 0.24), mats['white']))
-        parts.append(box(f"ForeGold{s}", (x, -0.1, arm_z - 0.38), (0.1, 0.025, 0.14), mats['gold']))
-        parts.append(box(f"Hand{s}", (x, -0.02, arm_z - 0.64), (0.12, 0.14, 0.14), mats['dark_gray']))
+    x = 0.48
+    right += [
+        ('box', "UpArmR", (x, 0, arm_z), (0.16, 0.18, 0.3), NO_ROT, 'blue'),
+        ('box', "UpArmArmorR", (x + 0.06, -0.05, arm_z), (0.07, 0.14, 0.24), NO_ROT, 'white'),
+        ('cyl', "ElbowR", (x, 0, arm_z - 0.2), (0.08, 0.08, 0.12), X_AXIS, 'dark_gray'),
+        ('box', "ForearmR", (x, 0, arm_z - 0.44), (0.15, 0.17, 0.3), NO_ROT, 'white'),
+        ('box', "ForeArmorR", (x + 0.08, -0.02, arm_z - 0.42), (0.07, 0.14, 0.24), NO_ROT, 'white'),
+        ('box', "ForeGoldR", (x, -0.1, arm_z - 0.38), (0.1, 0.025, 0.14), NO_ROT, 'gold'),
+        ('box', "HandR", (x, -0.02, arm_z - 0.64), (0.12, 0.14, 0.14), NO_ROT, 'dark_gray'),
+    ]
 
     # =================== SKIRT ===================
-    parts.append(box("SkFC", (0, -0.15, skirt_z), (0.16, 0.05, 0.24), mats['white']))
-    parts.append(box("SkFCBlue", (0, -0.17, skirt_z - 0.05), (0.12, 0.025, 0.14), mats['blue']))
-
-    for s, sx in [('L', -1), ('R', 1)]:
-        parts.append(box(f"SkFS{s}", (sx * 0.13, -0.13, skirt_z), (0.14, 0.05, 0.26), mats['white']))
-        parts.append(box(f"SkFSBlue{s}", (sx * 0.13, -0.15, skirt_z - 0.06), (0.1, 0.025, 0.14), mats['blue']))
-        parts.append(box(f"SkSide{s}", (sx * 0.24, 0, skirt_z - 0.02), (0.1, 0.24, 0.34), mats['white']))
-        parts.append(box(f"SkSideBlue{s}", (sx * 0.26, 0, skirt_z - 0.06), (0.05, 0.18, 0.22), mats['blue']))
-
-    parts.append(box("SkRear", (0, 0.13, skirt_z - 0.02), (0.28, 0.06, 0.3), mats['white']))
+    rows += [
+        ('box', "SkFC", (0, -0.15, skirt_z), (0.16, 0.05, 0.24), NO_ROT, 'white'),
+        ('box', "SkFCBlue", (0, -0.17, skirt_z - 0.05), (0.12, 0.025, 0.14), NO_ROT, 'blue'),
+        ('box', "SkRear", (0, 0.13, skirt_z - 0.02), (0.28, 0.06, 0.3), NO_ROT, 'white'),
+    ]
+    right += [
+        ('box', "SkFSR", (0.13, -0.13, skirt_z), (0.14, 0.05, 0.26), NO_ROT, 'white'),
+        ('box', "SkFSBlueR", (0.13, -0.15, skirt_z - 0.06), (0.1, 0.025, 0.14), NO_ROT, 'blue'),
+        ('box', "SkSideR", (0.24, 0, skirt_z - 0.02), (0.1, 0.24, 0.34), NO_ROT, 'white'),
+        ('box', "SkSideBlueR", (0.26, 0, skirt_z - 0.06), (0.05, 0.18, 0.22), NO_ROT, 'blue'),
+    ]
 
     # =================== LEGS ===================
-    for s, sx in [('L', -1), ('R', 1)]:
-        x = sx * 0.15
-
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.09, location=(x, 0, leg_z + 0.05))
-        hip = bpy.context.active_object
-        hip.name = f"Hip{s}"
-        apply_mat(hip, mats['dark_gray'])
-        parts.append(hip)
-
-        parts.append(box(f"Thigh{s}", (x, 0, leg_z - 0.2), (0.18, 0.22, 0.38), mats['white']))
-        parts.append(box(f"ThArmor{s}", (x + sx * 0.1, -0.05, leg_z - 0.18), (0.07, 0.16, 0.28), mats['light_gray']))
-        parts.append(box(f"Knee{s}", (x, -0.07, leg_z - 0.44), (0.16, 0.18, 0.18), mats['blue']))
-        parts.append(box(f"KneeCap{s}", (x, -0.14, leg_z - 0.44), (0.12, 0.05, 0.14), mats['dark_blue']))
-        parts.append(box(f"Shin{s}", (x, 0, leg_z - 0.74), (0.17, 0.2, 0.42), mats['white']))
-        parts.append(box(f"ShinArmor{s}", (x, -0.12, leg_z - 0.72), (0.13, 0.05, 0.34), mats['blue']))
-        parts.append(box(f"Calf{s}", (x, 0.12, leg_z - 0.7), (0.14, 0.08, 0.3), mats['light_gray']))
-        parts.append(cyl(f"Ankle{s}", (x, 0, leg_z - 0.98), 0.07, 0.1, mats['dark_gray']))
-        parts.append(box(f"AnkleGuard{s}", (x, 0, leg_z - 1.0), (0.18, 0.2, 0.06), mats['white']))
-        parts.append(box(f"Foot{s}", (x, -0.07, leg_z - 1.08), (0.16, 0.3, 0.12), mats['white']))
-        parts.append(box(f"Toe{s}", (x, -0.2, leg_z - 1.08), (0.14, 0.12, 0.1), mats['red']))
-        parts.append(box(f"Heel{s}", (x, 0.1, leg_z - 1.08), (0.14, 0.12, 0.1), mats['white']))
+    x = 0.15
+    right += [
+        ('sphere', "HipR", (x, 0, leg_z + 0.05), (0.09, 0.09, 0.09), NO_ROT, 'dark_gray'),
+        ('box', "ThighR", (x, 0, leg_z - 0.2), (0.18, 0.22, 0.38), NO_ROT, 'white'),
+        ('box', "ThArmorR", (x + 0.1, -0.05, leg_z - 0.18), (0.07, 0.16, 0.28), NO_ROT, 'light_gray'),
+        ('box', "KneeR", (x, -0.07, leg_z - 0.44), (0.16, 0.18, 0.18), NO_ROT, 'blue'),
+        ('box', "KneeCapR", (x, -0.14, leg_z - 0.44), (0.12, 0.05, 0.14), NO_ROT, 'dark_blue'),
+        ('box', "ShinR", (x, 0, leg_z - 0.74), (0.17, 0.2, 0.42), NO_ROT, 'white'),
+        ('box', "ShinArmorR", (x, -0.12, leg_z - 0.72), (0.13, 0.05, 0.34), NO_ROT, 'blue'),
+        ('box', "CalfR", (x, 0.12, leg_z - 0.7), (0.14, 0.08, 0.3), NO_ROT, 'light_gray'),
+        ('cyl', "AnkleR", (x, 0, leg_z - 0.98), (0.07, 0.07, 0.1), NO_ROT, 'dark_gray'),
+        ('box', "AnkleGuardR", (x, 0, leg_z - 1.0), (0.18, 0.2, 0.06), NO_ROT, 'white'),
+        ('box', "FootR", (x, -0.07, leg_z - 1.08), (0.16, 0.3, 0.12), NO_ROT, 'white'),
+        ('box', "ToeR", (x, -0.2, leg_z - 1.08), (0.14, 0.12, 0.1), NO_ROT, 'red'),
+        ('box', "HeelR", (x, 0.1, leg_z - 1.08), (0.14, 0.12, 0.1), NO_ROT, 'white'),
+    ]
 
     # =================== BACKPACK ===================
-    parts.append(box("Backpack", (0, 0.18, back_z), (0.36, 0.16, 0.34), mats['white']))
-    parts.append(cyl("ThrL", (-0.12, 0.26, back_z - 0.1), 0.07, 0.12, mats['dark_gray'], 'Y'))
-    parts.append(cyl("ThrR", (0.12, 0.26, back_z - 0.1), 0.07, 0.12, mats['dark_gray'], 'Y'))
-    parts.append(box("Spine", (0, 0.24, back_z + 0.1), (0.12, 0.1, 0.28), mats['dark_gray']))
+    rows += [
+        ('box', "Backpack", (0, 0.18, back_z), (0.36, 0.16, 0.34), NO_ROT, 'white'),
+        ('box', "Spine", (0, 0.24, back_z + 0.1), (0.12, 0.1, 0.28), NO_ROT, 'dark_gray'),
+    ]
+    right.append(('cyl', "ThrR", (0.12, 0.26, back_z - 0.1), (0.07, 0.07, 0.12), Y_AXIS, 'dark_gray'))
 
     # =================== WING BINDERS ===================
     # Using position-based spread instead of rotation
     # Wings spread outward from backpack, 4 total (2 upper, 2 lower)
-
-    wing_configs = [
-        # name, side_mult, z_offset, spread_x, spread_y, spread_z
-        ('WLU', -1, 0.16, 0.7, 0.7, 0.3),    # Left Upper
-        ('WRU', 1, 0.16, 0.7, 0.7, 0.3),     # Right Upper
-        ('WLL', -1, -0.1, 0.6, 0.6, -0.15),  # Left Lower
-        ('WRL', 1, -0.1, 0.6, 0.6, -0.15),   # Right Lower
+    # Kept apart from rows: build() joins them into a single Wings mesh
+
+    wing_names = np.array(['WLU', 'WRU', 'WLL', 'WRL'])
+    wing_configs = np.array([
+        # side_mult, z_offset, spread_x, spread_y, spread_z
+        [-1, 0.16, 0.7, 0.7, 0.3],    # Left Upper
+        [1, 0.16, 0.7, 0.7, 0.3],     # Right Upper
+        [-1, -0.1, 0.6, 0.6, -0.15],  # Left Lower
+        [1, -0.1, 0.6, 0.6, -0.15],   # Right Lower
+    ])
+    wing_pieces = [
+        # name, size, material
+        ('Mount', (0.1, 0.14, 0.1), 'dark_gray'),     # Mount connector
+        ('Blade', (0.08, 0.9, 0.2), 'white'),         # Main blade (white) - long and thin
+        ('Red', (0.06, 0.35, 0.12), 'red'),           # Red section - inner part of blade
+        ('Tip', (0.05, 0.15, 0.1), 'light_gray'),     # Tip detail
+        ('Arm', (0.04, 0.4, 0.06), 'light_gray'),     # Connection arm from mount to blade
     ]
 
-    for name, sx, z_off, spread_x, spread_y, spread_z in wing_configs:
-        # Wing mount point on backpack
-        mount_x = sx * 0.18
-        mount_y = 0.24
-        mount_z = back_z + z_off
-
-        # Mount connector
-        parts.append(box(f"{name}Mount", (mount_x + sx * 0.06, mount_y + 0.06, mount_z), (0.1, 0.14, 0.1), mats['dark_gray']))
-
-        # Wing blade - positioned at an angle by spreading outward
-        blade_x = mount_x + sx * spread_x
-        blade_y = mount_y + spread_y
-        blade_z = mount_z + spread_z
-
-        # Main blade (white) - long and thin
-        parts.append(box(f"{name}Blade", (blade_x, blade_y, blade_z), (0.08, 0.9, 0.2), mats['white']))
-
-        # Red section - inner part of blade
-        parts.append(box(f"{name}Red", (blade_x + sx * 0.02, blade_y - 0.15, blade_z), (0.06, 0.35, 0.12), mats['red']))
-
-        # Tip detail
-        parts.append(box(f"{name}Tip", (blade_x, blade_y + 0.38, blade_z), (0.05, 0.15, 0.1), mats['light_gray']))
-
-        # Connection arm from mount to blade
-        arm_x = (mount_x + sx * 0.06 + blade_x) / 2
-        arm_y = (mount_y + 0.06 + blade_y) / 2
-        arm_z = (mount_z + blade_z) / 2
-        parts.append(box(f"{name}Arm", (arm_x, arm_y, arm_z), (0.04, 0.4, 0.06), mats['light_gray']))
+    # All four wings at once, one row per wing; side flips x offsets only
+    sx = wing_configs[:, :1]
+    side = np.hstack([sx, np.ones_like(sx), np.ones_like(sx)])
+    mount = np.hstack([sx * 0.18, np.full_like(sx, 0.24), back_z + wing_configs[:, 1:2]])
+    connector = mount + side * (0.06, 0.06, 0)
+    blade = mount + side * wing_configs[:, 2:]
+    red = blade + side * (0.02, -0.15, 0)
+    tip = blade + (0, 0.38, 0)
+    arm = (connector + blade) / 2
+
+    piece_names, piece_sizes, piece_mats = zip(*wing_pieces)
+    wings = np.zeros(len(wing_names) * len(wing_pieces), dtype=PART_DTYPE)
+    wings['kind'] = 'box'
+    wings['name'] = np.char.add(np.repeat(wing_names, len(wing_pieces)), np.tile(piece_names, len(wing_names)))
+    wings['loc'] = np.stack([connector, blade, red, tip, arm], axis=1).reshape(-1, 3)
+    wings['size'] = np.tile(piece_sizes, (len(wing_names), 1))
+    wings['mat'] = np.tile(piece_mats, len(wing_names))
+
+    return np.concatenate([np.array(rows, dtype=PART_DTYPE), mirrored(right)]), wings
+
+def joined_boxes(name, specs, mats):
+    """One object holding every (unrotated) box in specs, with a mesh material slot per material key."""
+    keys = list(dict.fromkeys(specs['mat']))
+    for loc, size, key in zip(specs['loc'], specs['size'], specs['mat']):
+        verts = bmesh.ops.create_cube(BMESH, size=1, matrix=Matrix.LocRotScale(loc, None, size))['verts']
+        index = keys.index(key)
+        for face in {f for v in verts for f in v.link_faces}:
+            face.material_index = index
+    mesh = new_mesh(name, BMESH, [mats[key] for key in keys])
+    return bpy.data.objects.new(name, mesh)
 
+def build(mats):
+    specs, wing_specs = layout()
+    rotations = np.radians(specs['rot'])
+    parts = [
+        PRIMITIVES[kind](name, loc, size, rotation, mats[mat])
+        for kind, name, loc, size, rotation, mat in zip(
+            specs['kind'], specs['name'], specs['loc'], specs['size'], rotations, specs['mat'])
+    ]
+    parts.append(joined_boxes("Wings", wing_specs, mats))
     return parts
 
 def setup_scene():
@@ -271,47 +383,78 @@ def setup_scene():
     scene.collection.objects.link(cam_obj)
     scene.camera = cam_obj
 
-    cam_obj.location = (4.2, -7, 1.3)
-    target = Vector((0, 0, 1.3))
-    direction = target - cam_obj.location
-    cam_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
+    cam_location = (4.2, -7, 1.3)
+    target = (0, 0, 1.3)
+    cam_obj.location = cam_location
+    # Closed form of to_track_quat('-Z', 'Y'): pitch -Z up from straight down, then yaw about Z, no roll
+    dx, dy, dz = (t - c for t, c in zip(target, cam_location))
+    cam_obj.rotation_euler = (math.atan2(math.hypot(dx, dy), -dz), 0, math.atan2(-dx, dy))
 
-def render(fp):
+def render(fp, fast=False):
     s = bpy.context.scene
     s.render.engine = 'BLENDER_EEVEE'
+    s.eevee.taa_render_samples = PREVIEW_SAMPLES
     s.render.resolution_x = 1200
     s.render.resolution_y = 1600
-    s.render.resolution_percentage = 100
+    s.render.resolution_percentage = 50 if fast else 100
+    if fast:
+        # Only the legacy EEVEE has these toggles
+        for flag in ('use_bloom', 'use_ssr'):
+            if hasattr(s.eevee, flag):
+                setattr(s.eevee, flag, False)
     s.render.filepath = fp
     s.render.image_settings.file_format = 'PNG'
     bpy.ops.render.render(write_still=True)
     print(f"RENDERED: {fp}")
 
 def export_glb(fp):
-    bpy.ops.export_scene.gltf(filepath=fp, export_format='GLB', use_selection=False, export_apply=True, export_yup=True)
+    bpy.ops.export_scene.gltf(
+        filepath=fp,
+        export_format='GLB',
+        use_selection=False,
+        export_apply=False,  # No modifiers anywhere; transforms export as node TRS
+        export_draco_mesh_compression_enable=True,
+        export_draco_mesh_compression_level=6,
+        export_draco_position_quantization=14,
+        export_draco_normal_quantization=10,
+        export_yup=True,
+    )
     print(f"EXPORTED: {fp}")
 
 def main():
     argv = sys.argv
     output_dir = OUTPUT_DIR
+    fast = False
+    preview = True
     if "--" in argv:
         for arg in argv[argv.index("--") + 1:]:
             if arg.startswith("output="):
                 output_dir = arg.split("=")[1]
+            elif arg.startswith("fast="):
+                fast = arg.split("=")[1] != "0"
+            elif arg.startswith("preview="):
+                preview = arg.split("=")[1] not in ("0", "false", "no")
 
     try:
-        cleanup()
-        mats = setup_mats()
-        parts = build(mats)
-
-        bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-        parent = bpy.context.active_object
-        parent.name = ASSET_NAME
-        for p in parts:
-            p.parent = parent
-
-        setup_scene()
-        render(f"{output_dir}/{ASSET_NAME}_preview.png")
+        with fast_build():
+            cleanup()
+            mats = setup_mats()
+            parts = build(mats)
+
+            # Parent while still unlinked (identity parent, no inverse needed), then link in one pass
+            parent = bpy.data.objects.new(ASSET_NAME, None)
+            for p in parts:
+                p.parent = parent
+            link = bpy.context.scene.collection.objects.link
+            link(parent)
+            for p in parts:
+                link(p)
+
+            if preview:  # The GLB needs no lights, camera or world
+                setup_scene()
+
+        if preview:
+            render(f"{output_dir}/{ASSET_NAME}_preview.png", fast)
         export_glb(f"{output_dir}/{ASSET_NAME}.glb")
 
         print(json.dumps({"status": "success", "parts": len(parts)}))
@@ -2,15 +2,19 @@
 """
 Mansion Front Door - Grand Double Doors
 Simplified design with proper alignment
+Run: blender -b --python mansion_front_door.py --python-exit-code 1 -- output=/tmp [preview_quality=fast]
+     preview_quality=fast renders the preview with Workbench instead of EEVEE.
 """
 import bpy
 import sys
 import json
 import math
+import numpy as np
 from mathutils import Vector
 
 OUTPUT_DIR = "/tmp"
 ASSET_NAME = "mansion_front_door"
+PREVIEW_SAMPLES = 8  # EEVEE default is 64; flat wood and metal settle well before that
 
 # Dimensions (meters)
 DOOR_WIDTH = 0.95       # Each door panel
@@ -18,6 +22,18 @@ DOOR_HEIGHT = 2.5       # Door height
 DOOR_THICK = 0.05       # Door thickness
 FRAME_W = 0.10          # Frame width
 FRAME_D = 0.15          # Frame depth (goes back into wall)
+QUARTER_TURN = math.pi / 2  # Lever and stud cylinders point out of the door along Y
+
+# Unit cube (edge length 1, as primitive_cube_add(size=1)) as outward-facing quads
+CUBE_VERTS = np.array([
+    (-0.5, -0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, 0.5, -0.5), (-0.5, 0.5, 0.5),
+    (0.5, -0.5, -0.5), (0.5, -0.5, 0.5), (0.5, 0.5, -0.5), (0.5, 0.5, 0.5),
+], dtype=np.float32)
+CUBE_FACES = [
+    (0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1),
+    (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3),
+]
+MESH_CACHE = {}  # (shape, size, material name) -> mesh shared by every identical part
 
 def parse_args():
     argv = sys.argv
@@ -34,37 +50,71 @@ def parse_args():
 
 def cleanup():
     bpy.ops.wm.read_factory_settings(use_empty=True)
+    MESH_CACHE.clear()
 
 def mat(name, color, rough=0.5, metal=0.0):
     m = bpy.data.materials.new(name)
     m.use_nodes = True
     b = m.node_tree.nodes.get("Principled BSDF")
     if isinstance(color, str):
-        h = color.lstrip('#')
-        color = tuple(int(h[i:i+2], 16)/255 for i in (0,2,4))
+        # One int parse, channels split off with shifts
+        v = int(color.lstrip('#'), 16)
+        color = ((v >> 16 & 0xFF) / 255, (v >> 8 & 0xFF) / 255, (v & 0xFF) / 255)
     b.inputs["Base Color"].default_value = (*color, 1.0)
     b.inputs["Roughness"].default_value = rough
     b.inputs["Metallic"].default_value = metal
     return m
 
+def new_mesh(name, co, faces):
+    """Stream raw geometry into a new mesh with foreach_set, without any operator."""
+    sizes = np.array([len(f) for f in faces], dtype=np.int32)
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.loops.add(int(sizes.sum()))
+    mesh.polygons.add(len(faces))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(co, dtype=np.float32).ravel())
+    mesh.loops.foreach_set("vertex_index", np.fromiter((i for f in faces for i in f), dtype=np.int32))
+    mesh.polygons.foreach_set("loop_start", (np.cumsum(sizes) - sizes).astype(np.int32))  # loop_total is derived
+    mesh.update(calc_edges=True)
+    return mesh
+
+def cylinder(verts, r, depth):
+    """primitive_cylinder_add's cylinder around Z: side quads plus n-gon caps."""
+    phi = np.arange(verts) * (2 * math.pi / verts)
+    ring = np.column_stack([-np.sin(phi), np.cos(phi)]) * r
+    co = np.concatenate([
+        np.column_stack([ring, np.full(verts, -depth / 2)]),
+        np.column_stack([ring, np.full(verts, depth / 2)]),
+    ])
+    faces = [(i, (i + 1) % verts, verts + (i + 1) % verts, verts + i) for i in range(verts)]
+    faces.append(tuple(range(verts - 1, -1, -1)))
+    faces.append(tuple(range(verts, 2 * verts)))
+    return co, faces
+
+def cached_mesh(key, name, material, geometry):
+    """Mesh for key, built from geometry() with material on first use and shared after."""
+    key += (material.name if material else None,)
+    mesh = MESH_CACHE.get(key)
+    if mesh is None:
+        mesh = MESH_CACHE[key] = new_mesh(name, *geometry())
+        if material:
+            mesh.materials.append(material)
+    return mesh
+
 def box(name, sz, loc, material=None):
-    # primitive_cube_add(size=1) creates a 1x1x1 cube (edge length 1)
-    # Scale to desired dimensions
-    bpy.ops.mesh.primitive_cube_add(size=1, location=loc)
-    o = bpy.context.active_object
-    o.name = name
-    o.scale = (sz[0], sz[1], sz[2])
-    bpy.ops.object.transform_apply(scale=True)
-    if material:
-        o.data.materials.append(material)
+    # Unit cube with its scale baked into the verts, as primitive_cube_add(size=1)
+    # followed by transform_apply(scale=True) left it; objects are linked by generate()
+    key = ('box',) + tuple(round(v, 4) for v in sz)
+    mesh = cached_mesh(key, name, material, lambda: (CUBE_VERTS * np.asarray(sz, dtype=np.float32), CUBE_FACES))
+    o = bpy.data.objects.new(name, mesh)
+    o.location = loc
     return o
 
-def cyl(name, r, d, loc, rot=(0,0,0), material=None):
-    bpy.ops.mesh.primitive_cylinder_add(radius=r, depth=d, location=loc, rotation=rot)
-    o = bpy.context.active_object
-    o.name = name
-    if material:
-        o.data.materials.append(material)
+def cyl(name, r, d, loc, rot=(0,0,0), material=None, segments=12):
+    mesh = cached_mesh(('cyl', r, d, segments), name, material, lambda: cylinder(segments, r, d))
+    o = bpy.data.objects.new(name, mesh)
+    o.location = loc
+    o.rotation_euler = rot
     return o
 
 def generate():
@@ -125,14 +175,21 @@ def generate():
     panel_w = DOOR_WIDTH * 0.6
     panel_out = 0.012  # How far panel protrudes
     pz_front = DOOR_THICK/2 + panel_out/2
+    up_h = DOOR_HEIGHT * 0.30  # Upper raised panel
+    up_z = DOOR_HEIGHT * 0.70
+
+    # Decorative studs on the upper panel corners, (door, corner, xyz) for both doors at once
+    corners = np.array([(-1, 1), (1, 1), (-1, -1), (1, -1)]) * (panel_w/2 - 0.03, up_h/2 - 0.03)
+    studs = np.empty((2, 4, 3))
+    studs[..., 0] = np.array([ldx, rdx])[:, None] + corners[:, 0]
+    studs[..., 1] = pz_front + 0.01
+    studs[..., 2] = up_z + corners[:, 1]
 
-    for dx, prefix in [(ldx, "L"), (rdx, "R")]:
+    for d, (dx, prefix, door) in enumerate([(ldx, "L", left_door), (rdx, "R", right_door)]):
         # Upper raised panel
-        up_h = DOOR_HEIGHT * 0.30
-        up_z = DOOR_HEIGHT * 0.70
         up = box(f"Panel_{prefix}_U", (panel_w, panel_out, up_h),
                  (dx, pz_front, up_z), dark_wood)
-        up.parent = left_door if prefix == "L" else right_door
+        up.parent = door
         parts.append(up)
 
         # Lower raised panel
@@ -140,13 +197,13 @@ def generate():
         lo_z = DOOR_HEIGHT * 0.22
         lo = box(f"Panel_{prefix}_L", (panel_w, panel_out, lo_h),
                  (dx, pz_front, lo_z), dark_wood)
-        lo.parent = left_door if prefix == "L" else right_door
+        lo.parent = door
         parts.append(lo)
 
         # Horizontal accent band
         band = box(f"Band_{prefix}", (panel_w + 0.02, 0.01, 0.04),
                    (dx, pz_front + 0.006, DOOR_HEIGHT * 0.46), gold)
-        band.parent = left_door if prefix == "L" else right_door
+        band.parent = door
         parts.append(band)
 
         # Handle (near center seam)
@@ -156,37 +213,40 @@ def generate():
         # Backplate
         bp = box(f"Handle_{prefix}_BP", (0.04, 0.012, 0.12),
                  (hx, pz_front + 0.01, hz), bronze)
-        bp.parent = left_door if prefix == "L" else right_door
+        bp.parent = door
         parts.append(bp)
 
         # Lever
         lv = cyl(f"Handle_{prefix}_LV", 0.008, 0.08,
-                 (hx, pz_front + 0.05, hz), (math.radians(90), 0, 0), bronze)
-        lv.parent = left_door if prefix == "L" else right_door
+                 (hx, pz_front + 0.05, hz), (QUARTER_TURN, 0, 0), bronze)
+        lv.parent = door
         parts.append(lv)
 
-        # Decorative studs on upper panel corners
-        for sx, sz in [(-panel_w/2 + 0.03, up_z + up_h/2 - 0.03),
-                       (panel_w/2 - 0.03, up_z + up_h/2 - 0.03),
-                       (-panel_w/2 + 0.03, up_z - up_h/2 + 0.03),
-                       (panel_w/2 - 0.03, up_z - up_h/2 + 0.03)]:
-            st = cyl(f"Stud_{prefix}", 0.01, 0.01,
-                     (dx + sx, pz_front + 0.01, sz), (math.radians(90), 0, 0), gold)
-            st.parent = left_door if prefix == "L" else right_door
+        # Studs all share one 8-sided mesh; they are only 1cm across
+        for i, loc in enumerate(studs[d]):
+            st = cyl(f"Stud_{prefix}_{i}", 0.01, 0.01, loc, (QUARTER_TURN, 0, 0), gold, segments=8)
+            st.parent = door
+            parts.append(st)
 
     # === CROWN MOLDING ===
     crown = box("Crown", (total_w + 0.02, 0.015, 0.035),
                 (0, DOOR_THICK/2 + 0.008, DOOR_HEIGHT + FRAME_W + 0.018), gold)
     parts.append(crown)
 
+    # Link every part in one pass
+    for p in parts:
+        bpy.context.scene.collection.objects.link(p)
+
     # Create parent for all
-    bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-    root = bpy.context.active_object
-    root.name = "MansionDoor"
+    root = bpy.data.objects.new("MansionDoor", None)
+    root.empty_display_type = 'PLAIN_AXES'
+    bpy.context.scene.collection.objects.link(root)
 
-    for p in parts:
-        if p.parent is None:
-            p.parent = root
+    # One inverse for every child, so parts keep their world placement wherever the root sits
+    inv = root.matrix_world.inverted()
+    for p in [p for p in parts if p.parent is None]:
+        p.parent = root
+        p.matrix_parent_inverse = inv
 
     return root
 
@@ -217,9 +277,14 @@ def setup_scene(target, dist):
     direction = t - cam_obj.location
     cam_obj.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
 
-def render(filepath):
+def render(filepath, quality=None):
     scene = bpy.context.scene
-    scene.render.engine = 'BLENDER_EEVEE'
+    if quality == "fast":
+        scene.render.engine = 'BLENDER_WORKBENCH'
+        scene.display.shading.light = 'STUDIO'
+    else:
+        scene.render.engine = 'BLENDER_EEVEE'
+        scene.eevee.taa_render_samples = PREVIEW_SAMPLES
     scene.render.resolution_x = 1024
     scene.render.resolution_y = 768
     scene.render.filepath = filepath
@@ -244,18 +309,21 @@ def export(filepath):
     print(f"GLB: {filepath}")
 
 def info():
-    min_c = Vector((float('inf'),) * 3)
-    max_c = Vector((float('-inf'),) * 3)
+    min_c = np.full(3, np.inf)
+    max_c = np.full(3, -np.inf)
     verts, faces = 0, 0
     for o in bpy.data.objects:
         if o.type == 'MESH':
             verts += len(o.data.vertices)
             faces += len(o.data.polygons)
-            for v in o.data.vertices:
-                w = o.matrix_world @ v.co
-                min_c = Vector((min(min_c[i], w[i]) for i in range(3)))
-                max_c = Vector((max(max_c[i], w[i]) for i in range(3)))
-    dims = [round(max_c[i] - min_c[i], 3) for i in range(3)]
+            # World-space bounds of all verts in one matmul rather than a Vector per vertex
+            co = np.empty(len(o.data.vertices) * 3, dtype=np.float32)
+            o.data.vertices.foreach_get("co", co)
+            m = np.array(o.matrix_world)
+            w = co.reshape(-1, 3) @ m[:3, :3].T + m[:3, 3]
+            min_c = np.minimum(min_c, w.min(axis=0))
+            max_c = np.maximum(max_c, w.max(axis=0))
+    dims = [round(float(max_c[i] - min_c[i]), 3) for i in range(3)]
     print(f"INFO: {json.dumps({'name': ASSET_NAME, 'dims': dims, 'verts': verts, 'faces': faces})}")
 
 def main():
@@ -265,7 +333,7 @@ def main():
     try:
         generate()
         setup_scene((0, 0, DOOR_HEIGHT/2), 4)
-        render(f"{out}/{ASSET_NAME}_preview.png")
+        render(f"{out}/{ASSET_NAME}_preview.png", args.get("preview_quality"))
         export(f"{out}/{ASSET_NAME}.glb")
         info()
     except Exception as e:
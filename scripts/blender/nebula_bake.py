@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Nebula Density Bake
+Precomputes the nebula noise/falloff fields on the CPU and writes them as an
+OpenVDB file, so Cycles does a voxel lookup per volume step instead of
+evaluating three noise nodes plus the mix/falloff chain.
+
+Pure NumPy - importable both inside Blender and from plain Python. When
+pyfastnoisesimd is installed (pip install pyfastnoisesimd into Blender's
+Python), noise layers are filled by its SIMD backend in one call each; when
+numba is installed, the mix/falloff/ramp reduction runs as one fused
+parallel loop instead of a chain of NumPy temporaries, and fbm_points()
+(vertex displacement for the v2/v3 shells) is a jitted per-point loop.
+Arrays are indexed [x, y, z] to match OpenVDB's ijk ordering.
+"""
+import math
+import os
+
+import numpy as np
+
+try:
+    import pyfastnoisesimd as fns
+except ImportError:
+    fns = None
+
+# Keep numba's compiled kernels next to the script so each `blender -b` run
+# loads them from disk instead of re-JITting (must be set before import)
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".numba_cache"),
+)
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Mirrors the ShaderNodeTexNoise settings in create_nebula_volume():
+# (scale, detail, roughness, distortion)
+NOISE_LAYERS = (
+    (2.0, 8.0, 0.6, 1.5),   # Primary (large structure with filaments)
+    (5.0, 12.0, 0.7, 0.8),  # Secondary (wisps)
+    (1.0, 4.0, 0.5, 3.0),   # Curl-like distortion
+)
+MAPPING_SCALE = 1.5
+DENSITY_SCALE = 15.0
+EMISSION_RAMP = (0.4, 0.8)  # Emission Map Range: black at 0.4 -> full color at 0.8
+SLAB = 16  # x-slices evaluated per batch to bound temporary memory
+
+
+# ============================================================
+# PERLIN NOISE
+# ============================================================
+def make_permutation(seed):
+    """Doubled 256-entry permutation table for lattice hashing."""
+    rng = np.random.default_rng(seed)
+    perm = rng.permutation(256).astype(np.int32)
+    return np.concatenate([perm, perm])
+
+
+def _fade(t):
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+
+def _grad(h, x, y, z):
+    h = h & 15
+    u = np.where(h < 8, x, y)
+    v = np.where(h < 4, y, np.where((h == 12) | (h == 14), x, z))
+    return np.where(h & 1, -u, u) + np.where(h & 2, -v, v)
+
+
+def perlin3(x, y, z, perm):
+    """Improved Perlin noise in [-1, 1], vectorized over arrays."""
+    xi = np.floor(x)
+    yi = np.floor(y)
+    zi = np.floor(z)
+    xf, yf, zf = x - xi, y - yi, z - zi
+    xi = xi.astype(np.int32) & 255
+    yi = yi.astype(np.int32) & 255
+    zi = zi.astype(np.int32) & 255
+    u, v, w = _fade(xf), _fade(yf), _fade(zf)
+
+    a = perm[xi] + yi
+    aa = perm[a] + zi
+    ab = perm[a + 1] + zi
+    b = perm[xi + 1] + yi
+    ba = perm[b] + zi
+    bb = perm[b + 1] + zi
+
+    x1 = xf - 1
+    y1 = yf - 1
+    z1 = zf - 1
+    c000 = _grad(perm[aa], xf, yf, zf)
+    c100 = _grad(perm[ba], x1, yf, zf)
+    c010 = _grad(perm[ab], xf, y1, zf)
+    c110 = _grad(perm[bb], x1, y1, zf)
+    c001 = _grad(perm[aa + 1], xf, yf, z1)
+    c101 = _grad(perm[ba + 1], x1, yf, z1)
+    c011 = _grad(perm[ab + 1], xf, y1, z1)
+    c111 = _grad(perm[bb + 1], x1, y1, z1)
+
+    x00 = c000 + u * (c100 - c000)
+    x10 = c010 + u * (c110 - c010)
+    x01 = c001 + u * (c101 - c001)
+    x11 = c011 + u * (c111 - c011)
+    y0 = x00 + v * (x10 - x00)
+    y1_ = x01 + v * (x11 - x01)
+    return y0 + w * (y1_ - y0)
+
+
+def noise_texture(x, y, z, perm, scale, detail, roughness, distortion, octave_cap):
+    """Approximate ShaderNodeTexNoise 'Fac' (fBm with domain distortion) in [0, 1]."""
+    x, y, z = x * scale, y * scale, z * scale
+
+    if distortion:
+        # Domain warp with per-axis offsets, as the noise node does
+        dx = perlin3(x + 13.5, y + 13.5, z + 13.5, perm)
+        dy = perlin3(x - 27.1, y - 27.1, z - 27.1, perm)
+        dz = perlin3(x + 61.7, y + 61.7, z + 61.7, perm)
+        x, y, z = x + dx * distortion, y + dy * distortion, z + dz * distortion
+
+    octaves = min(int(detail), octave_cap)
+    total = np.zeros_like(x)
+    amp, freq, max_amp = 1.0, 1.0, 0.0
+    for _ in range(octaves + 1):
+        total += perlin3(x * freq, y * freq, z * freq, perm) * amp
+        max_amp += amp
+        amp *= roughness
+        freq *= 2.0
+    return total / max_amp * 0.5 + 0.5
+
+
+def nyquist_octaves(scale, voxel_size, mapping_scale=MAPPING_SCALE):
+    """Octaves beyond the grid's Nyquist limit only alias, so they are skipped."""
+    step = voxel_size * mapping_scale * scale
+    return max(0, int(math.floor(math.log2(0.5 / step))))
+
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _grad_scalar(h, x, y, z):
+        h = h & 15
+        u = x if h < 8 else y
+        if h < 4:
+            v = y
+        elif h == 12 or h == 14:
+            v = x
+        else:
+            v = z
+        return (-u if h & 1 else u) + (-v if h & 2 else v)
+
+    @numba.njit(cache=True, fastmath=True)
+    def _perlin_scalar(x, y, z, perm):
+        """perlin3() for a single point."""
+        fx = math.floor(x)
+        fy = math.floor(y)
+        fz = math.floor(z)
+        xi = int(fx) & 255
+        yi = int(fy) & 255
+        zi = int(fz) & 255
+        xf, yf, zf = x - fx, y - fy, z - fz
+        u = xf * xf * xf * (xf * (xf * 6 - 15) + 10)
+        v = yf * yf * yf * (yf * (yf * 6 - 15) + 10)
+        w = zf * zf * zf * (zf * (zf * 6 - 15) + 10)
+
+        a = perm[xi] + yi
+        aa = perm[a] + zi
+        ab = perm[a + 1] + zi
+        b = perm[xi + 1] + yi
+        ba = perm[b] + zi
+        bb = perm[b + 1] + zi
+
+        x00 = _grad_scalar(perm[aa], xf, yf, zf)
+        x00 += u * (_grad_scalar(perm[ba], xf - 1, yf, zf) - x00)
+        x10 = _grad_scalar(perm[ab], xf, yf - 1, zf)
+        x10 += u * (_grad_scalar(perm[bb], xf - 1, yf - 1, zf) - x10)
+        x01 = _grad_scalar(perm[aa + 1], xf, yf, zf - 1)
+        x01 += u * (_grad_scalar(perm[ba + 1], xf - 1, yf, zf - 1) - x01)
+        x11 = _grad_scalar(perm[ab + 1], xf, yf - 1, zf - 1)
+        x11 += u * (_grad_scalar(perm[bb + 1], xf - 1, yf - 1, zf - 1) - x11)
+        y0 = x00 + v * (x10 - x00)
+        y1 = x01 + v * (x11 - x01)
+        return y0 + w * (y1 - y0)
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _fbm_points_numba(pts, perm, scale, octaves, roughness):
+        out = np.empty(pts.shape[0], dtype=np.float32)
+        for n in numba.prange(pts.shape[0]):
+            x = pts[n, 0] * scale
+            y = pts[n, 1] * scale
+            z = pts[n, 2] * scale
+            total = 0.0
+            amp, freq, max_amp = 1.0, 1.0, 0.0
+            for _ in range(octaves + 1):
+                total += _perlin_scalar(x * freq, y * freq, z * freq, perm) * amp
+                max_amp += amp
+                amp *= roughness
+                freq *= 2.0
+            out[n] = total / max_amp * 0.5 + 0.5
+        return out
+else:
+    _fbm_points_numba = None
+
+
+def fbm_points(pts, perm, scale, octaves, roughness=0.5):
+    """
+    noise_texture() without distortion for an (N, 3) point array. Runs as a
+    parallel numba loop when numba is installed, else vectorized NumPy.
+    """
+    pts = np.ascontiguousarray(pts, dtype=np.float32)
+    if _fbm_points_numba is not None:
+        return _fbm_points_numba(pts, perm, float(scale), int(octaves), float(roughness))
+    return noise_texture(
+        pts[:, 0], pts[:, 1], pts[:, 2], perm, scale, octaves, roughness, 0.0, octave_cap=int(octaves)
+    )
+
+
+def fastnoise_grid(res, voxel_size, seed, scale, detail, roughness, distortion, octave_cap):
+    """Fill one noise layer on a res^3 grid with pyfastnoisesimd (SIMD, multithreaded)."""
+    noise = fns.Noise(seed=seed, numWorkers=os.cpu_count() or 1)
+    noise.noiseType = fns.NoiseType.PerlinFractal
+    noise.frequency = voxel_size * MAPPING_SCALE * scale
+    noise.fractal.fractalType = fns.FractalType.FBM
+    noise.fractal.octaves = min(int(detail), octave_cap) + 1
+    noise.fractal.gain = roughness
+    noise.fractal.lacunarity = 2.0
+    if distortion:
+        # Gradient perturb is measured in grid cells; convert from noise units
+        noise.perturb.perturbType = fns.PerturbType.Gradient
+        noise.perturb.amp = distortion / (voxel_size * MAPPING_SCALE * scale)
+        noise.perturb.frequency = noise.frequency
+
+    grid = noise.genAsGrid(shape=[res, res, res], start=[0, 0, 0])
+    return grid * 0.5 + 0.5
+
+
+# ============================================================
+# MIXING (matches the shader graph)
+# ============================================================
+def mix_multiply(c1, c2, fac):
+    return c1 * (1 - fac) + c1 * c2 * fac
+
+
+def mix_overlay(c1, c2, fac):
+    facm = 1 - fac
+    return np.where(
+        c1 < 0.5,
+        c1 * (facm + 2 * fac * c2),
+        1 - (facm + 2 * fac * (1 - c2)) * (1 - c1),
+    )
+
+
+def fuse(n1, n2, n3, r, radius):
+    """Combine noise layers into (density, emission factor)."""
+    mix1 = mix_multiply(n1, n2, 0.7)
+    mix2 = mix_overlay(mix1, n3, 0.4)
+    falloff = np.clip(1 - r / radius, 0, 1) ** 2
+    density = mix2 * falloff * DENSITY_SCALE
+    lo, hi = EMISSION_RAMP
+    emission = np.clip((mix2 - lo) / (hi - lo), 0, 1) * (r < radius)
+    return density, emission
+
+
+if numba is not None:
+    @numba.njit(
+        "void(f4[:,:,:], f4[:,:,:], f4[:,:,:], f4[:], f4[:], f4[:], f8, f4[:,:,:], f4[:,:,:])",
+        parallel=True, fastmath=True, cache=True,
+    )
+    def fuse_into(n1, n2, n3, xs, ys, zs, radius, density, emission):
+        """fuse() as a single parallel loop, writing into density/emission in place."""
+        lo, hi = EMISSION_RAMP
+        for i in numba.prange(n1.shape[0]):
+            for j in range(n1.shape[1]):
+                for k in range(n1.shape[2]):
+                    a = n1[i, j, k]
+                    mix1 = a * 0.3 + a * n2[i, j, k] * 0.7
+                    c2 = n3[i, j, k]
+                    if mix1 < 0.5:
+                        mix2 = mix1 * (0.6 + 0.8 * c2)
+                    else:
+                        mix2 = 1 - (0.6 + 0.8 * (1 - c2)) * (1 - mix1)
+
+                    r = math.sqrt(xs[i] * xs[i] + ys[j] * ys[j] + zs[k] * zs[k])
+                    falloff = min(max(1 - r / radius, 0.0), 1.0)
+                    density[i, j, k] = mix2 * falloff * falloff * DENSITY_SCALE
+
+                    ramp = min(max((mix2 - lo) / (hi - lo), 0.0), 1.0)
+                    emission[i, j, k] = ramp if r < radius else 0.0
+else:
+    fuse_into = None
+
+
+# ============================================================
+# BAKE
+# ============================================================
+def build_density_volume(res=256, radius=2.0, seed=42, backend="auto"):
+    """
+    Sample the nebula fields on a res^3 grid spanning [-radius, radius]^3.
+    Returns (density, emission) float32 arrays indexed [x, y, z].
+
+    backend: "auto" uses pyfastnoisesimd when importable, "numpy" forces the
+    vectorized Perlin fallback.
+    """
+    perm = make_permutation(seed)
+    voxel_size = 2 * radius / res
+    axis = (np.arange(res, dtype=np.float32) + 0.5) * voxel_size - radius
+    caps = [nyquist_octaves(layer[0], voxel_size) for layer in NOISE_LAYERS]
+
+    grids = None
+    if fns is not None and backend != "numpy":
+        grids = [
+            fastnoise_grid(res, voxel_size, seed, *layer, octave_cap=cap)
+            for layer, cap in zip(NOISE_LAYERS, caps)
+        ]
+
+    density = np.empty((res, res, res), dtype=np.float32)
+    emission = np.empty((res, res, res), dtype=np.float32)
+
+    for start in range(0, res, SLAB):
+        xs = axis[start:start + SLAB]
+        x, y, z = np.meshgrid(xs, axis, axis, indexing="ij")
+
+        if grids is not None:
+            n1, n2, n3 = (g[start:start + SLAB] for g in grids)
+        else:
+            mx, my, mz = x * MAPPING_SCALE, y * MAPPING_SCALE, z * MAPPING_SCALE
+            n1, n2, n3 = (
+                noise_texture(mx, my, mz, perm, *layer, octave_cap=cap)
+                for layer, cap in zip(NOISE_LAYERS, caps)
+            )
+
+        if fuse_into is not None:
+            fuse_into(
+                n1, n2, n3, xs, axis, axis, radius,
+                density[start:start + SLAB], emission[start:start + SLAB],
+            )
+        else:
+            r = np.sqrt(x * x + y * y + z * z)
+            d, e = fuse(n1, n2, n3, r, radius)
+            density[start:start + SLAB] = d
+            emission[start:start + SLAB] = e
+
+    return density, emission
+
+
+def write_vdb(filepath, grids, voxel_size):
+    """
+    Write named float grids to an OpenVDB file (uses Blender's bundled module).
+    Voxel (0, 0, 0) lands at the object origin; offset the Volume object by
+    grid_origin() to center the bake.
+    """
+    try:
+        import openvdb as vdb  # Blender 4.x
+    except ImportError:
+        import pyopenvdb as vdb  # Blender 3.x
+
+    out = []
+    for name, array in grids.items():
+        grid = vdb.FloatGrid()
+        grid.copyFromArray(array)
+        grid.name = name
+        grid.transform = vdb.createLinearTransform(voxelSize=voxel_size)
+        out.append(grid)
+    vdb.write(filepath, grids=out)
+
+
+def grid_origin(res, radius):
+    """World position of voxel (0, 0, 0) for a grid from build_density_volume()."""
+    voxel_size = 2 * radius / res
+    return -radius + 0.5 * voxel_size
@@ -0,0 +1,817 @@
+#!/usr/bin/env python3
+"""
+Nebula Common - shared scene building for the nebula generators
+Volume (baked VDB or procedural node graph), instanced internal stars and
+per-variant retinting, used by generate_nebula_final.py,
+generate_nebula_slices.py and nebula_layered.py (generate_nebula_v2.py/v3.py).
+
+Import from a Blender script with:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import nebula_common
+"""
+import bpy
+import bmesh
+import sys
+import os
+import hashlib
+import tempfile
+from collections import namedtuple
+import numpy as np
+from mathutils import Euler
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import nebula_bake  # noqa: E402
+
+NEBULA_RADIUS = 2.0
+VDB_RESOLUTION = 256
+STAR_COUNT = 12
+# Baked shader noise: 128 z-slices of 128^2 stacked into a 128 x 16384 image,
+# the tallest texture EEVEE/GPU backends reliably accept
+NOISE_ATLAS_RESOLUTION = 128
+OSL_NOISE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "nebula_noise.osl")
+# Prebuilt world, star mesh/material and slice camera (build_nebula_template.py)
+TEMPLATE_BLEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "nebula_template.blend")
+# Blender's default PNG level, set explicitly since the template blend may carry
+# a slower one; higher levels shave little off a soft nebula and cost encode time
+PNG_COMPRESSION = 15
+
+
+def parse_args():
+    argv = sys.argv
+    if "--" in argv:
+        script_args = argv[argv.index("--") + 1:]
+    else:
+        script_args = []
+    args = {}
+    for arg in script_args:
+        if "=" in arg:
+            key, val = arg.split("=", 1)
+            args[key.lstrip("-")] = val
+    return args
+
+
+def parse_variants(args, topic_colors):
+    """Pick the variants to render: one named/colored variant, or all topic colors."""
+    name = args.get("name")
+    if name is None:
+        return list(topic_colors.items())
+    if "color" in args:
+        color = tuple(float(c) for c in args["color"].split(","))
+    else:
+        color = topic_colors[name]
+    return [(name, color)]
+
+
+def render_cache_key(*parts):
+    """Hash everything that affects a render into one hex key."""
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def is_render_cached(output_dir, name, key):
+    """True when nebula_{name}.png exists and its .cache sidecar holds key."""
+    sidecar = os.path.join(output_dir, f"nebula_{name}.cache")
+    if not os.path.exists(os.path.join(output_dir, f"nebula_{name}.png")):
+        return False
+    try:
+        with open(sidecar) as f:
+            return f.read().strip() == key
+    except OSError:
+        return False
+
+
+def write_render_cache(output_dir, name, key):
+    """Record key next to a freshly rendered nebula_{name}.png."""
+    with open(os.path.join(output_dir, f"nebula_{name}.cache"), "w") as f:
+        f.write(key)
+
+
+def cleanup(use_template=True):
+    """
+    Start from nebula_template.blend when it exists (skips default-scene setup
+    and reuses its prebuilt datablocks), else from empty factory settings.
+    """
+    if use_template and os.path.exists(TEMPLATE_BLEND):
+        bpy.ops.wm.open_mainfile(filepath=TEMPLATE_BLEND)
+    else:
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+        world = bpy.data.worlds.new("NebulaWorld")
+        bpy.context.scene.world = world
+        world.use_nodes = True
+        bg = world.node_tree.nodes["Background"]
+        bg.inputs["Color"].default_value = (0, 0, 0, 1)
+        bg.inputs["Strength"].default_value = 0
+
+    # Batch build: nothing to undo, so don't snapshot the scene per edit
+    bpy.context.preferences.edit.use_global_undo = False
+
+
+def new_noise_node(nodes, noise_mode="builtin"):
+    """
+    Add a 3D noise node. noise_mode="osl" uses nebula_noise.osl (Perlin with an
+    ALU-only FNV lattice hash) through a Script node with the same sockets.
+    """
+    if noise_mode != "osl":
+        node = nodes.new("ShaderNodeTexNoise")
+        node.noise_dimensions = '3D'
+        return node
+
+    # OSL needs Cycles' OSL shading system (CPU, or OptiX on GPU)
+    bpy.context.scene.cycles.shading_system = True
+
+    node = nodes.new("ShaderNodeScript")
+    node.mode = 'EXTERNAL'
+    node.filepath = OSL_NOISE_PATH
+
+    # Compile and create sockets now; the node editor operator needs a UI context
+    from cycles import osl
+    osl.update_script_node(node, lambda kind, msg: print(f"OSL: {msg}"))
+    return node
+
+
+def add_emission_color(nodes, links, fac_socket, location):
+    """fac * EmissionColor (an RGB node set per variant by apply_variant())."""
+    color = nodes.new("ShaderNodeRGB")
+    color.name = "EmissionColor"
+    color.location = (location[0] - 200, location[1] - 150)
+
+    scaled = nodes.new("ShaderNodeMixRGB")
+    scaled.location = location
+    scaled.blend_type = 'MULTIPLY'
+    scaled.inputs["Fac"].default_value = 1.0
+    links.new(fac_socket, scaled.inputs["Color1"])
+    links.new(color.outputs["Color"], scaled.inputs["Color2"])
+    return scaled
+
+
+def displaced_ico_mesh(name, radius, subdivisions=2, location=(0, 0, 0), scale=(1, 1, 1),
+                       noise_scale=0.25, noise_depth=2, strength=1.0, global_coords=False, seed=0):
+    """
+    Icosphere mesh pushed along its normals by cloud-style fBm noise.
+    Stands in for primitive_ico_sphere_add + CLOUDS Displace + modifier_apply
+    without operators, texture datablocks or depsgraph evaluation: noise
+    coordinates are the (scaled) local vertex positions, or world positions
+    (offset by location) with global_coords, divided by noise_scale;
+    displacement is (noise - 0.5) * strength, as the Displace modifier's
+    default midlevel.
+    """
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    bmesh.ops.create_icosphere(bm, subdivisions=subdivisions, radius=radius)
+    bmesh.ops.scale(bm, vec=scale, verts=bm.verts)
+    bm.to_mesh(mesh)
+    bm.free()
+
+    count = len(mesh.vertices)
+    co = np.empty(count * 3, dtype=np.float32)
+    normals = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    mesh.vertices.foreach_get("normal", normals)
+    co = co.reshape(-1, 3)
+    normals = normals.reshape(-1, 3)
+
+    p = co + np.asarray(location, dtype=np.float32) if global_coords else co
+    noise = nebula_bake.fbm_points(p, nebula_bake.make_permutation(seed), 1.0 / noise_scale, noise_depth)
+    co += normals * ((noise - 0.5) * strength)[:, None]
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.update()
+    return mesh
+
+
+def make_displaced_ico(name, radius, subdivisions=2, location=(0, 0, 0), scale=(1, 1, 1),
+                       rotation=(0, 0, 0), **displacement):
+    """Object for displaced_ico_mesh(), placed at location/rotation."""
+    mesh = displaced_ico_mesh(name, radius, subdivisions, location, scale, **displacement)
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    obj.rotation_euler = rotation
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+# One part of a layered nebula: a displaced icosphere shell (placement plus
+# displaced_ico_mesh() keyword arguments) and its density, emission strength
+# and emission color scale
+NebulaRegion = namedtuple("NebulaRegion", [
+    "name", "radius", "subdivisions", "location", "scale", "rotation",
+    "displacement", "density", "emission", "color_scale",
+])
+
+
+def scaled_color(color, scale):
+    """Brighten or dim a color, clamped to 1.0 per channel."""
+    return tuple(min(1.0, c * scale) for c in color)
+
+
+def create_region_hull(name, regions):
+    """
+    One convex mesh enclosing every region's displaced shell. Rendering a
+    single volume object avoids the boundary sorting and overlapping marches
+    of one volume per region; the shader tells the regions apart with
+    add_region_masks().
+    """
+    points = []
+    for region in regions:
+        mesh = displaced_ico_mesh(
+            region.name, region.radius, region.subdivisions,
+            region.location, region.scale, **region.displacement,
+        )
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        bpy.data.meshes.remove(mesh)
+
+        rot = np.array(Euler(region.rotation).to_matrix(), dtype=np.float32)
+        points.append(co.reshape(-1, 3) @ rot.T + np.asarray(region.location, dtype=np.float32))
+
+    bm = bmesh.new()
+    for co in np.concatenate(points):
+        bm.verts.new(co)
+    hull = bmesh.ops.convex_hull(bm, input=bm.verts)
+    bmesh.ops.delete(bm, geom=hull["geom_interior"] + hull["geom_unused"], context='VERTS')
+
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def add_region_masks(nodes, links, position_socket, regions, edge=0.2, location=(0, 0)):
+    """
+    Per-region weights from ellipsoid distance (1 inside, fading to 0 over
+    `edge` of the radius at the shell). Returns sockets for the summed
+    density (sum of weight * density) and emission color
+    (sum of weight * emission * RegionColor_<name>).
+    """
+    x, y = location
+    density = None
+    emission = None
+
+    for i, region in enumerate(regions):
+        row = y - 250 * i
+
+        # Into the region's unit sphere: inverse of its location/rotation/size
+        local = nodes.new("ShaderNodeMapping")
+        local.vector_type = 'TEXTURE'
+        local.location = (x, row)
+        local.inputs["Location"].default_value = region.location
+        local.inputs["Rotation"].default_value = region.rotation
+        local.inputs["Scale"].default_value = tuple(region.radius * s for s in region.scale)
+        links.new(position_socket, local.inputs["Vector"])
+
+        dist = nodes.new("ShaderNodeVectorMath")
+        dist.operation = 'LENGTH'
+        dist.location = (x + 200, row)
+        links.new(local.outputs["Vector"], dist.inputs[0])
+
+        weight = nodes.new("ShaderNodeMath")
+        weight.operation = 'MULTIPLY_ADD'
+        weight.use_clamp = True
+        weight.location = (x + 400, row)
+        links.new(dist.outputs["Value"], weight.inputs[0])
+        weight.inputs[1].default_value = -1.0 / edge
+        weight.inputs[2].default_value = 1.0 / edge
+
+        # density += weight * region.density
+        acc = nodes.new("ShaderNodeMath")
+        acc.operation = 'MULTIPLY_ADD'
+        acc.location = (x + 600, row)
+        links.new(weight.outputs["Value"], acc.inputs[0])
+        acc.inputs[1].default_value = region.density
+        if density is None:
+            acc.inputs[2].default_value = 0.0
+        else:
+            links.new(density, acc.inputs[2])
+        density = acc.outputs["Value"]
+
+        # emission += weight * region.emission * color
+        color = nodes.new("ShaderNodeRGB")
+        color.name = f"RegionColor_{region.name}"
+        color.location = (x + 400, row - 120)
+
+        strength = nodes.new("ShaderNodeMath")
+        strength.operation = 'MULTIPLY'
+        strength.location = (x + 600, row - 120)
+        links.new(weight.outputs["Value"], strength.inputs[0])
+        strength.inputs[1].default_value = region.emission
+
+        glow = nodes.new("ShaderNodeVectorMath")
+        glow.operation = 'SCALE'
+        glow.location = (x + 800, row - 120)
+        links.new(color.outputs["Color"], glow.inputs[0])
+        links.new(strength.outputs["Value"], glow.inputs["Scale"])
+
+        if emission is None:
+            emission = glow.outputs["Vector"]
+        else:
+            total = nodes.new("ShaderNodeVectorMath")
+            total.operation = 'ADD'
+            total.location = (x + 1000, row - 120)
+            links.new(emission, total.inputs[0])
+            links.new(glow.outputs["Vector"], total.inputs[1])
+            emission = total.outputs["Vector"]
+
+    return density, emission
+
+
+def set_region_colors(nodes, regions, color):
+    """Point every RegionColor_<name> node at color times its region's scale."""
+    for region in regions:
+        node = nodes[f"RegionColor_{region.name}"]
+        node.outputs["Color"].default_value = (*scaled_color(color, region.color_scale), 1)
+
+
+def bake_noise_atlas(name, layers, mapping_scale, extent, combine, res=NOISE_ATLAS_RESOLUTION, seed=0):
+    """
+    Bake noise-texture layers (scale, detail, roughness, distortion), mixed by
+    combine(*layers), on a res^3 grid spanning [-extent, extent]^3 of object
+    space. Stored as a float image of res z-slices stacked vertically; read it
+    with add_noise_atlas_lookup(). The grid is cached as .npy in the temp dir.
+    """
+    key = render_cache_key(layers, mapping_scale, extent, combine.__name__, res, seed)
+    cache_path = os.path.join(tempfile.gettempdir(), f"nebula_noise_{key[:16]}.npy")
+    if os.path.exists(cache_path):
+        values = np.load(cache_path)
+    else:
+        perm = nebula_bake.make_permutation(seed)
+        voxel_size = 2 * extent / res
+        caps = [nebula_bake.nyquist_octaves(layer[0], voxel_size, mapping_scale) for layer in layers]
+        axis = (np.arange(res, dtype=np.float32) + 0.5) * voxel_size - extent
+
+        # [z, y, x] so rows run along x and each z-slice is one res x res tile
+        values = np.empty((res, res, res), dtype=np.float32)
+        for start in range(0, res, nebula_bake.SLAB):
+            z, y, x = np.meshgrid(axis[start:start + nebula_bake.SLAB], axis, axis, indexing="ij")
+            x, y, z = x * mapping_scale, y * mapping_scale, z * mapping_scale
+            noises = [
+                nebula_bake.noise_texture(x, y, z, perm, *layer, octave_cap=cap)
+                for layer, cap in zip(layers, caps)
+            ]
+            values[start:start + nebula_bake.SLAB] = combine(*noises)
+        np.save(cache_path, values)
+
+    pixels = np.ones((res * res * res, 4), dtype=np.float32)
+    pixels[:, :3] = values.reshape(-1, 1)
+    img = bpy.data.images.new(name, res, res * res, alpha=False, float_buffer=True)
+    img.colorspace_settings.name = 'Non-Color'
+    img.pixels.foreach_set(pixels.ravel())
+    return img
+
+
+def add_noise_atlas_lookup(nodes, links, image, vector_socket, extent, location=(0, 0)):
+    """
+    Trilinear read of a bake_noise_atlas() image at an object-space vector:
+    bilinear within the two nearest z-slices, blended between them.
+    Returns the Color output socket.
+    """
+    res = image.size[0]
+    x, y = location
+
+    # Object space -> [0, 1]^3 over the baked box
+    to_unit = nodes.new("ShaderNodeVectorMath")
+    to_unit.operation = 'MULTIPLY_ADD'
+    to_unit.location = (x, y)
+    to_unit.inputs[1].default_value = (0.5 / extent,) * 3
+    to_unit.inputs[2].default_value = (0.5, 0.5, 0.5)
+    links.new(vector_socket, to_unit.inputs[0])
+
+    sep = nodes.new("ShaderNodeSeparateXYZ")
+    sep.location = (x + 150, y)
+    links.new(to_unit.outputs["Vector"], sep.inputs["Vector"])
+
+    def math_node(op, a, b, loc, clamp=False):
+        node = nodes.new("ShaderNodeMath")
+        node.operation = op
+        node.location = loc
+        node.use_clamp = clamp
+        for socket, value in zip(node.inputs, (a, b)):
+            if isinstance(value, (int, float)):
+                socket.default_value = value
+            else:
+                links.new(value, socket)
+        return node.outputs["Value"]
+
+    # Lower slice index (kept inside the stack) and blend weight to the next
+    z = math_node('MULTIPLY_ADD', sep.outputs["Z"], res, (x + 300, y - 150))
+    z.node.inputs[2].default_value = -0.5
+    k0 = math_node('FLOOR', z, 0.0, (x + 450, y - 150))
+    k0 = math_node('MINIMUM', math_node('MAXIMUM', k0, 0.0, (x + 600, y - 150)), res - 2, (x + 750, y - 150))
+    blend = math_node('SUBTRACT', z, k0, (x + 900, y - 150), clamp=True)
+
+    # Slice k's rows sit at v = (k + y) / res
+    v0 = math_node('DIVIDE', math_node('ADD', k0, sep.outputs["Y"], (x + 900, y)), res, (x + 1050, y))
+    v1 = math_node('ADD', v0, 1.0 / res, (x + 1200, y))
+
+    samples = []
+    for i, v in enumerate((v0, v1)):
+        uv = nodes.new("ShaderNodeCombineXYZ")
+        uv.location = (x + 1350, y - 150 * i)
+        links.new(sep.outputs["X"], uv.inputs["X"])
+        links.new(v, uv.inputs["Y"])
+
+        tex = nodes.new("ShaderNodeTexImage")
+        tex.image = image
+        tex.interpolation = 'Linear'
+        tex.extension = 'EXTEND'
+        tex.location = (x + 1500, y - 300 * i)
+        links.new(uv.outputs["Vector"], tex.inputs["Vector"])
+        samples.append(tex.outputs["Color"])
+
+    mix = nodes.new("ShaderNodeMixRGB")
+    mix.blend_type = 'MIX'
+    mix.location = (x + 1800, y)
+    links.new(blend, mix.inputs["Fac"])
+    links.new(samples[0], mix.inputs["Color1"])
+    links.new(samples[1], mix.inputs["Color2"])
+    return mix.outputs["Color"]
+
+
+def create_nebula_volume(noise_mode="builtin"):
+    """
+    Create volumetric nebula - based on working v1.
+    Color-dependent inputs are set per variant by apply_variant().
+    """
+    scene = bpy.context.scene
+
+    # Main nebula sphere (data API, no operator/undo/context overhead)
+    mesh = bpy.data.meshes.new("Nebula")
+    bm = bmesh.new()
+    bmesh.ops.create_uvsphere(bm, u_segments=32, v_segments=16, radius=NEBULA_RADIUS)
+    bm.to_mesh(mesh)
+    bm.free()
+
+    nebula = bpy.data.objects.new("Nebula_Main", mesh)
+    scene.collection.objects.link(nebula)
+
+    # Create volumetric material
+    mat = bpy.data.materials.new("NebulaMaterial")
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    nodes.clear()
+
+    output = nodes.new("ShaderNodeOutputMaterial")
+    output.location = (600, 0)
+
+    volume = nodes.new("ShaderNodeVolumePrincipled")
+    volume.location = (300, 0)
+    links.new(volume.outputs["Volume"], output.inputs["Volume"])
+
+    # Texture coordinates
+    tex_coord = nodes.new("ShaderNodeTexCoord")
+    tex_coord.location = (-800, 0)
+
+    mapping = nodes.new("ShaderNodeMapping")
+    mapping.location = (-600, 0)
+    mapping.inputs["Scale"].default_value = (1.5, 1.5, 1.5)
+    links.new(tex_coord.outputs["Object"], mapping.inputs["Vector"])
+
+    # Primary noise (large structure with filaments)
+    noise1 = new_noise_node(nodes, noise_mode)
+    noise1.location = (-400, 200)
+    noise1.inputs["Scale"].default_value = 2.0
+    noise1.inputs["Detail"].default_value = 8.0
+    noise1.inputs["Roughness"].default_value = 0.6
+    noise1.inputs["Distortion"].default_value = 1.5
+    links.new(mapping.outputs["Vector"], noise1.inputs["Vector"])
+
+    # Secondary noise (wisps)
+    noise2 = new_noise_node(nodes, noise_mode)
+    noise2.location = (-400, -100)
+    noise2.inputs["Scale"].default_value = 5.0
+    noise2.inputs["Detail"].default_value = 12.0
+    noise2.inputs["Roughness"].default_value = 0.7
+    noise2.inputs["Distortion"].default_value = 0.8
+    links.new(mapping.outputs["Vector"], noise2.inputs["Vector"])
+
+    # Curl-like distortion
+    noise3 = new_noise_node(nodes, noise_mode)
+    noise3.location = (-400, -400)
+    noise3.inputs["Scale"].default_value = 1.0
+    noise3.inputs["Detail"].default_value = 4.0
+    noise3.inputs["Distortion"].default_value = 3.0
+    links.new(mapping.outputs["Vector"], noise3.inputs["Vector"])
+
+    # Mix noises
+    mix1 = nodes.new("ShaderNodeMixRGB")
+    mix1.location = (-200, 100)
+    mix1.blend_type = 'MULTIPLY'
+    mix1.inputs["Fac"].default_value = 0.7
+    links.new(noise1.outputs["Fac"], mix1.inputs["Color1"])
+    links.new(noise2.outputs["Fac"], mix1.inputs["Color2"])
+
+    mix2 = nodes.new("ShaderNodeMixRGB")
+    mix2.location = (0, 100)
+    mix2.blend_type = 'OVERLAY'
+    mix2.inputs["Fac"].default_value = 0.4
+    links.new(mix1.outputs["Color"], mix2.inputs["Color1"])
+    links.new(noise3.outputs["Fac"], mix2.inputs["Color2"])
+
+    # Spherical falloff
+    geometry = nodes.new("ShaderNodeNewGeometry")
+    geometry.location = (-600, -600)
+
+    vec_length = nodes.new("ShaderNodeVectorMath")
+    vec_length.location = (-400, -600)
+    vec_length.operation = 'LENGTH'
+    links.new(geometry.outputs["Position"], vec_length.inputs[0])
+
+    # 1 - r/R clamped to [0, 1] in one node (replaces DIVIDE + SUBTRACT)
+    falloff = nodes.new("ShaderNodeMapRange")
+    falloff.location = (-200, -600)
+    falloff.clamp = True
+    falloff.inputs["From Min"].default_value = 0.0
+    falloff.inputs["From Max"].default_value = NEBULA_RADIUS
+    falloff.inputs["To Min"].default_value = 1.0
+    falloff.inputs["To Max"].default_value = 0.0
+    links.new(vec_length.outputs["Value"], falloff.inputs["Value"])
+
+    power = nodes.new("ShaderNodeMath")
+    power.location = (0, -600)
+    power.operation = 'POWER'
+    power.inputs[1].default_value = 2.0
+    links.new(falloff.outputs["Result"], power.inputs[0])
+
+    # Final density
+    density_mult = nodes.new("ShaderNodeMath")
+    density_mult.location = (100, 0)
+    density_mult.operation = 'MULTIPLY'
+    links.new(mix2.outputs["Color"], density_mult.inputs[0])
+    links.new(power.outputs["Value"], density_mult.inputs[1])
+
+    density_scale = nodes.new("ShaderNodeMath")
+    density_scale.location = (200, 0)
+    density_scale.operation = 'MULTIPLY'
+    density_scale.inputs[1].default_value = 15.0
+    links.new(density_mult.outputs["Value"], density_scale.inputs[0])
+    links.new(density_scale.outputs["Value"], volume.inputs["Density"])
+
+    # Emission: linear ramp black -> color over mix2 in [0.4, 0.8],
+    # as Map Range x color instead of a ColorRamp lookup
+    emission_fac = nodes.new("ShaderNodeMapRange")
+    emission_fac.location = (100, -200)
+    emission_fac.clamp = True
+    emission_fac.inputs["From Min"].default_value = 0.4
+    emission_fac.inputs["From Max"].default_value = 0.8
+    links.new(mix2.outputs["Color"], emission_fac.inputs["Value"])
+
+    emission = add_emission_color(nodes, links, emission_fac.outputs["Result"], (200, -200))
+    links.new(emission.outputs["Color"], volume.inputs["Emission Color"])
+    volume.inputs["Emission Strength"].default_value = 3.0
+    volume.inputs["Anisotropy"].default_value = 0.3
+
+    nebula.data.materials.append(mat)
+    return nebula
+
+
+def create_nebula_vdb_volume(vdb_path):
+    """
+    Create the nebula as a Volume object backed by a baked OpenVDB grid.
+    Noise, mixing and falloff are evaluated once in NumPy instead of by
+    Cycles at every volume step; the shader only reads grid attributes.
+    """
+    density, emission = nebula_bake.build_density_volume(VDB_RESOLUTION, NEBULA_RADIUS)
+    nebula_bake.write_vdb(
+        vdb_path,
+        {"density": density, "emission": emission},
+        voxel_size=2 * NEBULA_RADIUS / VDB_RESOLUTION,
+    )
+
+    volume_data = bpy.data.volumes.new("NebulaVolume")
+    volume_data.filepath = vdb_path
+    volume_data.grids.load()
+
+    nebula = bpy.data.objects.new("Nebula_Main", volume_data)
+    bpy.context.scene.collection.objects.link(nebula)
+    origin = nebula_bake.grid_origin(VDB_RESOLUTION, NEBULA_RADIUS)
+    nebula.location = (origin, origin, origin)
+
+    mat = bpy.data.materials.new("NebulaMaterial")
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    nodes.clear()
+
+    output = nodes.new("ShaderNodeOutputMaterial")
+    output.location = (600, 0)
+
+    volume = nodes.new("ShaderNodeVolumePrincipled")
+    volume.location = (300, 0)
+    links.new(volume.outputs["Volume"], output.inputs["Volume"])
+
+    # Density comes straight from the baked grid (falloff and scale included)
+    volume.inputs["Density"].default_value = 1.0
+    volume.inputs["Density Attribute"].default_value = "density"
+
+    # Emission: baked ramp factor x topic color (set by apply_variant)
+    emission_attr = nodes.new("ShaderNodeAttribute")
+    emission_attr.location = (-200, -200)
+    emission_attr.attribute_name = "emission"
+
+    emission = add_emission_color(nodes, links, emission_attr.outputs["Fac"], (0, -200))
+    links.new(emission.outputs["Color"], volume.inputs["Emission Color"])
+    volume.inputs["Emission Strength"].default_value = 3.0
+    volume.inputs["Anisotropy"].default_value = 0.3
+
+    volume_data.materials.append(mat)
+    return nebula
+
+
+def make_star_material():
+    """
+    One emissive material shared by every star. Per-star tint and strength
+    come from object custom properties; the topic color is the StarColor node.
+    """
+    mat = bpy.data.materials.get("StarMat")
+    if mat is not None:
+        return mat
+
+    mat = bpy.data.materials.new("StarMat")
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    bsdf = nodes.get("Principled BSDF")
+
+    tint = nodes.new("ShaderNodeAttribute")
+    tint.attribute_type = 'OBJECT'
+    tint.attribute_name = "tint"
+    tint.location = (-600, 0)
+
+    strength = nodes.new("ShaderNodeAttribute")
+    strength.attribute_type = 'OBJECT'
+    strength.attribute_name = "strength"
+    strength.location = (-600, -300)
+
+    star_color = nodes.new("ShaderNodeRGB")
+    star_color.name = "StarColor"
+    star_color.location = (-600, -150)
+
+    # Color variation from white to tinted
+    mix = nodes.new("ShaderNodeMixRGB")
+    mix.blend_type = 'MIX'
+    mix.location = (-300, 0)
+    mix.inputs["Color1"].default_value = (1, 1, 1, 1)
+    links.new(tint.outputs["Fac"], mix.inputs["Fac"])
+    links.new(star_color.outputs["Color"], mix.inputs["Color2"])
+
+    links.new(mix.outputs["Color"], bsdf.inputs["Emission Color"])
+    links.new(strength.outputs["Fac"], bsdf.inputs["Emission Strength"])
+    return mat
+
+
+def make_star_template():
+    """Low-poly unit sphere mesh shared by all star objects."""
+    mesh = bpy.data.meshes.get("StarTemplate")
+    if mesh is not None:
+        return mesh
+
+    mesh = bpy.data.meshes.new("StarTemplate")
+    bm = bmesh.new()
+    bmesh.ops.create_uvsphere(bm, u_segments=8, v_segments=4, radius=1.0)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+
+def add_internal_stars(count=STAR_COUNT, radius_range=(0.3, 1.5), radius_bias=1.0,
+                       size_range=(0.02, 0.06), strength_range=(20, 50), tint_range=(0, 0.4),
+                       seed=42):
+    """
+    Add emissive stars inside nebula. Returns the shared star material.
+    radius_bias > 1 pulls stars toward the center (r ** bias).
+    """
+    rng = np.random.default_rng(seed)
+    r = rng.uniform(*radius_range, count) ** radius_bias
+    theta = rng.uniform(0, 2 * np.pi, count)
+    phi = rng.uniform(0, np.pi, count)
+    positions = np.stack([
+        r * np.sin(phi) * np.cos(theta),
+        r * np.sin(phi) * np.sin(theta),
+        r * np.cos(phi),
+    ], axis=1)
+    radii = rng.uniform(*size_range, count)
+    tints = rng.uniform(*tint_range, count)
+    strengths = rng.uniform(*strength_range, count)
+
+    scene = bpy.context.scene
+    mesh = make_star_template()
+    mat = make_star_material()
+    if not mesh.materials:
+        mesh.materials.append(mat)
+
+    for i in range(count):
+        star = bpy.data.objects.new(f"Star_{i}", mesh)
+        star.location = positions[i]
+        star.scale = (radii[i],) * 3
+        star["tint"] = float(tints[i])
+        star["strength"] = float(strengths[i])
+        scene.collection.objects.link(star)
+
+    return mat
+
+
+def set_star_color(star_mat, color):
+    """Retint every star that shares star_mat."""
+    star_mat.node_tree.nodes["StarColor"].outputs["Color"].default_value = (*color, 1)
+
+
+def read_pixels(path):
+    """Load an image file as a (height, width, 4) float32 array."""
+    img = bpy.data.images.load(path)
+    w, h = img.size
+    pixels = np.empty(w * h * 4, dtype=np.float32)
+    img.pixels.foreach_get(pixels)
+    bpy.data.images.remove(img)
+    return pixels.reshape(h, w, 4)
+
+
+def write_png(pixels, filepath):
+    """
+    Save a (height, width, 4) linear float array as an 8-bit RGBA PNG through
+    the scene's color management, as a render would be.
+    """
+    scene = bpy.context.scene
+    h, w = pixels.shape[:2]
+    scene.render.image_settings.file_format = 'PNG'
+    scene.render.image_settings.color_mode = 'RGBA'
+    scene.render.image_settings.color_depth = '8'
+    scene.render.image_settings.compression = PNG_COMPRESSION
+    img = bpy.data.images.new("NebulaPixels", w, h, alpha=True, float_buffer=True)
+    img.pixels.foreach_set(np.ascontiguousarray(pixels, dtype=np.float32).ravel())
+    img.save_render(filepath, scene=scene)
+    bpy.data.images.remove(img)
+
+
+def tint_pixels(pixels, color):
+    """Multiply the RGB of a linear render by color, keeping alpha."""
+    tinted = pixels.copy()
+    tinted[..., :3] *= np.asarray(color, dtype=np.float32)
+    return tinted
+
+
+def lanczos_weights(n_in, n_out, a=3):
+    """(n_out, n_in) Lanczos-a resampling matrix, pixel centers aligned, rows summing to 1."""
+    centers = (np.arange(n_out) + 0.5) * (n_in / n_out) - 0.5
+    offsets = centers[:, None] - np.arange(n_in)[None, :]
+    weights = np.sinc(offsets) * np.sinc(offsets / a)
+    weights[np.abs(offsets) >= a] = 0.0
+    return (weights / weights.sum(axis=1, keepdims=True)).astype(np.float32)
+
+
+def upscale_pixels(pixels, width, height, a=3):
+    """
+    Lanczos-resample a (height, width, 4) linear render to width x height.
+    Separable, as two matrix products per channel. Renders are premultiplied,
+    so RGB and alpha resample together; ringing is clipped.
+    """
+    h, w = pixels.shape[:2]
+    rows = lanczos_weights(h, height, a)
+    cols = lanczos_weights(w, width, a)
+    out = np.einsum("yh,hwc,xw->yxc", rows, pixels, cols, optimize=True)
+    out[..., 3] = np.clip(out[..., 3], 0.0, 1.0)
+    return np.maximum(out, 0.0, out=out)
+
+
+def configure_eevee_draft(scene, volumetric_end=10.0):
+    """
+    Draft-quality preview: EEVEE raymarched volumetrics instead of Cycles
+    path tracing. Good enough for thumbnails and iteration.
+    volumetric_end is the camera distance past which volumes are skipped.
+    """
+    try:
+        scene.render.engine = 'BLENDER_EEVEE_NEXT'  # Blender 4.2 - 4.x
+    except TypeError:
+        scene.render.engine = 'BLENDER_EEVEE'
+
+    scene.eevee.use_volumetric_shadows = True
+    scene.eevee.volumetric_tile_size = '2'
+    scene.eevee.volumetric_samples = 64
+    scene.eevee.volumetric_start = 0.1
+    scene.eevee.volumetric_end = volumetric_end
+
+
+def create_nebula(density_mode="vdb", noise_mode="builtin"):
+    """Create the nebula volume from a baked VDB (default) or the procedural graph."""
+    if density_mode == "procedural":
+        return create_nebula_volume(noise_mode)
+    # Per-process file so parallel variant renders don't overwrite each other
+    vdb_path = os.path.join(tempfile.gettempdir(), f"nebula_density_{os.getpid()}.vdb")
+    return create_nebula_vdb_volume(vdb_path)
+
+
+def apply_variant(nebula, star_mat, color, base_color=None):
+    """
+    Retint the already-built scene for one emission color.
+    base_color (absorption) defaults to a darkened emission color.
+    """
+    nodes = nebula.data.materials[0].node_tree.nodes
+
+    nodes["EmissionColor"].outputs["Color"].default_value = (*color, 1)
+
+    # Base color (absorption)
+    if base_color is None:
+        base_color = tuple(c * 0.3 for c in color)
+    nodes["Principled Volume"].inputs["Color"].default_value = (*base_color, 1)
+
+    set_star_color(star_mat, color)
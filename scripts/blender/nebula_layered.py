@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Nebula Layered - the layered-region billboard nebula behind
+generate_nebula_v2.py and generate_nebula_v3.py
+One hull volume holding every region, a baked-noise material with per-region
+density/emission masks, embedded stars, and the variant loop (one scene
+recolored per variant, or an approximate white-render-and-tint with tint=post).
+Each generator script only fills in a NebulaPreset.
+
+Import from a Blender script with:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from nebula_layered import NebulaPreset, render_variants
+"""
+import bpy
+import sys
+import os
+import json
+import tempfile
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from nebula_common import (  # noqa: E402
+    add_internal_stars,
+    add_noise_atlas_lookup,
+    add_region_masks,
+    bake_noise_atlas,
+    cleanup,
+    configure_eevee_draft,
+    create_region_hull,
+    is_render_cached,
+    parse_args,
+    parse_variants,
+    read_pixels,
+    render_cache_key,
+    set_region_colors,
+    set_star_color,
+    tint_pixels,
+    upscale_pixels,
+    write_png,
+    write_render_cache,
+    PNG_COMPRESSION,
+)
+
+RESOLUTION = 1024  # Square texture
+# Path-traced at half size and Lanczos-upscaled: a quarter of the rays, and
+# the soft, denoised volume has no detail a 1024 render would add
+RENDER_RESOLUTION = RESOLUTION // 2
+WHITE = (1.0, 1.0, 1.0)  # Emission for the shared render tint=post variants are tinted from
+SAMPLES = 64  # OIDN cleans up the rest
+VOLUME_STEP_RATE = 0.25  # Finer steps are indistinguishable once denoised
+VOLUME_MAX_STEPS = 256
+
+# Everything that differs between the generators:
+#   name           - short tag for temp dirs ("v2", "v3")
+#   version        - bump when the preset's output changes so cached renders are redone
+#   output_dir, topic_colors
+#   regions        - NebulaRegion tuple (see nebula_common.create_region_hull)
+#   noise_layers   - baked (scale, detail, roughness, distortion) layers,
+#                    mixed by combine_noise(*layers) over +-noise_extent
+#   mapping_scale, noise_extent, combine_noise
+#   emission_ramp  - (black, white) ramp positions shaping emission by structure, or None
+#   absorption     - absorption color as a fraction of the emission color
+#   anisotropy
+#   stars          - add_internal_stars() keyword arguments
+#   volumetric_end - EEVEE volume clip distance; must cover the camera distance
+#   setup_camera, setup_lighting - callables adding the camera and lights
+NebulaPreset = namedtuple("NebulaPreset", [
+    "name", "version", "output_dir", "topic_colors", "regions",
+    "noise_layers", "mapping_scale", "noise_extent", "combine_noise",
+    "emission_ramp", "absorption", "anisotropy", "stars", "volumetric_end",
+    "setup_camera", "setup_lighting",
+])
+
+
+def create_nebula_material(preset, name="NebulaMat"):
+    """
+    Create the volumetric nebula material: baked 3D noise for structure,
+    the preset regions' masks for per-region density and emission.
+    Colors are set by recolor_nebula().
+    """
+    mat = bpy.data.materials.new(name)
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    nodes.clear()
+
+    output = nodes.new("ShaderNodeOutputMaterial")
+    output.location = (800, 0)
+
+    volume = nodes.new("ShaderNodeVolumePrincipled")
+    volume.location = (500, 0)
+    links.new(volume.outputs["Volume"], output.inputs["Volume"])
+
+    # Coordinates (hull object sits at the origin: object = world space)
+    tex_coord = nodes.new("ShaderNodeTexCoord")
+    tex_coord.location = (-2400, 0)
+
+    # === STRUCTURE ===
+    # Noise layers baked once per scene; one trilinear texture read per step
+    noise_img = bake_noise_atlas(
+        "NebulaNoise", preset.noise_layers, preset.mapping_scale,
+        preset.noise_extent, preset.combine_noise,
+    )
+    structure = add_noise_atlas_lookup(
+        nodes, links, noise_img, tex_coord.outputs["Object"], preset.noise_extent,
+        location=(-2200, 100),
+    )
+
+    # === REGIONS ===
+    region_density, region_emission = add_region_masks(
+        nodes, links, tex_coord.outputs["Object"], preset.regions, location=(-1400, -900)
+    )
+
+    # === SPHERICAL FALLOFF (soft edges) ===
+    geometry = nodes.new("ShaderNodeNewGeometry")
+    geometry.location = (-600, -600)
+
+    vec_length = nodes.new("ShaderNodeVectorMath")
+    vec_length.location = (-400, -600)
+    vec_length.operation = 'LENGTH'
+    links.new(geometry.outputs["Position"], vec_length.inputs[0])
+
+    # Invert distance (1 at center, 0 at radius 1)
+    subtract = nodes.new("ShaderNodeMath")
+    subtract.location = (-200, -600)
+    subtract.operation = 'SUBTRACT'
+    subtract.inputs[0].default_value = 1.0
+    links.new(vec_length.outputs["Value"], subtract.inputs[1])
+
+    # Power for soft edges, clamped to 0-1
+    falloff = nodes.new("ShaderNodeMath")
+    falloff.location = (0, -600)
+    falloff.operation = 'POWER'
+    falloff.inputs[1].default_value = 1.5
+    falloff.use_clamp = True
+    links.new(subtract.outputs["Value"], falloff.inputs[0])
+
+    # === FINAL DENSITY ===
+    density_mult = nodes.new("ShaderNodeMath")
+    density_mult.location = (200, 0)
+    density_mult.operation = 'MULTIPLY'
+    links.new(structure, density_mult.inputs[0])
+    links.new(falloff.outputs["Value"], density_mult.inputs[1])
+
+    density_scale = nodes.new("ShaderNodeMath")
+    density_scale.location = (350, 0)
+    density_scale.operation = 'MULTIPLY'
+    links.new(density_mult.outputs["Value"], density_scale.inputs[0])
+    links.new(region_density, density_scale.inputs[1])
+    links.new(density_scale.outputs["Value"], volume.inputs["Density"])
+
+    # === EMISSION ===
+    # Region colors and strengths carry the intensity
+    emission = region_emission
+    if preset.emission_ramp is not None:
+        # Color ramp for emission variation
+        ramp = nodes.new("ShaderNodeValToRGB")
+        ramp.location = (200, -200)
+        ramp.color_ramp.elements[0].position = preset.emission_ramp[0]
+        ramp.color_ramp.elements[0].color = (0, 0, 0, 1)
+        ramp.color_ramp.elements[1].position = preset.emission_ramp[1]
+        ramp.color_ramp.elements[1].color = (1, 1, 1, 1)
+        links.new(structure, ramp.inputs["Fac"])
+
+        emission_mult = nodes.new("ShaderNodeVectorMath")
+        emission_mult.location = (350, -200)
+        emission_mult.operation = 'MULTIPLY'
+        links.new(ramp.outputs["Color"], emission_mult.inputs[0])
+        links.new(region_emission, emission_mult.inputs[1])
+        emission = emission_mult.outputs["Vector"]
+
+    links.new(emission, volume.inputs["Emission Color"])
+    volume.inputs["Emission Strength"].default_value = 1.0
+    volume.inputs["Anisotropy"].default_value = preset.anisotropy
+
+    return mat
+
+
+def recolor_nebula(preset, emission_color):
+    """Retint the already-built nebula and stars for another variant."""
+    nodes = bpy.data.materials["NebulaMat"].node_tree.nodes
+    set_region_colors(nodes, preset.regions, emission_color)
+
+    # Absorption (darker version of emission)
+    dark = tuple(c * preset.absorption for c in emission_color)
+    nodes["Principled Volume"].inputs["Color"].default_value = (*dark, 1)
+
+    set_star_color(bpy.data.materials["StarMat"], emission_color)
+
+
+def create_nebula(preset, emission_color):
+    """Create the multi-region nebula as one hull volume, plus embedded stars."""
+    nebula = create_region_hull("Nebula", preset.regions)
+    nebula.data.materials.append(create_nebula_material(preset))
+
+    add_internal_stars(**preset.stars)
+    recolor_nebula(preset, emission_color)
+
+    return nebula
+
+
+def configure_render(preset, resolution, quality="draft"):
+    """
+    EEVEE raymarched volumetrics by default (the billboards are stylized and
+    heavily composited); quality=final path-traces with Cycles.
+    """
+    scene = bpy.context.scene
+
+    if quality == "draft":
+        configure_eevee_draft(scene, volumetric_end=preset.volumetric_end)
+    else:
+        scene.render.engine = 'CYCLES'
+        scene.cycles.device = 'GPU'
+        scene.cycles.samples = SAMPLES
+        scene.cycles.use_adaptive_sampling = True
+        scene.cycles.adaptive_threshold = 0.01  # Empty sky converges almost at once
+        scene.cycles.use_denoising = True
+        scene.cycles.denoiser = 'OPENIMAGEDENOISE'
+        scene.cycles.denoising_input_passes = 'RGB_ALBEDO_NORMAL'
+        scene.cycles.denoising_prefilter = 'ACCURATE'
+
+        # Volume quality
+        scene.cycles.volume_step_rate = VOLUME_STEP_RATE
+        scene.cycles.volume_max_steps = VOLUME_MAX_STEPS
+        scene.cycles.volume_preview_step_rate = VOLUME_STEP_RATE  # Viewport matches the render
+
+    scene.render.resolution_x = resolution
+    scene.render.resolution_y = resolution
+    scene.render.resolution_percentage = 100
+
+    # Keep BVH and compiled shaders alive between variant renders
+    scene.render.use_persistent_data = True
+
+    # Transparent background
+    scene.render.film_transparent = True
+    scene.render.image_settings.file_format = 'PNG'
+    scene.render.image_settings.color_mode = 'RGBA'
+    scene.render.image_settings.compression = PNG_COMPRESSION
+
+
+def build_scene(preset, emission_color, quality="draft"):
+    """Build the nebula, camera and lights once; variants only recolor it."""
+    cleanup()
+    create_nebula(preset, emission_color)
+    preset.setup_camera()
+    preset.setup_lighting()
+    configure_render(preset, RENDER_RESOLUTION, quality)
+
+
+def render_linear(filepath):
+    """
+    Render the current scene to a linear EXR and return its pixels upscaled
+    to RESOLUTION.
+    """
+    scene = bpy.context.scene
+    scene.render.image_settings.file_format = 'OPEN_EXR'
+    scene.render.image_settings.color_depth = '32'
+    scene.render.filepath = filepath
+    bpy.ops.render.render(write_still=True)
+    print(f"RENDERED: {filepath}")
+    return upscale_pixels(read_pixels(filepath), RESOLUTION, RESOLUTION)
+
+
+def render_nebula(output_dir, name, render_dir):
+    """Render the current scene as one variant PNG."""
+    pixels = render_linear(os.path.join(render_dir, f"nebula_{name}.exr"))
+    filepath = os.path.join(output_dir, f"nebula_{name}.png")
+    write_png(pixels, filepath)
+    print(f"RENDERED: {filepath}")
+    return filepath
+
+
+def render_white(preset, render_dir, quality="draft"):
+    """
+    Render the nebula once with white emission and return its linear pixels.
+    Multiplying this by a color only approximates that color's render:
+    scaled_color() clamps the brighter regions' color_scale boost at 1.0,
+    absorption attenuates exponentially in the color, and stars mix toward
+    white, so tinted variants lose core brightness and oversaturate stars.
+    """
+    build_scene(preset, WHITE, quality)
+    return render_linear(os.path.join(render_dir, "nebula_white.exr"))
+
+
+def render_variants(preset):
+    """Script entry point: render (or tint) every requested topic variant."""
+    args = parse_args()
+    output_dir = args.get("output", preset.output_dir)
+    # tint=render (default) renders every variant exactly, recoloring one
+    # scene instead of rebuilding it; tint=post tints one white render, much
+    # faster but approximate (see render_white)
+    tint = args.get("tint", "render")
+    quality = args.get("quality", "draft")  # "final" = Cycles
+    os.makedirs(output_dir, exist_ok=True)
+
+    try:
+        rendered_files = []
+        render_dir = tempfile.mkdtemp(prefix=f"nebula_{preset.name}_")
+        white = None
+        built = False
+        pending = []  # (name, cache key, tinted-pixels future) awaiting their PNG
+
+        # numpy releases the GIL, so later variants tint while earlier ones
+        # encode; bpy image writes stay on this thread
+        with ThreadPoolExecutor(max_workers=2) as tinting:
+            for name, color in parse_variants(args, preset.topic_colors):
+                key = render_cache_key(
+                    name, color, RESOLUTION, RENDER_RESOLUTION, SAMPLES,
+                    VOLUME_STEP_RATE, VOLUME_MAX_STEPS, preset.version, tint, quality,
+                )
+                # Unchanged inputs: keep the existing PNG, skip the scene build too
+                if is_render_cached(output_dir, name, key):
+                    print(f"Cached {name} variant")
+                    rendered_files.append(f"nebula_{name}.png")
+                    continue
+
+                if tint == "render":
+                    print(f"Rendering {name} variant...")
+                    if built:
+                        recolor_nebula(preset, color)
+                    else:
+                        build_scene(preset, color, quality)
+                        built = True
+                    render_nebula(output_dir, name, render_dir)
+                    write_render_cache(output_dir, name, key)
+                    rendered_files.append(f"nebula_{name}.png")
+                    continue
+
+                # Only the first uncached variant pays for a render
+                if white is None:
+                    print("Rendering white nebula...")
+                    white = render_white(preset, render_dir, quality)
+
+                print(f"Tinting {name} variant...")
+                pending.append((name, key, tinting.submit(tint_pixels, white, color)))
+                rendered_files.append(f"nebula_{name}.png")
+
+            for name, key, tinted in pending:
+                filepath = os.path.join(output_dir, f"nebula_{name}.png")
+                write_png(tinted.result(), filepath)
+                print(f"RENDERED: {filepath}")
+                write_render_cache(output_dir, name, key)
+
+        info = {
+            "status": "success",
+            "output_dir": output_dir,
+            "resolution": RESOLUTION,
+            "files": rendered_files
+        }
+        print(f"ASSET_INFO: {json.dumps(info)}")
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        print(json.dumps({"status": "error", "message": str(e)}))
+        sys.exit(1)
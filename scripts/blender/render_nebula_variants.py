@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Parallel Nebula Variant Driver
+Fans the topic-color variants of a nebula script out across headless Blender
+processes and merges their ASSET_INFO lines into one summary.
+
+Run: python3 render_nebula_variants.py output=/path/to/output [workers=1] [gpus=0,1] [blender=blender] [script=generate_nebula_final.py]
+     density=, noise=, quality= and tint= are forwarded to every Blender run.
+     generate_nebula_v2.py / v3.py render each variant exactly by default
+     (tint=render); their tint=post renders every variant approximately
+     from one white image and gains nothing from fanning out.
+     workers defaults to one per GPU in gpus=, else 1. With a single GPU,
+     workers=2 overlaps one run's scene build with the other's render
+     without thrashing device memory.
+
+This is plain Python (no bpy); each worker is a separate `blender -b` process
+rendering exactly one variant via the script's name=/color= arguments.
+"""
+import ast
+import json
+import os
+import queue
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SCRIPT = os.path.join(SCRIPT_DIR, "generate_nebula_final.py")
+OUTPUT_DIR = "/tmp/nebula_final"
+FORWARDED_ARGS = ("density", "noise", "quality", "tint")  # Passed through to each Blender run
+
+
+def parse_args():
+    argv = sys.argv[1:]
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]
+    args = {}
+    for arg in argv:
+        if "=" in arg:
+            key, val = arg.split("=", 1)
+            args[key.lstrip("-")] = val
+    return args
+
+
+def read_topic_colors(script):
+    """Read TOPIC_COLORS from a Blender script without importing bpy."""
+    with open(script) as f:
+        tree = ast.parse(f.read(), filename=script)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "TOPIC_COLORS" for t in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    raise ValueError(f"No TOPIC_COLORS in {script}")
+
+
+def render_on_free_gpu(free_gpus, *args):
+    """Run render_variant on a GPU id taken from free_gpus, returning it when done."""
+    gpu = free_gpus.get()
+    try:
+        return render_variant(*args, gpu=gpu)
+    finally:
+        free_gpus.put(gpu)
+
+
+def render_variant(blender, script, output_dir, name, color, extra=(), gpu=None):
+    """Run one headless Blender render and return its parsed ASSET_INFO."""
+    cmd = [
+        blender, "-b", "--python", script, "--python-exit-code", "1", "--",
+        f"output={output_dir}",
+        f"name={name}",
+        f"color={','.join(str(c) for c in color)}",
+        *extra,
+    ]
+    env = dict(os.environ)
+    if gpu is not None:
+        # One device per worker so Cycles GPU contexts don't contend
+        env["CUDA_VISIBLE_DEVICES"] = gpu
+
+    result = subprocess.run(cmd, env=env, capture_output=True, text=True)
+    for line in result.stdout.splitlines():
+        if line.startswith("ASSET_INFO: "):
+            return json.loads(line[len("ASSET_INFO: "):])
+
+    sys.stderr.write(result.stdout[-2000:])
+    sys.stderr.write(result.stderr[-2000:])
+    raise RuntimeError(f"{name}: blender exited {result.returncode} without ASSET_INFO")
+
+
+def main():
+    args = parse_args()
+    output_dir = os.path.abspath(args.get("output", OUTPUT_DIR))
+    script = os.path.abspath(args.get("script", DEFAULT_SCRIPT))
+    blender = args.get("blender", "blender")
+    gpus = args["gpus"].split(",") if "gpus" in args else []
+    workers = int(args.get("workers", len(gpus) or 1))
+    extra = [f"{k}={args[k]}" for k in FORWARDED_ARGS if k in args]
+    os.makedirs(output_dir, exist_ok=True)
+
+    try:
+        variants = list(read_topic_colors(script).items())
+
+        # Threads are enough here: each one just waits on its Blender subprocess.
+        # Each task takes whichever device is free, so a run never starts on a
+        # busy GPU while another sits idle; with workers > len(gpus) the extra
+        # slots share devices round-robin. Without gpus= every slot holds None.
+        free_gpus = queue.Queue()
+        for i in range(workers):
+            free_gpus.put(gpus[i % len(gpus)] if gpus else None)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(render_on_free_gpu, free_gpus, blender, script, output_dir, name, color, extra)
+                for name, color in variants
+            ]
+            results = [f.result() for f in futures]
+
+        info = {
+            "status": "success",
+            "output_dir": output_dir,
+            "resolution": results[0].get("resolution"),
+            "files": [f for r in results for f in r["files"]],
+        }
+        print(f"ASSET_INFO: {json.dumps(info)}")
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        print(json.dumps({"status": "error", "message": str(e)}))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import bpy
 import bmesh
 import math
+from functools import lru_cache
 from mathutils import Matrix, Vector
 
 # --- CONFIGURATION ---
@@ -52,14 +53,17 @@ def get_collection():
 
 def activate(obj):
     """Select and activate a single object."""
-    bpy.ops.object.select_all(action='DESELECT')
+    for other in bpy.context.selected_objects:
+        other.select_set(False)
     obj.select_set(True)
     bpy.context.view_layer.objects.active = obj
 
 # --- HELPERS ---
+@lru_cache(maxsize=None)
 def hex_to_rgba(hex_str):
-    h = hex_str.lstrip('#')
-    return tuple(int(h[i:i+2], 16)/255 for i in (0,2,4)) + (1.0,)
+    # One int parse, channels split off with shifts
+    v = int(hex_str.lstrip('#'), 16)
+    return ((v >> 16 & 0xFF) / 255, (v >> 8 & 0xFF) / 255, (v & 0xFF) / 255, 1.0)
 
 def create_material(name, color_hex, roughness=0.5, metallic=0.0):
     mat = bpy.data.materials.new(PREFIX + name)
@@ -70,17 +74,14 @@ def create_material(name, color_hex, roughness=0.5, metallic=0.0):
     bsdf.inputs["Metallic"].default_value = metallic
     return mat
 
-def create_box(name, size, location, material):
-    """Create a box mesh with bevel for soft edges."""
+def create_box(name, size, location, material, bevel=True):
+    """Create a box mesh, bevelled for soft edges unless bevel=False."""
     bm = bmesh.new()
     bmesh.ops.create_cube(bm, size=1.0)
 
     # Scale to desired size
     bmesh.ops.scale(bm, vec=size, verts=bm.verts)
 
-    # Add bevel for realistic edges
-    bmesh.ops.bevel(bm, geom=bm.edges, offset=0.01, segments=2, affect='EDGES')
-
     mesh = bpy.data.meshes.new(PREFIX + name)
     bm.to_mesh(mesh)
     bm.free()
@@ -89,6 +90,13 @@ def create_box(name, size, location, material):
     obj.location = location
     obj.data.materials.append(material)
 
+    # Bevel for realistic edges as a live modifier; the mesh stays an 8-vert box
+    # and export (export_apply=True) bakes it once
+    if bevel:
+        mod = obj.modifiers.new("Bevel", 'BEVEL')
+        mod.width = 0.01
+        mod.segments = 1
+
     return obj
 
 # --- GENERATION ---
@@ -118,7 +126,8 @@ def generate():
         "TopTrim",
         (TABLE_TOP_WIDTH + 0.02, TABLE_TOP_DEPTH + 0.02, trim_height),
         (0, 0, TABLE_HEIGHT + trim_height/2),
-        accent_mat
+        accent_mat,
+        bevel=False  # Only 0.02 tall; a 0.01 bevel would round it away
     )
     objects.append(trim)
 
@@ -148,7 +157,8 @@ def generate():
         "Shelf",
         (TABLE_TOP_WIDTH - shelf_inset*2, TABLE_TOP_DEPTH - shelf_inset*2, SHELF_THICKNESS),
         (0, 0, shelf_z),
-        wood_mat
+        wood_mat,
+        bevel=False  # Sits under the top, edges out of view
     )
     objects.append(shelf)
 
@@ -156,8 +166,10 @@ def generate():
     for obj in objects:
         col.objects.link(obj)
 
-    # Select all generated objects for export
-    bpy.ops.object.select_all(action='DESELECT')
+    # Select all generated objects for export; only the currently selected
+    # objects need clearing, without walking the scene through the operator
+    for obj in bpy.context.selected_objects:
+        obj.select_set(False)
     for obj in objects:
         obj.select_set(True)
     bpy.context.view_layer.objects.active = objects[0]